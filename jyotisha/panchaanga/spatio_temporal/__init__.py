@@ -5,6 +5,7 @@ import logging
 import os
 import sys
 
+import numpy
 import swisseph as swe
 
 from jyotisha import custom_transliteration
@@ -29,6 +30,183 @@ CALC_RISE = 512 + 256 + 128 + 1
 CALC_SET = 512 + 256 + 128 + 2
 
 
+class RiseSetSeries(object):
+  """All risings and settings of a body at a place within [jd_start, jd_end), in sorted numpy arrays.
+  
+  Each rise_trans solve is seeded from the previous event plus one mean (apparent) day of the body, less a safety margin.
+  """
+  # Mean interval between successive risings (or settings).
+  BODY_TO_MEAN_DAY = {"sun": 1.0, "moon": 1.0351}
+  # Successive risings of the Moon, for example, are between about 24.2 and 25.5 hours apart at non-polar latitudes.
+  SEED_MARGIN_DAYS = 0.25
+
+  def __init__(self, jd_start, jd_end, rise_jds, set_jds):
+    self.jd_start = jd_start
+    self.jd_end = jd_end
+    self.rise_jds = rise_jds
+    self.set_jds = set_jds
+
+  @classmethod
+  def compute(cls, city, jd_start, jd_end, body):
+    """
+    
+    :return: A RiseSetSeries object, or None if some event could not be computed (eg. at polar latitudes).
+    """
+    rise_jds = cls._compute_events(city=city, jd_start=jd_start, jd_end=jd_end, body=body, rsmi=CALC_RISE)
+    set_jds = cls._compute_events(city=city, jd_start=jd_start, jd_end=jd_end, body=body, rsmi=CALC_SET)
+    if rise_jds is None or set_jds is None:
+      return None
+    return RiseSetSeries(jd_start=jd_start, jd_end=jd_end, rise_jds=rise_jds, set_jds=set_jds)
+
+  @classmethod
+  def _compute_events(cls, city, jd_start, jd_end, body, rsmi):
+    from jyotisha.panchaanga.temporal.body import Graha
+    body_id = Graha.singleton(body)._get_swisseph_id()
+    seed_offset = cls.BODY_TO_MEAN_DAY.get(body, 1.0) - cls.SEED_MARGIN_DAYS
+    event_jds = []
+    jd = jd_start
+    while jd < jd_end:
+      event_jd = swe.rise_trans(jd_start=jd, body=body_id, lon=city.longitude, lat=city.latitude, rsmi=rsmi)[1][0]
+      if event_jd < jd:
+        # Circumpolar body or some such failure - rise_trans returns 0.
+        return None
+      if event_jd >= jd_end:
+        break
+      event_jds.append(event_jd)
+      jd = event_jd + seed_offset
+    return numpy.array(event_jds)
+
+  def extended(self, city, jd_start, jd_end, body):
+    """Returns a series covering the union of [jd_start, jd_end) and self's range - computing only the extra parts. If the two are disjoint, only [jd_start, jd_end) is covered."""
+    if jd_end < self.jd_start or jd_start > self.jd_end:
+      return RiseSetSeries.compute(city=city, jd_start=jd_start, jd_end=jd_end, body=body)
+    parts = []
+    if jd_start < self.jd_start:
+      parts.append(RiseSetSeries.compute(city=city, jd_start=jd_start, jd_end=self.jd_start, body=body))
+    parts.append(self)
+    if jd_end > self.jd_end:
+      parts.append(RiseSetSeries.compute(city=city, jd_start=self.jd_end, jd_end=jd_end, body=body))
+    if any(part is None for part in parts):
+      return None
+    return RiseSetSeries(jd_start=parts[0].jd_start, jd_end=parts[-1].jd_end, rise_jds=numpy.concatenate([part.rise_jds for part in parts]), set_jds=numpy.concatenate([part.set_jds for part in parts]))
+
+  def covers(self, jd_start, jd_end):
+    return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+  def trimmed(self, jd_start):
+    """Returns a series without the events before jd_start."""
+    if jd_start <= self.jd_start:
+      return self
+    jd_start = min(jd_start, self.jd_end)
+    return RiseSetSeries(jd_start=jd_start, jd_end=self.jd_end, rise_jds=self.rise_jds[numpy.searchsorted(self.rise_jds, jd_start, side="left"):], set_jds=self.set_jds[numpy.searchsorted(self.set_jds, jd_start, side="left"):])
+
+  def get_next_event(self, jd, rsmi):
+    """The first event at or after jd - or None if that is not known to lie within this series."""
+    event_jds = self.rise_jds if rsmi == CALC_RISE else self.set_jds
+    if jd < self.jd_start:
+      return None
+    index = numpy.searchsorted(event_jds, jd, side="left")
+    if index >= len(event_jds):
+      return None
+    return float(event_jds[index])
+
+  def get_events_in_period(self, jd_start, jd_end, rsmi):
+    event_jds = self.rise_jds if rsmi == CALC_RISE else self.set_jds
+    return event_jds[numpy.searchsorted(event_jds, jd_start, side="left"):numpy.searchsorted(event_jds, jd_end, side="left")]
+
+
+class LagnaSeries(object):
+  """Ends of all lagnas at a place within [jd_start, jd_end), in sorted numpy arrays: lagnas[i] ends at end_jds[i] (ie. the sidereal longitude of the eastern horizon then crosses 30 * lagnas[i] degrees).
+
+  The ascendant is sampled on a dense grid with a vectorized closed form (City.get_approximate_zodiac_longitudes_eastern_horizon), and the crossings are located and solved for (all at once) on that closed form. Only then is each crossing refined with City.get_lagna_float, by Newton steps - which typically takes 3 evaluations, rather than the 7 or so which brentq needs even within a tight bracket.
+  """
+  GRID_STEP_DAYS = 1 / 96
+  APPROXIMATE_NEWTON_ITERATIONS = 3
+  MAX_NEWTON_ITERATIONS = 6
+  # Comparable to brentq's default tolerance at present day julian days.
+  TOLERANCE_DAYS = 1e-9
+
+  def __init__(self, jd_start, jd_end, end_jds, lagnas, ayanaamsha_id):
+    self.jd_start = jd_start
+    self.jd_end = jd_end
+    self.end_jds = end_jds
+    self.lagnas = lagnas
+    self.ayanaamsha_id = ayanaamsha_id
+
+  @classmethod
+  def _get_approximate_longitudes(cls, city, jds, ayanaamsha_id):
+    return (city.get_approximate_zodiac_longitudes_eastern_horizon(jds=jds) - Ayanamsha.singleton(ayanaamsha_id=ayanaamsha_id).get_offsets(jds=jds)) % 360
+
+  @classmethod
+  def compute(cls, city, jd_start, jd_end, ayanaamsha_id):
+    from scipy.optimize import brentq
+    # The grid extends a step beyond the period, so that crossings close to its ends are not lost to approximation errors.
+    grid_jds = numpy.arange(jd_start - cls.GRID_STEP_DAYS, jd_end + 2 * cls.GRID_STEP_DAYS, cls.GRID_STEP_DAYS)
+    longitudes = cls._get_approximate_longitudes(city=city, jds=grid_jds, ayanaamsha_id=ayanaamsha_id)
+    # The ascendant only moves forward (away from polar latitudes), by much less than 360 degrees in a grid step.
+    unwrapped_longitudes = longitudes[0] + numpy.concatenate([[0], numpy.cumsum(numpy.diff(longitudes) % 360)])
+    boundaries = numpy.arange(numpy.floor(unwrapped_longitudes[0] / 30) + 1, numpy.floor(unwrapped_longitudes[-1] / 30) + 1)
+    grid_indices = numpy.clip(numpy.searchsorted(unwrapped_longitudes, boundaries * 30) - 1, 0, len(grid_jds) - 2)
+
+    # Solve on the closed form first.
+    estimated_jds = numpy.interp(boundaries * 30, unwrapped_longitudes, grid_jds)
+    delta = cls.GRID_STEP_DAYS / 100
+    rates = ((cls._get_approximate_longitudes(city=city, jds=estimated_jds + delta, ayanaamsha_id=ayanaamsha_id) - cls._get_approximate_longitudes(city=city, jds=estimated_jds - delta, ayanaamsha_id=ayanaamsha_id)) % 360) / (2 * delta)
+    for _ in range(cls.APPROXIMATE_NEWTON_ITERATIONS):
+      residuals = (cls._get_approximate_longitudes(city=city, jds=estimated_jds, ayanaamsha_id=ayanaamsha_id) - boundaries * 30 + 180) % 360 - 180
+      estimated_jds = estimated_jds - residuals / rates
+
+    end_jds = []
+    lagnas = []
+    for (boundary, end_jd, rate, grid_index) in zip(boundaries, estimated_jds, rates, grid_indices):
+      lagna = int(boundary - 1) % 12 + 1
+      args = (-lagna, ayanaamsha_id)
+      for _ in range(cls.MAX_NEWTON_ITERATIONS):
+        # get_lagna_float with offset -lagna returns the (signed) distance in rAshis from the end of lagna.
+        step = city.get_lagna_float(end_jd, *args) * 30 / rate
+        end_jd = end_jd - step
+        if abs(step) < cls.TOLERANCE_DAYS:
+          break
+      else:
+        end_jd = brentq(city.get_lagna_float, grid_jds[grid_index] - cls.GRID_STEP_DAYS, grid_jds[grid_index + 1] + cls.GRID_STEP_DAYS, args=args)
+      if jd_start <= end_jd < jd_end:
+        end_jds.append(float(end_jd))
+        lagnas.append(lagna)
+    return LagnaSeries(jd_start=jd_start, jd_end=jd_end, end_jds=numpy.array(end_jds), lagnas=numpy.array(lagnas, dtype=int), ayanaamsha_id=ayanaamsha_id)
+
+  def extended(self, city, jd_start, jd_end):
+    """Returns a series covering the union of [jd_start, jd_end) and self's range - computing only the extra parts. If the two are disjoint, only [jd_start, jd_end) is covered."""
+    if jd_end < self.jd_start or jd_start > self.jd_end:
+      return LagnaSeries.compute(city=city, jd_start=jd_start, jd_end=jd_end, ayanaamsha_id=self.ayanaamsha_id)
+    parts = []
+    if jd_start < self.jd_start:
+      parts.append(LagnaSeries.compute(city=city, jd_start=jd_start, jd_end=self.jd_start, ayanaamsha_id=self.ayanaamsha_id))
+    parts.append(self)
+    if jd_end > self.jd_end:
+      parts.append(LagnaSeries.compute(city=city, jd_start=self.jd_end, jd_end=jd_end, ayanaamsha_id=self.ayanaamsha_id))
+    return LagnaSeries(jd_start=parts[0].jd_start, jd_end=parts[-1].jd_end, end_jds=numpy.concatenate([part.end_jds for part in parts]), lagnas=numpy.concatenate([part.lagnas for part in parts]), ayanaamsha_id=self.ayanaamsha_id)
+
+  def covers(self, jd_start, jd_end):
+    return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+  def trimmed(self, jd_start):
+    """Returns a series without the lagna ends before jd_start."""
+    if jd_start <= self.jd_start:
+      return self
+    jd_start = min(jd_start, self.jd_end)
+    index = numpy.searchsorted(self.end_jds, jd_start, side="left")
+    return LagnaSeries(jd_start=jd_start, jd_end=self.jd_end, end_jds=self.end_jds[index:], lagnas=self.lagnas[index:], ayanaamsha_id=self.ayanaamsha_id)
+
+  def get_lagna_ends_in_period(self, jd_start, jd_end):
+    """
+
+    :return: (lagna, end_jd) tuples for the lagnas ending within (jd_start, jd_end).
+    """
+    start_index = numpy.searchsorted(self.end_jds, jd_start, side="right")
+    end_index = numpy.searchsorted(self.end_jds, jd_end, side="left")
+    return [(int(lagna), float(end_jd)) for (lagna, end_jd) in zip(self.lagnas[start_index:end_index], self.end_jds[start_index:end_index])]
+
+
 class City(JsonObject):
   """This class enables the construction of a city object
     """
@@ -87,23 +265,48 @@ class City(JsonObject):
   def __repr__(self):
     return self.name
 
-  def get_rising_time(self, julian_day_start, body):
+  def _get_cached_rise_set_series(self, body):
+    # Protected attributes are not serialized. Also, the constructor is not called for deserialized objects.
+    body_to_rise_set_series = getattr(self, "_body_to_rise_set_series", None)
+    if body_to_rise_set_series is None:
+      body_to_rise_set_series = {}
+      self._body_to_rise_set_series = body_to_rise_set_series
+    return body_to_rise_set_series.get(body, None)
+
+  def get_rise_set_series(self, jd_start, jd_end, body):
+    """Risings and settings of body within [jd_start, jd_end), computed in one seeded pass and cached on this object. get_rising_time, get_setting_time and get_sunsets_in_period read from the cached series where it covers their range.
+    
+    :return: (rise_jds, set_jds) tuple of numpy arrays.
+    """
+    series = self._get_cached_rise_set_series(body=body)
+    if series is None:
+      series = RiseSetSeries.compute(city=self, jd_start=jd_start, jd_end=jd_end, body=body)
+    elif not series.covers(jd_start=jd_start, jd_end=jd_end):
+      series = series.extended(city=self, jd_start=jd_start, jd_end=jd_end, body=body)
+    if series is None:
+      raise ValueError("Could not compute risings and settings of %s at %s between %f and %f" % (body, self.name, jd_start, jd_end))
+    self._body_to_rise_set_series[body] = series
+    return (series.get_events_in_period(jd_start=jd_start, jd_end=jd_end, rsmi=CALC_RISE), series.get_events_in_period(jd_start=jd_start, jd_end=jd_end, rsmi=CALC_SET))
+
+  def _get_rise_or_set_time(self, julian_day_start, body, rsmi):
+    series = self._get_cached_rise_set_series(body=body)
+    if series is not None:
+      event_jd = series.get_next_event(jd=julian_day_start, rsmi=rsmi)
+      if event_jd is not None:
+        return event_jd
     from jyotisha.panchaanga.temporal.body import Graha
     graha = Graha.singleton(body)
     # rise_trans expects UT time
     return swe.rise_trans(
       jd_start=julian_day_start, body=graha._get_swisseph_id(),
       lon=self.longitude, lat=self.latitude,
-      rsmi=CALC_RISE)[1][0]
+      rsmi=rsmi)[1][0]
+
+  def get_rising_time(self, julian_day_start, body):
+    return self._get_rise_or_set_time(julian_day_start=julian_day_start, body=body, rsmi=CALC_RISE)
 
   def get_setting_time(self, julian_day_start, body):
-    from jyotisha.panchaanga.temporal.body import Graha
-    graha = Graha.singleton(body)
-    # rise_trans expects UT time
-    return swe.rise_trans(
-      jd_start=julian_day_start, body=graha._get_swisseph_id(),
-      lon=self.longitude, lat=self.latitude,
-      rsmi=CALC_SET)[1][0]
+    return self._get_rise_or_set_time(julian_day_start=julian_day_start, body=body, rsmi=CALC_SET)
 
   def get_solar_eclipse_time(self, jd_start):
     return swe.sol_eclipse_when_loc(julday=jd_start, lon=self.longitude, lat=self.latitude)
@@ -119,6 +322,48 @@ class City(JsonObject):
     """
     return swe.houses_ex(jd, self.latitude, self.longitude)[1][0]
 
+  def get_approximate_zodiac_longitudes_eastern_horizon(self, jds):
+    """Vectorized, approximate version of get_zodiac_longitude_eastern_horizon - from the mean sidereal time and the mean obliquity of the ecliptic (ignoring nutation). Good to about 0.02 degrees upto latitude 60.
+
+    :param jds: Array of julian days (UT).
+    :return: numpy array of tropical longitudes.
+    """
+    days = numpy.asarray(jds, dtype=float) - 2451545.0
+    centuries = days / 36525
+    # Meeus, Astronomical Algorithms, eqs. 12.4 and 22.2.
+    ramc = numpy.radians((280.46061837 + 360.98564736629 * days + 0.000387933 * centuries ** 2 - centuries ** 3 / 38710000 + self.longitude) % 360)
+    obliquity = numpy.radians(23.4392911 - 0.0130042 * centuries)
+    ascendants = numpy.arctan2(numpy.cos(ramc), -(numpy.sin(ramc) * numpy.cos(obliquity) + numpy.tan(numpy.radians(self.latitude)) * numpy.sin(obliquity)))
+    return numpy.degrees(ascendants) % 360
+
+  def get_lagna_series(self, jd_start, jd_end, ayanaamsha_id=Ayanamsha.CHITRA_AT_180):
+    """Ends of lagnas within [jd_start, jd_end), computed in one vectorized pass and cached on this object.
+
+    :return: A LagnaSeries object (possibly covering a larger period).
+    """
+    # Protected attributes are not serialized. Also, the constructor is not called for deserialized objects.
+    ayanaamsha_id_to_lagna_series = getattr(self, "_ayanaamsha_id_to_lagna_series", None)
+    if ayanaamsha_id_to_lagna_series is None:
+      ayanaamsha_id_to_lagna_series = {}
+      self._ayanaamsha_id_to_lagna_series = ayanaamsha_id_to_lagna_series
+    series = ayanaamsha_id_to_lagna_series.get(ayanaamsha_id, None)
+    if series is None:
+      series = LagnaSeries.compute(city=self, jd_start=jd_start, jd_end=jd_end, ayanaamsha_id=ayanaamsha_id)
+    elif not series.covers(jd_start=jd_start, jd_end=jd_end):
+      series = series.extended(city=self, jd_start=jd_start, jd_end=jd_end)
+    ayanaamsha_id_to_lagna_series[ayanaamsha_id] = series
+    return series
+
+  def trim_cached_series(self, jd_start):
+    """Drops cached events (see get_rise_set_series and get_lagna_series) before jd_start - so that memory stays bounded as computation moves on over long periods."""
+    for cache_name in ["_body_to_rise_set_series", "_ayanaamsha_id_to_lagna_series"]:
+      key_to_series = getattr(self, cache_name, None)
+      if key_to_series is None:
+        continue
+      for (key, series) in key_to_series.items():
+        if series is not None:
+          key_to_series[key] = series.trimmed(jd_start=jd_start)
+
   def get_lagna_float(self, jd, offset=0, ayanaamsha_id=Ayanamsha.CHITRA_AT_180, debug=False):
     """Returns the rising rAshi at a given location.
 
@@ -156,6 +401,10 @@ class City(JsonObject):
   def get_sunsets_in_period(self, jd_start, jd_end):
     if jd_start > jd_end:
       raise ValueError((jd_start, jd_end))
+    from jyotisha.panchaanga.temporal.body import Graha
+    series = self._get_cached_rise_set_series(body=Graha.SUN)
+    if series is not None and series.covers(jd_start=jd_start, jd_end=jd_end):
+      return series.get_events_in_period(jd_start=jd_start, jd_end=jd_end, rsmi=CALC_SET).tolist()
     jd = jd_start
     sunset_jds = []
     while jd < jd_end:
@@ -12,6 +12,7 @@ from jyotisha.panchaanga.temporal.body import Graha
 from jyotisha.panchaanga.temporal.zodiac import AngaSpanFinder, Ayanamsha
 from sanskrit_data.schema import common
 from jyotisha.panchaanga.temporal.zodiac.angas import AngaType
+from jyotisha.util import default_if_none
 
 common.update_json_class_index(sys.modules[__name__])
 
@@ -122,6 +123,32 @@ def get_panchaanga_for_year(city, year, year_type, computation_system, allow_pre
     return get_panchaanga_for_shaka_year(city=city, year=year, computation_system=computation_system, allow_precomputed=allow_precomputed)
 
 
+class MultiYearPanchaanga(object):
+  """Panchaanga-s for consecutive civil years (as for the historical summaries in generation_project.summary), whose days are computed as one continuous series (see periodical.DailyPanchaangaSeries): each day is computed once - even if it falls in the paddings of neighbouring years - and seeded from the preceding day (so that years do not start cold).
+
+  Per-year panchaanga-s are views sharing these days. Only days needed for the latest year are retained - so years are to be got in increasing order.
+  """
+
+  def __init__(self, city, start_year, end_year, computation_system: ComputationSystem = None):
+    self.city = city
+    self.start_year = start_year
+    self.end_year = end_year
+    self.computation_system = default_if_none(computation_system, ComputationSystem.DEFAULT)
+    self.daily_panchaanga_series = periodical.DailyPanchaangaSeries(city=city, computation_system=self.computation_system)
+
+  def get_panchaanga_for_civil_year(self, year):
+    if year < self.start_year or year > self.end_year:
+      raise ValueError("%d is not within %d-%d" % (year, self.start_year, self.end_year))
+    panchaanga = self.daily_panchaanga_series.get_panchaanga(start_date=Date(year=year, month=1, day=1), end_date=Date(year=year, month=12, day=31), year_type=era.ERA_GREGORIAN)
+    panchaanga.year = year
+    return panchaanga
+
+  def get_civil_year_panchaangas(self):
+    """A generator of panchaanga-s for all years, in order."""
+    for year in range(self.start_year, self.end_year + 1):
+      yield self.get_panchaanga_for_civil_year(year=year)
+
+
 def get_panchaanga_for_given_dates(city, start_date, end_date, precomputed_json_dir="~/Documents/jyotisha",
                                   computation_system: ComputationSystem = None, allow_precomputed=True):
   fname = os.path.expanduser('%s/%s__%s-%s__%s.json' % (precomputed_json_dir, city.name, start_date, end_date, computation_system))
@@ -1,14 +1,14 @@
 #!/usr/bin/python3
 #  -*- coding: utf-8 -*-
+import bisect
 import logging
 import sys
-from math import floor, modf
 
 from jyotisha.panchaanga.temporal.festival.rules import pancha_paxi
 from indic_transliteration import sanscript
 
 import methodtools
-from scipy.optimize import brentq
+import numpy
 from timebudget import timebudget
 
 from jyotisha.panchaanga.spatio_temporal import City
@@ -16,7 +16,7 @@ from jyotisha.panchaanga.temporal import time, ComputationSystem, set_constants,
 from jyotisha.panchaanga.temporal import zodiac
 from jyotisha.panchaanga.temporal.body import Graha
 from jyotisha.panchaanga.temporal.festival.rules import RulesRepo
-from jyotisha.panchaanga.temporal.interval import DayLengthBasedPeriods, Interval, get_interval
+from jyotisha.panchaanga.temporal.interval import DayLengthBasedPeriods, DayBoundaries, Interval, get_interval
 from jyotisha.panchaanga.temporal.month import LunarMonthAssigner
 from jyotisha.panchaanga.temporal.names import translate_or_transliterate
 from jyotisha.panchaanga.temporal.time import Timezone, Date, BasicDate, Hour
@@ -35,7 +35,42 @@ set_constants()
 
 
 
+class AngaSpanIndex(object):
+  """Parallel lists of starts and ends of a sorted, contiguous list of anga spans - for lookups by bisection; and a map from anga index to (the first) span with that anga.
+  
+  Open ends (None) are replaced by -inf/ +inf sentinels.
+  """
+
+  def __init__(self, spans):
+    self.spans = spans
+    self.num_spans = len(spans)
+    self.jd_starts = [float("-inf") if span.jd_start is None else span.jd_start for span in spans]
+    self.jd_ends = [float("inf") if span.jd_end is None else span.jd_end for span in spans]
+    self.anga_index_to_span = {}
+    for span in spans:
+      self.anga_index_to_span.setdefault(span.anga.index, span)
+
+  def is_stale(self, spans):
+    return spans is not self.spans or len(spans) != self.num_spans
+
+  def get_spans_in_interval(self, jd_start, jd_end):
+    # Spans overlapping [jd_start, jd_end] are those ending at or after jd_start and starting at or before jd_end.
+    return self.spans[bisect.bisect_left(self.jd_ends, jd_start):bisect.bisect_right(self.jd_starts, jd_end)]
+
+  def get_span_at(self, jd):
+    position = bisect.bisect_left(self.jd_ends, jd)
+    if position < self.num_spans and self.jd_starts[position] <= jd:
+      return self.spans[position]
+    return None
+
+  def find_span(self, anga_index):
+    return self.anga_index_to_span.get(anga_index, None)
+
+
 class DayAngas(common.JsonObject):
+  # Anga types whose spans are computed for every day.
+  ANGA_TYPES = [AngaType.TITHI, AngaType.NAKSHATRA, AngaType.YOGA, AngaType.KARANA, AngaType.RASHI, AngaType.SIDEREAL_MONTH, AngaType.SOLAR_NAKSH]
+
   def __init__(self):
     super().__init__()
     self.tithis_with_ends = None
@@ -58,7 +93,7 @@ class DayAngas(common.JsonObject):
     elif anga_type == AngaType.YOGA:
       anga_spans = self.yogas_with_ends
     elif anga_type == AngaType.RASHI:
-      anga_spans = self.rashis_with_ends
+      anga_spans = self.raashis_with_ends
     elif anga_type == AngaType.KARANA:
       anga_spans = self.karanas_with_ends
     elif anga_type == AngaType.SOLAR_NAKSH:
@@ -67,11 +102,42 @@ class DayAngas(common.JsonObject):
       anga_spans = self.solar_raashis_with_ends
     return anga_spans
 
+  def set_angas_with_ends(self, anga_type, anga_spans):
+    if anga_type == AngaType.TITHI:
+      self.tithis_with_ends = anga_spans
+      self.tithi_at_sunrise = anga_spans[0].anga
+    elif anga_type == AngaType.NAKSHATRA:
+      self.nakshatras_with_ends = anga_spans
+      self.nakshatra_at_sunrise = anga_spans[0].anga
+    elif anga_type == AngaType.YOGA:
+      self.yogas_with_ends = anga_spans
+      self.yoga_at_sunrise = anga_spans[0].anga
+    elif anga_type == AngaType.KARANA:
+      self.karanas_with_ends = anga_spans
+    elif anga_type == AngaType.RASHI:
+      self.raashis_with_ends = anga_spans
+    elif anga_type == AngaType.SIDEREAL_MONTH:
+      self.solar_raashis_with_ends = anga_spans
+    elif anga_type == AngaType.SOLAR_NAKSH:
+      self.solar_nakshatras_with_ends = anga_spans
+    else:
+      raise ValueError("Unsupported anga type %s" % anga_type)
+
+  def _get_span_index(self, anga_type):
+    # Not set in case of deserialized objects (constructor is not called then). Being protected, it is not serialized either.
+    anga_type_to_span_index = getattr(self, "_anga_type_to_span_index", None)
+    if anga_type_to_span_index is None:
+      anga_type_to_span_index = {}
+      self._anga_type_to_span_index = anga_type_to_span_index
+    spans = self.get_angas_with_ends(anga_type=anga_type)
+    span_index = anga_type_to_span_index.get(anga_type.name, None)
+    if span_index is None or span_index.is_stale(spans=spans):
+      span_index = AngaSpanIndex(spans=spans)
+      anga_type_to_span_index[anga_type.name] = span_index
+    return span_index
+
   def find_anga_span(self, anga):
-    for anga_span in self.get_angas_with_ends(anga_type=anga.get_type()):
-      if anga_span.anga == anga:
-        return anga_span
-    return None
+    return self._get_span_index(anga_type=anga.get_type()).find_span(anga_index=anga.index)
 
   def get_anga_spans_in_interval(self, anga_type, interval):
     """
@@ -82,29 +148,17 @@ class DayAngas(common.JsonObject):
     :param interval: 
     :return: 
     """
-    all_spans = self.get_angas_with_ends(anga_type=anga_type)
-    spans = []
-    for span in all_spans:
-      if span.jd_end is not None and span.jd_end < interval.jd_start:
-        continue
-      # Does the anga start within the interval?
-      elif span.jd_start is not None and span.jd_start >= interval.jd_start and span.jd_start <= interval.jd_end:
-        spans.append(span)
-      # Does the anga end within the interval?
-      elif span.jd_end is not None and span.jd_end >= interval.jd_start and span.jd_end <= interval.jd_end:
-        spans.append(span)
-      # Does the anga end fully contain the interval?
-      elif (span.jd_start is None or span.jd_start <= interval.jd_start) and (span.jd_end is None or span.jd_end >= interval.jd_end):
-        spans.append(span)
-      elif span.jd_start is not None and span.jd_start > interval.jd_end:
-        break
-    return spans
+    return self._get_span_index(anga_type=anga_type).get_spans_in_interval(jd_start=interval.jd_start, jd_end=interval.jd_end)
+
+  def anga_at(self, jd, anga_type):
+    """Point query - like get_anga_spans_in_interval for a zero length interval, but without constructing one."""
+    span = self._get_span_index(anga_type=anga_type).get_span_at(jd=jd)
+    if span is None:
+      return None
+    return span.anga
 
   def get_anga_at_jd(self, jd, anga_type):
-    anga_spans = self.get_anga_spans_in_interval(anga_type=anga_type, interval=Interval(jd_start=jd, jd_end=jd))
-    for anga_span in anga_spans:
-      return anga_span.anga
-    return None
+    return self.anga_at(jd=jd, anga_type=anga_type)
 
   def get_anga_data_str(self, anga_type, script, reference_jd):
     anga_data_str = ''
@@ -124,20 +178,139 @@ class DayAngas(common.JsonObject):
 
 
 class PaxiActivities(common.JsonObject):
-  def __init__(self):
+  """Pancha paxi activities of each bird through a day, as runs of the same activity: bird_to_activities[bird][i] lasts from bird_to_boundary_jds[bird][i] to bird_to_boundary_jds[bird][i + 1].
+  
+  Interval objects (as writers want them) are only made on demand - see get_activity_intervals.
+  """
+  BIRDS = ["cock", "crow", "owl", "peacock", "vulture"]
+
+  def __init__(self, bird_to_boundary_jds=None, bird_to_activities=None):
     super().__init__()
-    self.cock = []
-    self.crow = []
-    self.owl = []
-    self.peacock = []
-    self.vulture = []
-
-  def add_activity_interval(self, bird, activity_interval):
-    activity_intervals = getattr(self, bird)
-    if len(activity_intervals) > 0 and activity_intervals[-1].name == activity_interval.name:
-      activity_intervals[-1].jd_end = activity_interval.jd_end
+    self.bird_to_boundary_jds = default_if_none(bird_to_boundary_jds, {})
+    self.bird_to_activities = default_if_none(bird_to_activities, {})
+
+  @classmethod
+  def from_activities_table(cls, activities_table, jd_sunrise, jd_sunset, jd_next_sunrise):
+    """
+    
+    :param activities_table: Activities of each bird in each of the 120 equal parts of the daytime, followed by the 120 equal parts of the night.
+    """
+    fractions = numpy.arange(120) / 120.0
+    part_start_jds = numpy.concatenate([jd_sunrise + (jd_sunset - jd_sunrise) * fractions, jd_sunset + (jd_next_sunrise - jd_sunset) * fractions, [jd_next_sunrise]])
+    bird_to_boundary_jds = {}
+    bird_to_activities = {}
+    for bird in cls.BIRDS:
+      activities = numpy.asarray(activities_table[bird], dtype=int)
+      run_starts = numpy.concatenate([[0], numpy.flatnonzero(activities[1:] != activities[:-1]) + 1])
+      bird_to_boundary_jds[bird] = part_start_jds[numpy.append(run_starts, len(activities))].tolist()
+      bird_to_activities[bird] = activities[run_starts].tolist()
+    return PaxiActivities(bird_to_boundary_jds=bird_to_boundary_jds, bird_to_activities=bird_to_activities)
+
+  def get_activity_at(self, bird, jd):
+    """
+    
+    :return: The activity of bird at jd, or None if jd is outside the day.
+    """
+    boundary_jds = self.bird_to_boundary_jds[bird]
+    index = bisect.bisect_right(boundary_jds, jd) - 1
+    if index < 0 or index >= len(self.bird_to_activities[bird]):
+      return None
+    return self.bird_to_activities[bird][index]
+
+  def get_activity_intervals(self, bird):
+    boundary_jds = self.bird_to_boundary_jds[bird]
+    return [Interval(jd_start=boundary_jds[i], jd_end=boundary_jds[i + 1], name=activity) for (i, activity) in enumerate(self.bird_to_activities[bird])]
+
+  @property
+  def cock(self):
+    return self.get_activity_intervals(bird="cock")
+
+  @property
+  def crow(self):
+    return self.get_activity_intervals(bird="crow")
+
+  @property
+  def owl(self):
+    return self.get_activity_intervals(bird="owl")
+
+  @property
+  def peacock(self):
+    return self.get_activity_intervals(bird="peacock")
+
+  @property
+  def vulture(self):
+    return self.get_activity_intervals(bird="vulture")
+
+
+class SankraantiIndex(object):
+  """Sankraantis (solar month starts) for a location and ayanaamsha, along with the first sunset following each - so that the solar date at any sunset is looked up by bisection, rather than by counting sunsets since the sankraanti.
+
+  The day number at a sunset is 1 + the number of (roughly day-long) gaps between the month's first sunset and that sunset. The index is filled lazily, around the queried sunsets.
+  """
+  # Solar months last at most ~31.5 days.
+  PADDING_DAYS = 35
+  # Sunsets drift by a few minutes per day at most (outside polar regions) - so anything more is unexpected.
+  MAX_DRIFT_DAYS = 0.25
+
+  def __init__(self, latitude, longitude, ayanaamsha_id):
+    self.city = City(name=None, latitude=latitude, longitude=longitude, timezone="UTC")
+    self.ayanaamsha_id = ayanaamsha_id
+    self.anga_finder = AngaSpanFinder.get_cached(ayanaamsha_id=ayanaamsha_id, anga_type=AngaType.SIDEREAL_MONTH)
+    self.jd_start = None
+    self.jd_end = None
+    self.sankraanti_jds = []
+    self.first_sunset_jds = []
+    self.month_indices = []
+
+  @methodtools.lru_cache(maxsize=None)
+  @classmethod
+  def get_cached(cls, latitude, longitude, ayanaamsha_id):
+    return SankraantiIndex(latitude=latitude, longitude=longitude, ayanaamsha_id=ayanaamsha_id)
+
+  def _get_sankraantis(self, jd_start, jd_end):
+    spans = self.anga_finder.get_all_angas_in_period(jd1=jd_start, jd2=jd_end)
+    return [(span.jd_start, span.anga.index) for span in spans if span.jd_start is not None and span.jd_start <= jd_end]
+
+  def _fill(self, jd_start, jd_end):
+    if self.jd_start is None or jd_end < self.jd_start or jd_start > self.jd_end:
+      # Nothing to build on (or too far to bridge) - start afresh.
+      sankraantis = self._get_sankraantis(jd_start=jd_start, jd_end=jd_end)
+      self.sankraanti_jds = []
+      self.first_sunset_jds = []
+      self.month_indices = []
     else:
-      activity_intervals.append(activity_interval)
+      sankraantis = []
+      if jd_start < self.jd_start:
+        sankraantis.extend(self._get_sankraantis(jd_start=jd_start, jd_end=self.jd_start))
+      if jd_end > self.jd_end:
+        sankraantis.extend(self._get_sankraantis(jd_start=self.jd_end, jd_end=jd_end))
+      (jd_start, jd_end) = (min(jd_start, self.jd_start), max(jd_end, self.jd_end))
+    for (sankraanti_jd, month_index) in sankraantis:
+      position = bisect.bisect_left(self.sankraanti_jds, sankraanti_jd)
+      # Sankraantis found at the edges of adjoining windows may repeat.
+      if any(abs(self.sankraanti_jds[i] - sankraanti_jd) < 1 for i in (position - 1, position) if 0 <= i < len(self.sankraanti_jds)):
+        continue
+      self.sankraanti_jds.insert(position, sankraanti_jd)
+      self.first_sunset_jds.insert(position, self.city.get_setting_time(julian_day_start=sankraanti_jd, body=Graha.SUN))
+      self.month_indices.insert(position, month_index)
+    (self.jd_start, self.jd_end) = (jd_start, jd_end)
+
+  def get_date(self, jd_sunset):
+    """
+
+    :param jd_sunset: Time of some sunset at this location.
+    :return: (month_index, day, month_start_jd, month_end_jd) tuple.
+    """
+    if self.jd_start is None or jd_sunset - SankraantiIndex.PADDING_DAYS < self.jd_start or jd_sunset + SankraantiIndex.PADDING_DAYS > self.jd_end:
+      self._fill(jd_start=jd_sunset - SankraantiIndex.PADDING_DAYS - 5, jd_end=jd_sunset + SankraantiIndex.PADDING_DAYS + 5)
+    position = bisect.bisect_right(self.sankraanti_jds, jd_sunset) - 1
+    (month_start_jd, month_end_jd) = (self.sankraanti_jds[position], self.sankraanti_jds[position + 1])
+    days_since_first_sunset = jd_sunset - self.first_sunset_jds[position]
+    day = 1 + round(days_since_first_sunset)
+    if abs(days_since_first_sunset - round(days_since_first_sunset)) > SankraantiIndex.MAX_DRIFT_DAYS:
+      logging.warning("Unexpected sunset drift at %s - counting sunsets instead.", self.city.name)
+      day = len(self.city.get_sunsets_in_period(jd_start=month_start_jd, jd_end=jd_sunset + 1/48.0))
+    return (self.month_indices[position], day, month_start_jd, month_end_jd)
 
 
 # This class is not named Panchangam in order to be able to disambiguate from annual.Panchangam in serialized objects.
@@ -153,8 +326,10 @@ class DailyPanchaanga(common.JsonObject):
     return DailyPanchaanga(city=city, date=date, computation_system=computation_system)
 
   def __init__(self, city: City, date: Date, computation_system = None,
-               previous_day_panchaanga=None) -> None:
+               previous_day_panchaanga=None, anga_timeline=None) -> None:
     """Constructor for the panchaanga.
+    
+    :param anga_timeline: Optional zodiac.AngaTimeline covering this day, from which anga spans are read off (rather than computed afresh). 
     """
     super(DailyPanchaanga, self).__init__()
     self.city = city
@@ -167,8 +342,6 @@ class DailyPanchaanga(common.JsonObject):
     self.jd_sunset = None
     self.jd_previous_sunset = None
     self.jd_next_sunrise = None
-    self.jd_moonrise = None
-    self.jd_moonset = None
 
     self.lagna_data = None
     self.sunrise_day_angas = None
@@ -182,10 +355,8 @@ class DailyPanchaanga(common.JsonObject):
     
     self.shraaddha_tithi = []
     self.festival_id_to_instance = {}
-    self.mauDhyas = None
-    self.amauDhyas = None
 
-    self.compute_sun_moon_transitions(previous_day_panchaanga=previous_day_panchaanga)
+    self.compute_sun_moon_transitions(previous_day_panchaanga=previous_day_panchaanga, anga_timeline=anga_timeline)
     self.compute_solar_day_sunset(previous_day_panchaanga=previous_day_panchaanga)
     self.set_tropical_date_sunset(previous_day_panchaanga=previous_day_panchaanga)
     self.day_length_based_periods = DayLengthBasedPeriods(jd_previous_sunset=self.jd_previous_sunset, jd_sunrise=self.jd_sunrise, jd_sunset=self.jd_sunset, jd_next_sunrise=self.jd_next_sunrise, weekday=self.date.get_weekday())
@@ -193,11 +364,87 @@ class DailyPanchaanga(common.JsonObject):
     if self.computation_system.lunar_month_assigner_type is not None:
       lunar_month_assigner = LunarMonthAssigner.get_assigner(computation_system=self.computation_system)
       self.set_lunar_month_sunrise(month_assigner=lunar_month_assigner, previous_day_panchaanga=previous_day_panchaanga)
-      self.set_mauDhyas()
 
     if self.computation_system.festival_options.set_pancha_paxi_activities:
       self.get_pancha_paxi_activities()
 
+    computation_profile = self.computation_system.get_computation_profile()
+    if computation_profile is not None and computation_profile.fill_lazy_fields:
+      self.fill_lazy_fields()
+
+  # jd_moonrise, jd_moonset, mauDhyas and amauDhyas are computed only when first accessed - many uses (eg. festival computation) need them for few or no days. They are stored in the instance __dict__ under the same names, so that they are serialized (and deserialized) if computed. A field is taken to be computed if it is in __dict__ - even if None (as mauDhyas may legitimately be).
+
+  def _get_lazy_field(self, name, compute):
+    if name not in self.__dict__:
+      compute()
+    return self.__dict__.get(name, None)
+
+  def _compute_moonrise(self):
+    self.__dict__["jd_moonrise"] = self.city.get_rising_time(julian_day_start=self.jd_sunrise, body=Graha.MOON)
+
+  def _compute_moonset(self):
+    self.__dict__["jd_moonset"] = self.city.get_setting_time(julian_day_start=self.jd_sunrise, body=Graha.MOON)
+
+  def _compute_mauDhyas(self):
+    # Both are computed together.
+    if "mauDhyas" not in self.__dict__ and "amauDhyas" not in self.__dict__ and self.computation_system.lunar_month_assigner_type is not None:
+      self.set_mauDhyas()
+    # set_mauDhyas leaves out empty ones - these are recorded as None, so as not to be recomputed.
+    self.__dict__.setdefault("mauDhyas", None)
+    self.__dict__.setdefault("amauDhyas", None)
+
+  def fill_lazy_fields(self):
+    """Compute all lazily computed fields (so that they get serialized)."""
+    self._get_lazy_field(name="jd_moonrise", compute=self._compute_moonrise)
+    self._get_lazy_field(name="jd_moonset", compute=self._compute_moonset)
+    self._get_lazy_field(name="mauDhyas", compute=self._compute_mauDhyas)
+    self.day_length_based_periods.fill_lazy_fields()
+
+  @property
+  def day_length_based_periods(self):
+    # Kaalas within are computed only when first accessed - see LazyDayDivision.
+    day_length_based_periods = self.__dict__.get("day_length_based_periods", None)
+    if day_length_based_periods is not None and not day_length_based_periods.has_day_boundaries():
+      # Deserialized objects have only the kaalas computed before serialization. 
+      day_length_based_periods.set_day_boundaries(day_boundaries=DayBoundaries(jd_previous_sunset=self.jd_previous_sunset, jd_sunrise=self.jd_sunrise, jd_sunset=self.jd_sunset, jd_next_sunrise=self.jd_next_sunrise, weekday=self.date.get_weekday()))
+    return day_length_based_periods
+
+  @day_length_based_periods.setter
+  def day_length_based_periods(self, value):
+    self.__dict__["day_length_based_periods"] = value
+
+  @property
+  def jd_moonrise(self):
+    return self._get_lazy_field(name="jd_moonrise", compute=self._compute_moonrise)
+
+  @jd_moonrise.setter
+  def jd_moonrise(self, value):
+    self.__dict__["jd_moonrise"] = value
+
+  @property
+  def jd_moonset(self):
+    return self._get_lazy_field(name="jd_moonset", compute=self._compute_moonset)
+
+  @jd_moonset.setter
+  def jd_moonset(self, value):
+    self.__dict__["jd_moonset"] = value
+
+  @property
+  def mauDhyas(self):
+    return self._get_lazy_field(name="mauDhyas", compute=self._compute_mauDhyas)
+
+  @mauDhyas.setter
+  def mauDhyas(self, value):
+    self.__dict__["mauDhyas"] = value
+
+  @property
+  def amauDhyas(self):
+    return self._get_lazy_field(name="amauDhyas", compute=self._compute_mauDhyas)
+
+  @amauDhyas.setter
+  def amauDhyas(self, value):
+    self.__dict__["amauDhyas"] = value
+
   def __repr__(self):
     return "%s %s" % (repr(self.date), repr(self.city))
 
@@ -205,13 +452,24 @@ class DailyPanchaanga(common.JsonObject):
     return repr(self)
 
   def __lt__(self, other):
-    return self.date.get_date_str() < self.date.get_date_str()
+    return self.date.get_day_ordinal() < other.date.get_day_ordinal()
 
-  def compute_sun_moon_transitions(self, previous_day_panchaanga=None, force_recomputation=False):
+  def _get_all_angas_in_day(self, anga_type, anga_timeline=None):
+    if anga_timeline is not None and anga_timeline.covers(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise, anga_types=[anga_type]):
+      return anga_timeline.get_all_angas_in_period(anga_type=anga_type, jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
+    if anga_type == zodiac.AngaType.TITHI:
+      # Deliberately passing ASHVINI_STARTING_0 below since it is cheapest. Tithi is independent of ayanAmsha. 
+      ayanaamsha_id = Ayanamsha.ASHVINI_STARTING_0
+    else:
+      ayanaamsha_id = self.computation_system.ayanaamsha_id
+    return AngaSpanFinder.get_cached(ayanaamsha_id=ayanaamsha_id, anga_type=anga_type).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
+
+  def compute_sun_moon_transitions(self, previous_day_panchaanga=None, force_recomputation=False, anga_timeline=None):
     """
 
     :param previous_day_panchaanga: Panchangam for previous day, to avoid unnecessary calculations. (rise_trans calculations can be time consuming.)
     :param force_recomputation: Boolean indicating if the transitions should be recomputed. (rise_trans calculations can be time consuming.)
+    :param anga_timeline: Optional zodiac.AngaTimeline to read anga spans from.
     :return:
     """
     if force_recomputation or self.jd_sunrise is None:
@@ -234,29 +492,16 @@ class DailyPanchaanga(common.JsonObject):
       raise (ValueError(
         'No sunset was computed. Perhaps the co-ordinates are beyond the polar circle (most likely a LAT-LONG swap! Please check your inputs.'))
 
-    if force_recomputation or self.jd_moonrise is None:
-      self.jd_moonrise = self.city.get_rising_time(julian_day_start=self.jd_sunrise, body=Graha.MOON)
-    if force_recomputation or self.jd_moonset is None:
-      self.jd_moonset = self.city.get_setting_time(julian_day_start=self.jd_sunrise, body=Graha.MOON)
+    if force_recomputation:
+      # Recomputed lazily, if accessed.
+      self.__dict__.pop("jd_moonrise", None)
+      self.__dict__.pop("jd_moonset", None)
 
     if force_recomputation or self.sunrise_day_angas is None:
       self.sunrise_day_angas = DayAngas()
-      # Deliberately passing ASHVINI_STARTING_0 below since it is cheapest. Tithi is independent of ayanAmsha. 
-      self.sunrise_day_angas.tithis_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0, anga_type=zodiac.AngaType.TITHI).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      self.sunrise_day_angas.tithi_at_sunrise = self.sunrise_day_angas.tithis_with_ends[0].anga
-      
-      self.sunrise_day_angas.nakshatras_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.NAKSHATRA).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      self.sunrise_day_angas.nakshatra_at_sunrise = self.sunrise_day_angas.nakshatras_with_ends[0].anga
-      
-      self.sunrise_day_angas.yogas_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.YOGA).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      self.sunrise_day_angas.yoga_at_sunrise = self.sunrise_day_angas.yogas_with_ends[0].anga
-      
-      self.sunrise_day_angas.karanas_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.KARANA).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      
-      self.sunrise_day_angas.raashis_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.RASHI).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      self.sunrise_day_angas.solar_raashis_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.SIDEREAL_MONTH).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
-      
-      self.sunrise_day_angas.solar_nakshatras_with_ends = AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=zodiac.AngaType.SOLAR_NAKSH).get_all_angas_in_period(jd1=self.jd_sunrise, jd2=self.jd_next_sunrise)
+      # Only anga types required by the computation profile (and festival rules) are computed.
+      for anga_type in self.computation_system.get_day_anga_types():
+        self.sunrise_day_angas.set_angas_with_ends(anga_type=anga_type, anga_spans=self._get_all_angas_in_day(anga_type=anga_type, anga_timeline=anga_timeline))
 
   def get_interval(self, interval_id):
     interval_id = names.devanaagarii_to_python.get(interval_id, interval_id)
@@ -301,13 +546,12 @@ class DailyPanchaanga(common.JsonObject):
     solar_sidereal_month_end_jd = None
     # Some months are really short, like Dhanurmasa ending 1970-Jan-14. So >=28 is used...
     if previous_day_panchaanga is None or previous_day_panchaanga.solar_sidereal_date_sunset.day >= 28 :
-      anga_finder = zodiac.AngaSpanFinder.get_cached(ayanaamsha_id=self.computation_system.ayanaamsha_id, anga_type=AngaType.SIDEREAL_MONTH)
-      solar_month_sunset_span = anga_finder.find(jd1=self.jd_sunset - 32, jd2=self.jd_sunset + 5, target_anga_id=solar_month_sunset)
-      solar_sidereal_month_day_sunset = len(self.city.get_sunsets_in_period(jd_start=solar_month_sunset_span.jd_start, jd_end=self.jd_sunset + 1/48.0))
-      if solar_sidereal_month_day_sunset == 1 and solar_month_sunset_span.jd_start > self.jd_sunrise:
-        solar_sidereal_month_end_jd = solar_month_sunset_span.jd_start
-      elif solar_sidereal_month_day_sunset >= 29 and solar_month_sunset_span.jd_end < self.jd_next_sunrise:
-        solar_sidereal_month_end_jd = solar_month_sunset_span.jd_end
+      sankraanti_index = SankraantiIndex.get_cached(latitude=self.city.latitude, longitude=self.city.longitude, ayanaamsha_id=self.computation_system.ayanaamsha_id)
+      (_, solar_sidereal_month_day_sunset, month_start_jd, month_end_jd) = sankraanti_index.get_date(jd_sunset=self.jd_sunset)
+      if solar_sidereal_month_day_sunset == 1 and month_start_jd > self.jd_sunrise:
+        solar_sidereal_month_end_jd = month_start_jd
+      elif solar_sidereal_month_day_sunset >= 29 and month_end_jd < self.jd_next_sunrise:
+        solar_sidereal_month_end_jd = month_end_jd
     else:
       solar_sidereal_month_day_sunset = previous_day_panchaanga.solar_sidereal_date_sunset.day + 1
     from jyotisha.panchaanga.temporal import time
@@ -320,18 +564,11 @@ class DailyPanchaanga(common.JsonObject):
       tropical_date_sunset_month = previous_day_panchaanga.tropical_date_sunset.month
     
     if previous_day_panchaanga is None or previous_day_panchaanga.tropical_date_sunset.day > 28 :
-      nd = zodiac.NakshatraDivision(jd=self.jd_sunset, ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0)
-      fractional_month = nd.get_fractional_division_for_body(body=Graha.singleton(Graha.SUN), anga_type=AngaType.RASHI)
-      (month_fraction, _) = modf(fractional_month)
-      approx_day = month_fraction*30
-      month_transitions = Graha.singleton(Graha.SUN).get_transits(jd_start=self.jd_sunset-approx_day-5, jd_end=self.jd_sunset + 4, anga_type=AngaType.RASHI, ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0)
-      if month_transitions[-1].jd > self.jd_previous_sunset and month_transitions[-1].jd <= self.jd_sunset:
-        tropical_date_sunset_day = 1
-        tropical_date_sunset_month = month_transitions[-1].value_2
-        month_transition_jd = month_transitions[-1].jd
-      else:
-        tropical_date_sunset_day = len(self.city.get_sunsets_in_period(jd_start=month_transitions[0].jd, jd_end=self.jd_sunset + 1/48.0))
-        tropical_date_sunset_month = month_transitions[0].value_2
+      # Tropical months are sidereal months with no ayanaamsha.
+      sankraanti_index = SankraantiIndex.get_cached(latitude=self.city.latitude, longitude=self.city.longitude, ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0)
+      (tropical_date_sunset_month, tropical_date_sunset_day, month_start_jd, _) = sankraanti_index.get_date(jd_sunset=self.jd_sunset)
+      if tropical_date_sunset_day == 1:
+        month_transition_jd = month_start_jd
     self.tropical_date_sunset = time.BasicDateWithTransitions(month=tropical_date_sunset_month, day=tropical_date_sunset_day, month_transition=month_transition_jd)
 
   def set_lunar_month_sunrise(self, month_assigner, previous_day_panchaanga=None):
@@ -347,6 +584,18 @@ class DailyPanchaanga(common.JsonObject):
       if  month_assigner is not None:
         self.lunar_month_sunrise = month_assigner.get_month_sunrise(daily_panchaanga=self)
 
+  def matches_recurrence_fields(self, other, jd_tolerance=1e-6):
+    """Do fields which may be seeded from the previous day (sunrises, sunsets, solar and lunar dates) agree with those of other (a panchaanga for the same day, computed otherwise)?"""
+    for attribute in ["jd_previous_sunset", "jd_sunrise", "jd_sunset", "jd_next_sunrise"]:
+      (value, other_value) = (getattr(self, attribute), getattr(other, attribute))
+      if (value is None) != (other_value is None) or (value is not None and abs(value - other_value) > jd_tolerance):
+        return False
+    for attribute in ["solar_sidereal_date_sunset", "tropical_date_sunset", "lunar_month_sunrise"]:
+      (value, other_value) = (getattr(self, attribute), getattr(other, attribute))
+      if (value is None) != (other_value is None) or (value is not None and value != other_value):
+        return False
+    return True
+
   def get_date(self, month_type):
     if month_type == RulesRepo.SIDEREAL_SOLAR_MONTH_DIR:
       return self.solar_sidereal_date_sunset
@@ -454,63 +703,38 @@ class DailyPanchaanga(common.JsonObject):
     if self.lagna_data is not None:
       return self.lagna_data
 
-    self.lagna_data = []
     if getattr(self, "jd_sunrise", None) is None or self.jd_sunrise is None:
       self.compute_sun_moon_transitions()
-    lagna_sunrise = 1 + floor(self.city.get_lagna_float(self.jd_sunrise, ayanaamsha_id=ayanaamsha_id))
-
-    lagna_list = [(x + lagna_sunrise - 1) % 12 + 1 for x in range(13)]
-
-    lbrack = self.jd_sunrise - 3 / 24
-    rbrack = self.jd_sunrise + 3 / 24
-
-    for lagna in lagna_list:
-      # print('---\n', lagna)
-      if debug:
-        logging.debug(('lagna sunrise', self.city.get_lagna_float(self.jd_sunrise, ayanaamsha_id=ayanaamsha_id)))
-        logging.debug(('lbrack', self.city.get_lagna_float(lbrack, int(-lagna), ayanaamsha_id=ayanaamsha_id)))
-        logging.debug(('rbrack', self.city.get_lagna_float(rbrack, int(-lagna), ayanaamsha_id=ayanaamsha_id)))
-
-      lagna_end_time = brentq(self.city.get_lagna_float, lbrack, rbrack,
-                              args=(-lagna, ayanaamsha_id, debug))
-      lbrack = lagna_end_time + 1 / 24
-      rbrack = lagna_end_time + 3 / 24
-      if lagna_end_time < self.jd_next_sunrise:
-        self.lagna_data.append((lagna, lagna_end_time))
+    # Lagna ends are read off a series cached on the city - which Panchaanga.compute_angas computes for the whole period in one go.
+    lagna_series = self.city.get_lagna_series(jd_start=self.jd_sunrise, jd_end=self.jd_next_sunrise, ayanaamsha_id=ayanaamsha_id)
+    # Atmost 13 lagnas end within a day, beginning with the one prevailing at sunrise.
+    self.lagna_data = lagna_series.get_lagna_ends_in_period(jd_start=self.jd_sunrise, jd_end=self.jd_next_sunrise)[:13]
+    if debug:
+      logging.debug(('lagna sunrise', self.city.get_lagna_float(self.jd_sunrise, ayanaamsha_id=ayanaamsha_id)))
+      logging.debug(('lagna data', self.lagna_data))
     return self.lagna_data
 
-
   def get_pancha_paxi_activities(self):
     if self.paxi_activities is not None:
       return self.paxi_activities
-    self.paxi_activities = PaxiActivities()
-    from jyotisha.panchaanga.temporal.festival import rules
     paxa_id = int((self.sunrise_day_angas.tithi_at_sunrise.index - 1) / 15) + 1
     activities_table = pancha_paxi.get_activities_table(weekday_id=self.date.get_weekday(), paxa_id=paxa_id)
-
-    from jyotisha.panchaanga.temporal import interval   
-    for bird in ["cock", "crow", "owl", "peacock", "vulture"]:
-      activities = activities_table[bird]
-      
-      for i in range(0, 120):
-        activity_interval = interval.get_interval(start_jd=self.jd_sunrise, end_jd=self.jd_sunset, num_parts=120, part_index=i, name=activities[i])
-        self.paxi_activities.add_activity_interval(bird=bird, activity_interval=activity_interval)
-      
-      for i in range(120, 240):
-        activity_interval = interval.get_interval(start_jd=self.jd_sunset, end_jd=self.jd_next_sunrise, num_parts=120, part_index=i - 120, name=activities[i])
-        self.paxi_activities.add_activity_interval(bird=bird, activity_interval=activity_interval)
-    
+    self.paxi_activities = PaxiActivities.from_activities_table(activities_table=activities_table, jd_sunrise=self.jd_sunrise, jd_sunset=self.jd_sunset, jd_next_sunrise=self.jd_next_sunrise)
     return self.paxi_activities
 
-  def day_has_conjunction(self, body1, body2, gap=None):
+  def day_has_conjunction(self, body1, body2, gap=None, longitude_differences=None):
+    """
+    
+    :param longitude_differences: Longitude differences between body1 and body2 at sunrise and next sunrise, if already computed. 
+    """
     if gap is None:
       gap = (Graha.BODY_TO_ANGULAR_DIA_DEGREES[body1.body_name] + Graha.BODY_TO_ANGULAR_DIA_DEGREES[body2.body_name])/ 2.0
-
-    def has_collision(jd):
-      return abs(body.longitude_difference(jd=jd, body1=body1, body2=body2)) < gap
+    if longitude_differences is None:
+      longitude_differences = body.longitude_differences(jds=[self.jd_sunrise, self.jd_next_sunrise], body1=body1, body2=body2)
+    (difference_sunrise, difference_next_sunrise) = longitude_differences
 
     sign = lambda x: -1 if x < 0 else (1 if x > 0 else (0 if x == 0 else None))
-    return has_collision(jd=self.jd_sunrise) or has_collision(jd=self.jd_next_sunrise) or sign(body.longitude_difference(jd=self.jd_sunrise, body1=body1, body2=body2)) != sign(body.longitude_difference(jd=self.jd_next_sunrise, body1=body1, body2=body2))
+    return abs(difference_sunrise) < gap or abs(difference_next_sunrise) < gap or sign(difference_sunrise) != sign(difference_next_sunrise)
 
   def set_mauDhyas(self):
     sun = Graha.singleton(body_name=Graha.SUN)
@@ -520,11 +744,12 @@ class DailyPanchaanga(common.JsonObject):
     for graha_id in [Graha.MERCURY, Graha.VENUS, Graha.MARS, Graha.JUPITER, Graha.SATURN]:
       graha = Graha.singleton(body_name=graha_id)
       gap = self.computation_system.graha_lopa_measures.graha_id_to_lopa_measure.get(graha_id, None)
+      longitude_differences = body.longitude_differences(jds=[self.jd_sunrise, self.jd_next_sunrise], body1=sun, body2=graha)
 
-      if self.day_has_conjunction(body1=sun, body2=graha, gap=gap):
-        mauDhyas[graha_id] = [body.longitude_difference(jd=self.jd_sunrise, body1=sun, body2=graha), body.longitude_difference(jd=self.jd_next_sunrise, body1=sun, body2=graha)]
+      if self.day_has_conjunction(body1=sun, body2=graha, gap=gap, longitude_differences=longitude_differences):
+        mauDhyas[graha_id] = longitude_differences
       else:
-        amauDhyas[graha_id] = [body.longitude_difference(jd=self.jd_sunrise, body1=sun, body2=graha), body.longitude_difference(jd=self.jd_next_sunrise, body1=sun, body2=graha)]
+        amauDhyas[graha_id] = longitude_differences
 
     if len(mauDhyas) > 0:
       self.mauDhyas = mauDhyas
@@ -0,0 +1,198 @@
+import math
+
+import numpy
+
+from jyotisha import util
+from jyotisha.panchaanga.temporal import julian_day
+from jyotisha.panchaanga.temporal.interval import AngaSpan
+from jyotisha.panchaanga.temporal.time import Date, BasicDateWithTransitions
+from jyotisha.panchaanga.temporal.zodiac.angas import AngaType, Anga
+
+
+def _to_float(value):
+  return numpy.nan if value is None else value
+
+
+def _from_float(value):
+  return None if math.isnan(value) else float(value)
+
+
+class AngaSpanColumns(object):
+  """Anga spans of one type for all days of a PanchaangaFrame, in ragged arrays: the spans of day i are at positions offsets[i]:offsets[i + 1] of jd_starts, jd_ends and anga_indices."""
+
+  def __init__(self, anga_type_id, offsets, jd_starts, jd_ends, anga_indices):
+    self.anga_type_id = anga_type_id
+    self.offsets = offsets
+    self.jd_starts = jd_starts
+    self.jd_ends = jd_ends
+    self.anga_indices = anga_indices
+
+  @classmethod
+  def from_anga_span_lists(cls, anga_type, anga_span_lists):
+    spans = [span for anga_spans in anga_span_lists for span in anga_spans]
+    return AngaSpanColumns(anga_type_id=anga_type.name, offsets=numpy.cumsum([0] + [len(anga_spans) for anga_spans in anga_span_lists], dtype=numpy.int32), jd_starts=numpy.array([_to_float(span.jd_start) for span in spans], dtype=float), jd_ends=numpy.array([_to_float(span.jd_end) for span in spans], dtype=float), anga_indices=numpy.array([span.anga.index for span in spans], dtype=numpy.int16))
+
+  def get_anga_spans(self, index):
+    return [AngaSpan(jd_start=_from_float(self.jd_starts[i]), jd_end=_from_float(self.jd_ends[i]), anga=Anga.get_cached(index=int(self.anga_indices[i]), anga_type_id=self.anga_type_id)) for i in range(self.offsets[index], self.offsets[index + 1])]
+
+
+class PanchaangaFrame(object):
+  """Per-day fields of a (computed) Panchaanga in columns - numpy arrays with one row per day, rather than a DailyPanchaanga JsonObject (with its nested objects) per day. This is much more compact in memory and when pickled - as suits batch jobs over many years or cities.
+
+  Rows are accessed as (slotted) DayView objects, which expose the fields under the same names as DailyPanchaanga does. Fields not computed for a day (eg. jd_moonrise, if never accessed) are NaN in the columns, and None in the views. Anga spans are stored in AngaSpanColumns.
+  """
+  JD_COLUMNS = ["julian_day_start", "jd_sunrise", "jd_sunset", "jd_previous_sunset", "jd_next_sunrise", "jd_moonrise", "jd_moonset"]
+
+  def __init__(self, city, computation_system, day_ordinals):
+    self.city = city
+    self.computation_system = computation_system
+    self.day_ordinals = day_ordinals
+    self.columns = {}
+    self.anga_type_id_to_span_columns = {}
+    self.lunar_month_anga_type_id = None
+    self.festival_offsets = None
+    self.festival_ids = None
+
+  @classmethod
+  def from_panchaanga(cls, panchaanga, skip_padding_days=False):
+    daily_panchaangas = panchaanga.daily_panchaangas_sorted(skip_padding_days=skip_padding_days)
+    return cls.from_daily_panchaangas(daily_panchaangas=daily_panchaangas, city=panchaanga.city, computation_system=panchaanga.computation_system)
+
+  @classmethod
+  def from_daily_panchaangas(cls, daily_panchaangas, city, computation_system):
+    """
+
+    :param daily_panchaangas: A list of DailyPanchaanga objects sorted by date.
+    """
+    frame = PanchaangaFrame(city=city, computation_system=computation_system, day_ordinals=numpy.array([dp.date.get_day_ordinal() for dp in daily_panchaangas], dtype=numpy.int64))
+    for column in cls.JD_COLUMNS:
+      # Read off __dict__, so as not to trigger computation of lazy fields.
+      frame.columns[column] = numpy.array([_to_float(dp.__dict__.get(column, None)) for dp in daily_panchaangas], dtype=float)
+    for (prefix, date_attribute) in [("solar_sidereal", "solar_sidereal_date_sunset"), ("tropical", "tropical_date_sunset")]:
+      dates = [getattr(dp, date_attribute) for dp in daily_panchaangas]
+      frame.columns[prefix + "_months"] = numpy.array([0 if date is None else date.month for date in dates], dtype=numpy.int8)
+      frame.columns[prefix + "_days"] = numpy.array([0 if date is None else date.day for date in dates], dtype=numpy.int8)
+      frame.columns[prefix + "_month_transitions"] = numpy.array([numpy.nan if date is None else _to_float(date.month_transition) for date in dates], dtype=float)
+
+    lunar_months = [dp.lunar_month_sunrise for dp in daily_panchaangas]
+    frame.columns["lunar_month_indices"] = numpy.array([numpy.nan if month is None else month.index for month in lunar_months], dtype=float)
+    frame.lunar_month_anga_type_id = next((month.anga_type_id for month in lunar_months if month is not None), None)
+
+    for anga_type in [AngaType.TITHI, AngaType.NAKSHATRA, AngaType.YOGA, AngaType.KARANA, AngaType.RASHI, AngaType.SIDEREAL_MONTH, AngaType.SOLAR_NAKSH]:
+      anga_span_lists = [dp.sunrise_day_angas.get_angas_with_ends(anga_type=anga_type) for dp in daily_panchaangas]
+      # Only anga types computed for all days (see ComputationSystem.get_day_anga_types) are stored.
+      if all(anga_spans is not None for anga_spans in anga_span_lists):
+        frame.anga_type_id_to_span_columns[anga_type.name] = AngaSpanColumns.from_anga_span_lists(anga_type=anga_type, anga_span_lists=anga_span_lists)
+
+    festival_id_lists = [sorted(dp.festival_id_to_instance.keys()) for dp in daily_panchaangas]
+    frame.festival_offsets = numpy.cumsum([0] + [len(festival_ids) for festival_ids in festival_id_lists], dtype=numpy.int32)
+    frame.festival_ids = numpy.array([festival_id for festival_ids in festival_id_lists for festival_id in festival_ids], dtype=object)
+    return frame
+
+  def __getstate__(self):
+    # city and computation_system are JsonObjects - see util.JsonObjectPickler.
+    state = dict(self.__dict__)
+    state["city"] = util.pickle_dumps(self.city)
+    state["computation_system"] = util.pickle_dumps(self.computation_system)
+    return state
+
+  def __setstate__(self, state):
+    self.__dict__.update(state)
+    self.city = util.pickle_loads(state["city"])
+    self.computation_system = util.pickle_loads(state["computation_system"])
+
+  def __len__(self):
+    return len(self.day_ordinals)
+
+  def __getitem__(self, index):
+    if index < 0:
+      index += len(self)
+    if index < 0 or index >= len(self):
+      raise IndexError(index)
+    return DayView(frame=self, index=index)
+
+  def __iter__(self):
+    return (DayView(frame=self, index=index) for index in range(len(self)))
+
+  def day_view_for_date(self, date):
+    """
+
+    :return: A DayView, or None if the date is not covered.
+    """
+    day_ordinal = date.get_day_ordinal()
+    index = int(numpy.searchsorted(self.day_ordinals, day_ordinal))
+    if index >= len(self) or self.day_ordinals[index] != day_ordinal:
+      return None
+    return DayView(frame=self, index=index)
+
+  def get_anga_spans(self, index, anga_type):
+    """
+
+    :return: A list of AngaSpan objects - or None, if spans of anga_type were not computed.
+    """
+    span_columns = self.anga_type_id_to_span_columns.get(anga_type.name, None)
+    if span_columns is None:
+      return None
+    return span_columns.get_anga_spans(index=index)
+
+  def get_festival_ids(self, index):
+    return self.festival_ids[self.festival_offsets[index]:self.festival_offsets[index + 1]].tolist()
+
+
+class DayView(object):
+  """A row of a PanchaangaFrame - read-only, and made on demand."""
+  __slots__ = ("frame", "index")
+
+  def __init__(self, frame, index):
+    self.frame = frame
+    self.index = index
+
+  def __repr__(self):
+    return "%s %s" % (repr(self.date), repr(self.frame.city))
+
+  @property
+  def date(self):
+    (year, month, day) = julian_day.jdn_to_civil(int(self.frame.day_ordinals[self.index]))
+    return Date(year=year, month=month, day=day)
+
+  def _get_basic_date_with_transitions(self, prefix):
+    month = int(self.frame.columns[prefix + "_months"][self.index])
+    if month == 0:
+      return None
+    return BasicDateWithTransitions(month=month, day=int(self.frame.columns[prefix + "_days"][self.index]), month_transition=_from_float(self.frame.columns[prefix + "_month_transitions"][self.index]))
+
+  @property
+  def solar_sidereal_date_sunset(self):
+    return self._get_basic_date_with_transitions(prefix="solar_sidereal")
+
+  @property
+  def tropical_date_sunset(self):
+    return self._get_basic_date_with_transitions(prefix="tropical")
+
+  @property
+  def lunar_month_sunrise(self):
+    index = _from_float(self.frame.columns["lunar_month_indices"][self.index])
+    if index is None:
+      return None
+    return Anga.get_cached(index=int(index) if index.is_integer() else index, anga_type_id=self.frame.lunar_month_anga_type_id)
+
+  def get_anga_spans(self, anga_type):
+    return self.frame.get_anga_spans(index=self.index, anga_type=anga_type)
+
+  def get_anga_at_sunrise(self, anga_type):
+    anga_spans = self.get_anga_spans(anga_type=anga_type)
+    if anga_spans is None or len(anga_spans) == 0:
+      return None
+    return anga_spans[0].anga
+
+  @property
+  def festival_ids(self):
+    return self.frame.get_festival_ids(index=self.index)
+
+
+def _make_jd_property(column):
+  return property(lambda self: _from_float(self.frame.columns[column][self.index]))
+
+
+for _column in PanchaangaFrame.JD_COLUMNS:
+  setattr(DayView, _column, _make_jd_property(column=_column))
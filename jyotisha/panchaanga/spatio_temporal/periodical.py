@@ -1,19 +1,21 @@
-import copy
 import logging
 import sys
 from collections import defaultdict
 from typing import Dict
 
-import methodtools
 from timebudget import timebudget
 
+from jyotisha import util
 from jyotisha.panchaanga.spatio_temporal import daily
 from jyotisha.panchaanga.temporal import time, set_constants, ComputationSystem, AngaType, era
+from jyotisha.panchaanga.temporal.body import Graha
 from jyotisha.panchaanga.temporal.festival import FestivalInstance
 from jyotisha.panchaanga.temporal.festival.applier import tithi_festival, ecliptic, solar, vaara, rule_repo_based, \
   FestivalAssigner
+from jyotisha.panchaanga.temporal.interval import AngaSpanView
 from jyotisha.panchaanga.temporal.time import Date
 from jyotisha.panchaanga.temporal.tithi import ShraddhaTithiAssigner
+from jyotisha.panchaanga.temporal.zodiac import AngaTimeline
 from jyotisha.panchaanga.temporal.zodiac.angas import Tithi
 from jyotisha.util import default_if_none
 from sanskrit_data import collection_helper
@@ -25,12 +27,117 @@ timebudget.set_quiet(True)  # don't show measurements as they happen
 set_constants()
 
 
+def compute_daily_panchaangas(city, computation_system, jd_start, day_offsets, compute_lagnas=False, previous_day_panchaanga=None):
+  """Computes DailyPanchaanga-s for the (consecutive) days at day_offsets from jd_start - each seeded from the previous one.
+  
+  :param previous_day_panchaanga: The DailyPanchaanga of the day before the first day, if available - used to seed the first day.
+  :return: A list of DailyPanchaanga objects.
+  """
+  # Sunrises and sunsets for the whole (padded) period are found in one seeded pass, and cached on the city. (Moonrises and moonsets are computed only if some day's are accessed - see DailyPanchaanga.jd_moonrise.)
+  (jd_padded_start, jd_padded_end) = (jd_start + day_offsets[0] - Panchaanga.EVENT_PRIOR_PADDING_DAYS, jd_start + day_offsets[-1] + Panchaanga.EVENT_POSTERIOR_PADDING_DAYS)
+  city.get_rise_set_series(jd_start=jd_padded_start, jd_end=jd_padded_end, body=Graha.SUN)
+  # Anga boundaries for the whole (padded) period are found in one sweep. A day away on either side accommodates timezones and sunrise-to-sunrise days.
+  anga_timeline = AngaTimeline(jd_start=jd_padded_start, jd_end=jd_padded_end, ayanaamsha_id=computation_system.ayanaamsha_id, anga_types=computation_system.get_day_anga_types())
+  if compute_lagnas:
+    # Likewise for lagna ends - see DailyPanchaanga.get_lagna_data.
+    city.get_lagna_series(jd_start=jd_padded_start, jd_end=jd_padded_end)
+  daily_panchaangas = []
+  for d in day_offsets:
+    # The below block is temporary code to make the transition seamless.
+    date_d = time.jd_to_utc_gregorian(jd_start + d)
+    date_d.set_time_to_day_start()
+    previous_daily_panchaanga = daily_panchaangas[-1] if len(daily_panchaangas) > 0 else previous_day_panchaanga
+    daily_panchaanga = daily.DailyPanchaanga(city=city, date=date_d,
+                                             computation_system=computation_system,
+                                             previous_day_panchaanga=previous_daily_panchaanga,
+                                             anga_timeline=anga_timeline)
+    if compute_lagnas:
+      daily_panchaanga.get_lagna_data()
+    daily_panchaangas.append(daily_panchaanga)
+  return daily_panchaangas
+
+
+def _compute_daily_panchaangas_pickled(city_and_computation_system, jd_start, day_offsets, compute_lagnas):
+  """compute_daily_panchaangas, run in a worker process. Arguments and results contain JsonObjects - so they are passed around pickled by util.JsonObjectPickler."""
+  (city, computation_system) = util.pickle_loads(city_and_computation_system)
+  daily_panchaangas = compute_daily_panchaangas(city=city, computation_system=computation_system, jd_start=jd_start, day_offsets=day_offsets, compute_lagnas=compute_lagnas)
+  for daily_panchaanga in daily_panchaangas:
+    # Shared by all days - reset by the caller.
+    daily_panchaanga.city = None
+    daily_panchaanga.computation_system = None
+  return util.pickle_dumps(daily_panchaangas)
+
+
+class DailyPanchaangaArray(object):
+  """Consecutive days, in a list sorted by date - with O(1) access by offset (from the first day) or by date, and with the indices of the core days (ie. those not in paddings) precomputed."""
+
+  def __init__(self, daily_panchaangas, start_date, end_date):
+    """
+
+    :param daily_panchaangas: Consecutive days, in any order. 
+    :param start_date: The first core day.
+    :param end_date: The last core day.
+    """
+    self.daily_panchaangas = sorted(daily_panchaangas, key=lambda dp: dp.date.get_day_ordinal())
+    self.first_day_ordinal = self.daily_panchaangas[0].date.get_day_ordinal() if len(self.daily_panchaangas) > 0 else 0
+    if len(self.daily_panchaangas) > 0 and self.daily_panchaangas[-1].date.get_day_ordinal() - self.first_day_ordinal != len(self.daily_panchaangas) - 1:
+      raise ValueError("Days from %s to %s are not consecutive" % (self.daily_panchaangas[0].date, self.daily_panchaangas[-1].date))
+    self.core_start_index = min(max(self.get_offset(date=start_date), 0), len(self))
+    self.core_end_index = min(max(self.get_offset(date=end_date) + 1, self.core_start_index), len(self))
+
+  def __len__(self):
+    return len(self.daily_panchaangas)
+
+  def __getitem__(self, index):
+    return self.daily_panchaangas[index]
+
+  def __iter__(self):
+    return iter(self.daily_panchaangas)
+
+  def get_offset(self, date):
+    return date.get_day_ordinal() - self.first_day_ordinal
+
+  def get_for_day_ordinal(self, day_ordinal):
+    """
+
+    :return: A DailyPanchaanga, or None if the day is not covered.
+    """
+    offset = day_ordinal - self.first_day_ordinal
+    if 0 <= offset < len(self.daily_panchaangas):
+      return self.daily_panchaangas[offset]
+    return None
+
+  def get_for_date(self, date):
+    return self.get_for_day_ordinal(day_ordinal=date.get_day_ordinal())
+
+  def get_core_days(self):
+    return self.daily_panchaangas[self.core_start_index:self.core_end_index]
+
+  def get_prior_padding_days(self):
+    return self.daily_panchaangas[:self.core_start_index]
+
+  def get_posterior_padding_days(self):
+    return self.daily_panchaangas[self.core_end_index:]
+
+
 class Panchaanga(common.JsonObject):
   """This class enables the construction of a panchaanga for arbitrary periods, with festival_id_to_instance.
   
     Generally, which days is a given festival associated with (esp pre-sunrise events)? We follow the same conventions as the adyatithi repo.
     """
   LATEST_VERSION = "0.0.4"
+  # Number of worker processes used by compute_angas. 
+  DEFAULT_NUM_PROCESSES = 1
+  # Shorter chunks are not worth a cold start in a worker process.
+  MIN_CHUNK_DAYS = 15
+  # Festivals of so many days are assigned together by stream_daily_panchaangas. Some (eg. nava-nAyaka-s - see SolarFestivalAssigner.assign_nava_nayakas) are assigned only in year-long periods.
+  STREAM_CHUNK_DAYS = 366
+  # Days computed before start_date and after end_date - see _set_period.
+  PRIOR_PADDING_DAYS = 2
+  POSTERIOR_PADDING_DAYS = 30
+  # Sunrises and sunsets (and anga boundaries) are found for so many days before and after the days being computed - see compute_daily_panchaangas.
+  EVENT_PRIOR_PADDING_DAYS = 2
+  EVENT_POSTERIOR_PADDING_DAYS = 4
 
   def __init__(self, city, start_date, end_date, year_type = None, computation_system: ComputationSystem = None):
     """Constructor for the panchaanga.
@@ -46,6 +153,16 @@ class Panchaanga(common.JsonObject):
 
     self.computation_system = default_if_none(computation_system, ComputationSystem.DEFAULT)
 
+    self._set_period(start_date=self.start_date, end_date=self.end_date)
+
+    self.festival_id_to_days = defaultdict(set, {})
+    self.compute_angas(compute_lagnas=self.computation_system.festival_options.set_lagnas)
+    if not self.computation_system.festival_options.no_fests:
+      self.update_festival_details()
+
+  def _set_period(self, start_date, end_date):
+    self.start_date = start_date
+    self.end_date = end_date
     self.jd_start = time.utc_gregorian_to_jd(self.start_date)
     self.jd_end = time.utc_gregorian_to_jd(self.end_date)
 
@@ -53,55 +170,196 @@ class Panchaanga(common.JsonObject):
 
     # For accurate festival assignment, we sometimes need panchaanga information about succeeding or preceding days. 
     # For example, consider a festival to be selebrated during naxatra 27 in solar sideral month 9. If naxatra 27 occurs twice in sidereal_solar_month 9 (gap of 27+ daus), the latter occurence is to be selected - the former day will not get a festival. 
-    self.duration_posterior_padding = int(self.duration + 30)
-    self.duration_prior_padding = 2
+    self.duration_posterior_padding = int(self.duration + Panchaanga.POSTERIOR_PADDING_DAYS)
+    self.duration_prior_padding = Panchaanga.PRIOR_PADDING_DAYS
 
     self.weekday_start = time.get_weekday(self.jd_start)
 
-    self.festival_id_to_days = defaultdict(set, {})
-    self.compute_angas(compute_lagnas=self.computation_system.festival_options.lagnas)
-    if not self.computation_system.festival_options.no_fests:
-      self.update_festival_details()
+  @classmethod
+  def from_daily_panchaangas(cls, city, start_date, end_date, daily_panchaangas, computation_system, year_type=None):
+    """Makes a panchaanga out of already computed days - without computing any day, or assigning festivals. The days are shared, not copied.
+
+    :param daily_panchaangas: Consecutive days, sorted by date, covering the period with its paddings.
+    """
+    panchaanga = Panchaanga.__new__(Panchaanga)
+    common.JsonObject.__init__(panchaanga)
+    panchaanga.version = Panchaanga.LATEST_VERSION
+    panchaanga.city = city
+    panchaanga.year_type = year_type
+    panchaanga.computation_system = computation_system
+    panchaanga._set_period(start_date=start_date, end_date=end_date)
+    panchaanga.festival_id_to_days = defaultdict(set, {})
+    first_index = int(start_date - daily_panchaangas[0].date) - panchaanga.duration_prior_padding
+    num_days = panchaanga.duration_prior_padding + panchaanga.duration_posterior_padding - 1
+    if first_index < 0 or first_index + num_days > len(daily_panchaangas):
+      raise ValueError("Days from %s to %s do not cover %s to %s with paddings" % (str(daily_panchaangas[0].date), str(daily_panchaangas[-1].date), str(start_date), str(end_date)))
+    panchaanga._set_daily_panchaangas(daily_panchaangas=daily_panchaangas[first_index: first_index + num_days])
+    return panchaanga
 
   @timebudget
-  def compute_angas(self, compute_lagnas=True):
+  def compute_angas(self, compute_lagnas=True, num_processes=None):
     """Compute the entire panchaanga
+
+    :param num_processes: If more than 1, days are computed in so many chunks, in parallel (see _compute_daily_panchaangas_in_parallel). None means Panchaanga.DEFAULT_NUM_PROCESSES.
     """
 
-    # INITIALISE VARIABLES
-    self.date_str_to_panchaanga: Dict[str, daily.DailyPanchaanga] = {}
+    num_processes = default_if_none(num_processes, Panchaanga.DEFAULT_NUM_PROCESSES)
+    day_offsets = list(range(-self.duration_prior_padding, self.duration_posterior_padding - 1))
+    if num_processes > 1 and len(day_offsets) >= 2 * Panchaanga.MIN_CHUNK_DAYS:
+      daily_panchaangas = self._compute_daily_panchaangas_in_parallel(day_offsets=day_offsets, num_processes=num_processes, compute_lagnas=compute_lagnas)
+    else:
+      daily_panchaangas = compute_daily_panchaangas(city=self.city, computation_system=self.computation_system, jd_start=self.jd_start, day_offsets=day_offsets, compute_lagnas=compute_lagnas)
+    self._set_daily_panchaangas(daily_panchaangas=daily_panchaangas)
 
+  def _set_daily_panchaangas(self, daily_panchaangas):
+    """
 
-    #############################################################
-    # Compute all parameters -- sun/moon latitude/longitude etc #
-    #############################################################
+    :param daily_panchaangas: All (consecutive) days.
+    """
+    date_str_to_panchaanga: Dict[str, daily.DailyPanchaanga] = {}
+    for daily_panchaanga in daily_panchaangas:
+      date_str_to_panchaanga[daily_panchaanga.date.get_date_str()] = daily_panchaanga
+    self.date_str_to_panchaanga = date_str_to_panchaanga
+    self._set_day_array(day_array=DailyPanchaangaArray(daily_panchaangas=date_str_to_panchaanga.values(), start_date=self.start_date, end_date=self.end_date))
+
+  def _set_day_array(self, day_array):
+    self._day_array = day_array
+    # The date_str_to_panchaanga which the array was made from - see get_day_array.
+    self._day_array_source = self.date_str_to_panchaanga
+    self._tithi_span_views = {}
+
+  def set_daily_panchaanga(self, daily_panchaanga):
+    """Adds (or replaces) the day of daily_panchaanga. 
+    
+    date_str_to_panchaanga is to be modified only thus (or by _set_daily_panchaangas), so that the day array (see get_day_array) stays in sync with it.
+    """
+    date_str_to_panchaanga = dict(self.date_str_to_panchaanga)
+    date_str_to_panchaanga[daily_panchaanga.date.get_date_str()] = daily_panchaanga
+    self._set_daily_panchaangas(daily_panchaangas=date_str_to_panchaanga.values())
 
-    for d in range(-self.duration_prior_padding, self.duration_posterior_padding - 1):
-      # The below block is temporary code to make the transition seamless.
-      date_d = time.jd_to_utc_gregorian(self.jd_start + d)
-      date_d.set_time_to_day_start()
-      previous_daily_panchaanga = self.date_str_to_panchaanga.get(date_d.offset_date(days=-1).get_date_str(), None)
-      daily_panchaanga = daily.DailyPanchaanga(city=self.city, date=date_d,
-                                               computation_system=self.computation_system,
-                                               previous_day_panchaanga=previous_daily_panchaanga)
-      if compute_lagnas:
-        daily_panchaanga.get_lagna_data()
-      self.date_str_to_panchaanga[date_d.get_date_str()] = daily_panchaanga
+  def get_day_array(self):
+    """Days of this panchaanga as a DailyPanchaangaArray. 
+    
+    Being protected, it is not serialized - so it is rebuilt from date_str_to_panchaanga when missing (as in deserialized objects), or when date_str_to_panchaanga was replaced by another dict. Days are to be added or replaced only via set_daily_panchaanga. 
+    """
+    day_array = getattr(self, "_day_array", None)
+    if day_array is None or getattr(self, "_day_array_source", None) is not self.date_str_to_panchaanga:
+      day_array = DailyPanchaangaArray(daily_panchaangas=self.date_str_to_panchaanga.values(), start_date=self.start_date, end_date=self.end_date)
+      self._set_day_array(day_array=day_array)
+    return day_array
+
+  def _compute_daily_panchaangas_in_parallel(self, day_offsets, num_processes, compute_lagnas):
+    """Days are split into num_processes chunks, each computed in a worker process - starting cold at its first day (ie. without a previous_day_panchaanga). 
+    
+    The chunks are then stitched: the first day of each chunk (a seam day) is recomputed from the last day of the preceding chunk, as a serial computation would do. If fields seeded from the previous day differ, the day is replaced - as are following days, till they agree. 
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    chunk_size = max(Panchaanga.MIN_CHUNK_DAYS, -(-len(day_offsets) // num_processes))
+    chunks = [day_offsets[i:i + chunk_size] for i in range(0, len(day_offsets), chunk_size)]
+    city_and_computation_system = util.pickle_dumps((self.city, self.computation_system))
+    with ProcessPoolExecutor(max_workers=min(num_processes, len(chunks))) as executor:
+      futures = [executor.submit(_compute_daily_panchaangas_pickled, city_and_computation_system=city_and_computation_system, jd_start=self.jd_start, day_offsets=chunk, compute_lagnas=compute_lagnas) for chunk in chunks]
+      # Meanwhile, sunrises and sunsets used in festival computation are cached on self.city. 
+      self.city.get_rise_set_series(jd_start=self.jd_start + day_offsets[0] - Panchaanga.EVENT_PRIOR_PADDING_DAYS, jd_end=self.jd_start + day_offsets[-1] + Panchaanga.EVENT_POSTERIOR_PADDING_DAYS, body=Graha.SUN)
+      daily_panchaangas = []
+      seam_indices = []
+      for future in futures:
+        seam_indices.append(len(daily_panchaangas))
+        daily_panchaangas.extend(util.pickle_loads(future.result()))
+    for daily_panchaanga in daily_panchaangas:
+      daily_panchaanga.city = self.city
+      daily_panchaanga.computation_system = self.computation_system
+
+    for seam_index in seam_indices[1:]:
+      self._stitch_daily_panchaangas(daily_panchaangas=daily_panchaangas, seam_index=seam_index, compute_lagnas=compute_lagnas)
+    return daily_panchaangas
+
+  def _stitch_daily_panchaangas(self, daily_panchaangas, seam_index, compute_lagnas):
+    """Recomputes the day at seam_index (computed without a previous_day_panchaanga) from the preceding day, as a serial computation would do. If fields seeded from the previous day differ, the day is replaced (in place) - as are following days, till they agree.
+
+    :return: The number of days replaced.
+    """
+    num_replaced = 0
+    for index in range(seam_index, len(daily_panchaangas)):
+      # Computed as in compute_daily_panchaangas - with an AngaTimeline over the day's padded range.
+      day_offset = int(daily_panchaangas[index].date - self.start_date)
+      [daily_panchaanga] = compute_daily_panchaangas(city=self.city, computation_system=self.computation_system, jd_start=self.jd_start, day_offsets=[day_offset], compute_lagnas=compute_lagnas, previous_day_panchaanga=daily_panchaangas[index - 1])
+      if daily_panchaanga.matches_recurrence_fields(daily_panchaangas[index]):
+        break
+      logging.warning("Seam day %s differs from its serial computation - replacing it.", daily_panchaanga.date)
+      daily_panchaangas[index] = daily_panchaanga
+      num_replaced += 1
+    return num_replaced
+
+  def extend(self, end_date):
+    """Extends this panchaanga till a later end_date. Only the days not already computed (as posterior padding) are computed - seeded from the last computed day. Festivals are reassigned only for the added days (see _update_festival_details_in_window).
+    """
+    if end_date <= self.end_date:
+      raise ValueError("%s is not after %s" % (end_date, self.end_date))
+    end_date.set_time_to_day_start()
+    daily_panchaangas = self.daily_panchaangas_sorted()
+    old_end_date = self.end_date
+    self._set_period(start_date=self.start_date, end_date=end_date)
+    first_offset = int(daily_panchaangas[-1].date - self.start_date) + 1
+    compute_lagnas = self.computation_system.festival_options.set_lagnas
+    new_daily_panchaangas = compute_daily_panchaangas(city=self.city, computation_system=self.computation_system, jd_start=self.jd_start, day_offsets=list(range(first_offset, self.duration_posterior_padding - 1)), compute_lagnas=compute_lagnas, previous_day_panchaanga=daily_panchaangas[-1])
+    self._set_daily_panchaangas(daily_panchaangas=daily_panchaangas + new_daily_panchaangas)
+    if not self.computation_system.festival_options.no_fests:
+      self._update_festival_details_in_window(start_date=old_end_date + 1, end_date=self.end_date)
+
+  def prepend(self, start_date):
+    """Extends this panchaanga back to an earlier start_date. Only the days not already computed (as prior padding) are computed; and the (formerly) first days are then recomputed if they differ from what a serial computation from the new start would yield (see _stitch_daily_panchaangas). Festivals are reassigned only for the added (and any recomputed) days.
+    """
+    if start_date >= self.start_date:
+      raise ValueError("%s is not before %s" % (start_date, self.start_date))
+    start_date.set_time_to_day_start()
+    daily_panchaangas = self.daily_panchaangas_sorted()
+    old_start_date = self.start_date
+    self._set_period(start_date=start_date, end_date=self.end_date)
+    end_offset = int(daily_panchaangas[0].date - self.start_date)
+    compute_lagnas = self.computation_system.festival_options.set_lagnas
+    new_daily_panchaangas = compute_daily_panchaangas(city=self.city, computation_system=self.computation_system, jd_start=self.jd_start, day_offsets=list(range(-self.duration_prior_padding, end_offset)), compute_lagnas=compute_lagnas)
+    daily_panchaangas = new_daily_panchaangas + daily_panchaangas
+    num_replaced = self._stitch_daily_panchaangas(daily_panchaangas=daily_panchaangas, seam_index=len(new_daily_panchaangas), compute_lagnas=compute_lagnas)
+    self._set_daily_panchaangas(daily_panchaangas=daily_panchaangas)
+    if not self.computation_system.festival_options.no_fests:
+      window_end_date = max(old_start_date - 1, daily_panchaangas[len(new_daily_panchaangas) + num_replaced - 1].date)
+      self._update_festival_details_in_window(start_date=self.start_date, end_date=window_end_date)
+
+  def _update_festival_details_in_window(self, start_date, end_date):
+    """Reassigns festivals of the days from start_date to end_date (both inclusive) - leaving those of other days alone.
+
+    Festival assigners work on all days of a panchaanga (with its paddings). So they are run on a panchaanga for just this window, sharing days with this one.
+    """
+    window = Panchaanga.from_daily_panchaangas(city=self.city, start_date=start_date, end_date=end_date, daily_panchaangas=self.daily_panchaangas_sorted(), computation_system=self.computation_system)
+    window.update_festival_details(spare_padding_days=True)
+
+    for festival_id in list(self.festival_id_to_days.keys()):
+      days = set(day for day in self.festival_id_to_days[festival_id] if not start_date <= day <= end_date)
+      if len(days) > 0:
+        self.festival_id_to_days[festival_id] = days
+      else:
+        self.festival_id_to_days.pop(festival_id)
+    for (festival_id, days) in window.festival_id_to_days.items():
+      days = set(day for day in days if start_date <= day <= end_date)
+      if len(days) > 0:
+        # festival_id_to_days may be a plain dict (in deserialized panchaanga-s).
+        self.festival_id_to_days.setdefault(festival_id, set()).update(days)
 
-  @methodtools.lru_cache(maxsize=10)
   def daily_panchaangas_sorted(self, skip_padding_days=False):
+    """Days sorted by date - not to be modified. (See get_day_array, for offsets of padding days etc..)"""
+    day_array = self.get_day_array()
     if not skip_padding_days:
-      return sorted(self.date_str_to_panchaanga.values())
+      return day_array.daily_panchaangas
     else:
-      full_list = sorted(self.date_str_to_panchaanga.values())
-      return [x for x in full_list if self.start_date <= x.date and x.date <= self.end_date]
+      return day_array.get_core_days()
 
   def daily_panchaanga_for_jd(self, jd):
     date = self.city.get_timezone_obj().julian_day_to_local_time(julian_day=jd)
     return self.daily_panchaanga_for_date(date=date)
 
   def daily_panchaanga_for_date(self, date):
-    return self.date_str_to_panchaanga.get(date.get_date_str(), None)
+    return self.get_day_array().get_for_date(date=date)
 
   def pre_sunset_daily_panchaanga_for_jd(self, jd):
     panchaanga = self.daily_panchaanga_for_jd(jd=jd)
@@ -122,38 +380,54 @@ class Panchaanga(common.JsonObject):
       return self.daily_panchaanga_for_date(date=panchaanga.date - 1)
 
   def get_interval_anga_spans(self, date, interval_id, anga_type):
+    """
+    
+    :return: Spans of the day's angas which overlap the interval - to be treated as read-only, as they are not copies. Tithi spans come as AngaSpanView-s annotated with the lunar month (ie. with shared Tithi objects); these are made once per day and interval, and reused thereafter.
+    """
     dp = self.daily_panchaanga_for_date(date)
     (anga_spans, _) = dp.get_interval_anga_spans(interval_id=interval_id, anga_type=anga_type)
-    anga_spans = copy.deepcopy(anga_spans)
-
-    if anga_type == AngaType.TITHI:
+    if anga_type != AngaType.TITHI:
+      return anga_spans
+
+    tithi_span_views = getattr(self, "_tithi_span_views", None)
+    if tithi_span_views is None:
+      tithi_span_views = {}
+      self._tithi_span_views = tithi_span_views
+    key = (dp.date.get_day_ordinal(), interval_id)
+    span_views = tithi_span_views.get(key, None)
+    if span_views is None:
+      span_views = []
       for span in anga_spans:
         if span.anga.index in (1, 2):
           # The below is necessary because tithi 1 or 2 may start after sunrise.
           dp_next = self.daily_panchaanga_for_date(date + 1)
           # Lunar month below may be incorrect (adhika mAsa complication) if dp_next is not available (eg when the next day is beyond this panchaanga duration). Downstream code should be aware of that case.
           month = dp_next.lunar_month_sunrise if dp_next is not None else dp.lunar_month_sunrise + 1
-          span.anga = Tithi.from_anga(anga=span.anga, month=month)
         else:
-          span.anga = Tithi.from_anga(anga=span.anga, month=dp.lunar_month_sunrise)
-
-    return anga_spans
+          month = dp.lunar_month_sunrise
+        tithi = Tithi.get_cached(index=span.anga.index, month_index=month.index, month_anga_type_id=month.anga_type_id)
+        span_views.append(AngaSpanView(jd_start=span.jd_start, jd_end=span.jd_end, anga=tithi))
+      span_views = tuple(span_views)
+      tithi_span_views[key] = span_views
+    return span_views
 
   def clear_padding_day_festivals(self):
     """Festival assignments for padding days are not trustworthy - since one would need to look-ahead or before into further days for accurate festival assignment. They were computed only to ensure accurate computation of the core days in this panchaanga. To avoid misleading, we ought to clear festivals provisionally assigned to the padding days."""
-    daily_panchaangas = self.daily_panchaangas_sorted()
-    for dp in daily_panchaangas[:self.duration_prior_padding]:
-      self.delete_festivals_on_date(date=dp.date)
-    for dp in daily_panchaangas[self.duration_prior_padding + self.duration:]:
+    day_array = self.get_day_array()
+    for dp in day_array.get_prior_padding_days() + day_array.get_posterior_padding_days():
       self.delete_festivals_on_date(date=dp.date)
 
   @timebudget
-  def update_festival_details(self):
+  def update_festival_details(self, spare_padding_days=False):
     """
 
     Festival data may be updated more frequently and a precomputed panchaanga may go out of sync. Hence we keep this method separate.
+    :param spare_padding_days: Whether to leave festivals (and shraaddha tithis) of the padding days as they were - as is needed when padding days are shared with other panchaanga-s (see from_daily_panchaangas). 
     :return:
     """
+    day_array = self.get_day_array()
+    padding_daily_panchaangas = day_array.get_prior_padding_days() + day_array.get_posterior_padding_days() if spare_padding_days else []
+    saved_fields = [(dp.festival_id_to_instance, dp.shraaddha_tithi) for dp in padding_daily_panchaangas]
     self._reset_festivals()
     rule_lookup_assigner = rule_repo_based.RuleLookupAssigner(panchaanga=self)
     rule_lookup_assigner.apply_festival_from_rules_repos()
@@ -168,6 +442,10 @@ class Panchaanga(common.JsonObject):
     # self._sync_festivals_dict_and_daily_festivals(here_to_daily=True, daily_to_here=True)
     generic_assigner.assign_festival_numbers()
     self.clear_padding_day_festivals()
+    # Festivals and shraaddha tithis are reset (ie. replaced) rather than cleared (ie. mutated) above - so restoring the earlier objects suffices.
+    for (dp, (festival_id_to_instance, shraaddha_tithi)) in zip(padding_daily_panchaangas, saved_fields):
+      dp.festival_id_to_instance = festival_id_to_instance
+      dp.shraaddha_tithi = shraaddha_tithi
 
 
   def _sync_festivals_dict_and_daily_festivals(self, here_to_daily=False, daily_to_here=True):
@@ -198,15 +476,16 @@ class Panchaanga(common.JsonObject):
       self.date_str_to_panchaanga[date.get_date_str()].festival_id_to_instance.pop(fest_id, None)
 
   def add_festival(self, fest_id, date, interval_id="full_day"):
-    if date.get_date_str() not in self.date_str_to_panchaanga:
+    daily_panchaanga = self.daily_panchaanga_for_date(date=date)
+    if daily_panchaanga is None:
       return 
-    interval = self.date_str_to_panchaanga[date.get_date_str()].get_interval(interval_id=interval_id)
+    interval = daily_panchaanga.get_interval(interval_id=interval_id)
     self.add_festival_instance(date=date, festival_instance=FestivalInstance(name=fest_id, interval=interval))
 
   def add_festival_instance(self, festival_instance, date):
     from jyotisha.panchaanga.temporal.festival import rules
     festival_instance.name = rules.clean_id(id=festival_instance.name)
-    p_fday = self.date_str_to_panchaanga.get(date.get_date_str(), None)
+    p_fday = self.daily_panchaanga_for_date(date=date)
     if p_fday is not None:
       p_fday.festival_id_to_instance[festival_instance.name] = festival_instance
     self.festival_id_to_days[festival_instance.name].add(date)
@@ -234,6 +513,16 @@ class Panchaanga(common.JsonObject):
       daily_panchaanga.city = self.city
       daily_panchaanga.computation_system = self.computation_system
 
+  def fill_lazy_fields(self):
+    """Compute lazily computed fields of all days (so that they get serialized) - see DailyPanchaanga.fill_lazy_fields."""
+    for daily_panchaanga in self.date_str_to_panchaanga.values():
+      daily_panchaanga.fill_lazy_fields()
+
+  def to_frame(self, skip_padding_days=False):
+    """A compact, columnar copy of the per-day fields - see PanchaangaFrame."""
+    from jyotisha.panchaanga.spatio_temporal.frame import PanchaangaFrame
+    return PanchaangaFrame.from_panchaanga(panchaanga=self, skip_padding_days=skip_padding_days)
+
   def _force_non_redundancy_in_daily_panchaangas(self):
     """Avoids duplication for memory efficiency."""
     for daily_panchaanga in self.date_str_to_panchaanga.values():
@@ -254,5 +543,60 @@ class Panchaanga(common.JsonObject):
     self._refill_daily_panchaangas()
 
 
+class DailyPanchaangaSeries(object):
+  """A sliding window over one continuous series of days - each computed once, seeded from the preceding day - from which Panchaanga-s for successive periods are made (sharing days, see Panchaanga.from_daily_panchaangas).
+  
+  Days (and events cached on the city) preceding the latest period's paddings are dropped - so memory stays bounded however long the series runs; but periods are to be got in increasing order.
+  """
+
+  def __init__(self, city, computation_system: ComputationSystem = None):
+    self.city = city
+    self.computation_system = default_if_none(computation_system, ComputationSystem.DEFAULT)
+    self.daily_panchaangas = []
+
+  def get_panchaanga(self, start_date, end_date, year_type=None):
+    """
+
+    :return: A Panchaanga for start_date to end_date, with festivals assigned (unless no_fests).
+    """
+    # Paddings as in Panchaanga._set_period.
+    jd_start = time.utc_gregorian_to_jd(start_date)
+    duration = int(time.utc_gregorian_to_jd(end_date) - jd_start) + 1
+    (first_offset, end_offset) = (-Panchaanga.PRIOR_PADDING_DAYS, duration + Panchaanga.POSTERIOR_PADDING_DAYS - 1)
+    if len(self.daily_panchaangas) > 0:
+      retained_first_offset = int(self.daily_panchaangas[0].date - start_date)
+      if first_offset < retained_first_offset:
+        raise ValueError("Days before %s are no longer retained" % self.daily_panchaangas[0].date)
+      self.daily_panchaangas = self.daily_panchaangas[first_offset - retained_first_offset:]
+      # compute_daily_panchaangas reads cached events from a few days before the days it computes.
+      self.city.trim_cached_series(jd_start=jd_start + first_offset - Panchaanga.EVENT_PRIOR_PADDING_DAYS)
+    next_offset = first_offset + len(self.daily_panchaangas)
+    if next_offset < end_offset:
+      previous_day_panchaanga = self.daily_panchaangas[-1] if len(self.daily_panchaangas) > 0 else None
+      self.daily_panchaangas.extend(compute_daily_panchaangas(city=self.city, computation_system=self.computation_system, jd_start=jd_start, day_offsets=list(range(next_offset, end_offset)), compute_lagnas=self.computation_system.festival_options.set_lagnas, previous_day_panchaanga=previous_day_panchaanga))
+
+    panchaanga = Panchaanga.from_daily_panchaangas(city=self.city, start_date=start_date, end_date=end_date, daily_panchaangas=self.daily_panchaangas, computation_system=self.computation_system, year_type=year_type)
+    if not self.computation_system.festival_options.no_fests:
+      panchaanga.update_festival_details(spare_padding_days=True)
+    return panchaanga
+
+
+def stream_daily_panchaangas(city, start_date, end_date, computation_system: ComputationSystem = None, chunk_days=None):
+  """Yields DailyPanchaanga-s from start_date to end_date (both inclusive), with festivals assigned - keeping only a bounded window of days in memory. This suits writing tables for centuries in a single pass.
+
+  Festivals are assigned chunk by chunk (see DailyPanchaangaSeries). So festivals depending on days beyond a chunk and its paddings (eg. ones relative to festivals in a preceding chunk) may differ from those in a Panchaanga spanning the whole period.
+
+  :param chunk_days: The number of days whose festivals are assigned together. None means Panchaanga.STREAM_CHUNK_DAYS.
+  """
+  chunk_days = default_if_none(chunk_days, Panchaanga.STREAM_CHUNK_DAYS)
+  series = DailyPanchaangaSeries(city=city, computation_system=computation_system)
+  num_days = int(end_date - start_date) + 1
+  for chunk_offset in range(0, num_days, chunk_days):
+    chunk_end_offset = min(chunk_offset + chunk_days, num_days) - 1
+    panchaanga = series.get_panchaanga(start_date=start_date + chunk_offset, end_date=start_date + chunk_end_offset)
+    for daily_panchaanga in panchaanga.daily_panchaangas_sorted(skip_padding_days=True):
+      yield daily_panchaanga
+
+
 # Essential for depickling to work.
 common.update_json_class_index(sys.modules[__name__])
@@ -49,8 +49,33 @@ def get_2_day_interval_boundary_angas(kaala, anga_type, p0, p1):
   return angas
 
 
+class ComputationProfile(JsonObject):
+  """Declares which (costlier) parts of daily panchaangas some output needs, so that the rest is not computed.
+  
+  Anga types needed for festival assignment (by the appliers, and by the active rules - see RulesCollection.get_anga_type_ids) are added to the declared ones - see ComputationSystem.get_day_anga_types. 
+  """
+  FESTIVALS_ONLY = None
+  DAY_SUMMARY = None
+  FULL = None
+
+  def __init__(self, name, anga_type_ids, fill_lazy_fields=False):
+    """
+    
+    :param name: 
+    :param anga_type_ids: Names (see AngaType.name) of anga types whose spans are to be computed for every day (see DayAngas).
+    :param fill_lazy_fields: Whether daily attributes computed on first access (moonrise, moonset, mauDhyas) are to be computed upfront - so that they are always serialized. 
+    """
+    super().__init__()
+    self.name = name
+    self.anga_type_ids = anga_type_ids
+    self.fill_lazy_fields = fill_lazy_fields
+
+  def __repr__(self):
+    return self.name
+
+
 class FestivalOptions(JsonObject):
-  def __init__(self, set_lagnas=None, no_fests=None, fest_repos=None, fest_ids_included_unimplemented=None, fest_ids_excluded_unimplemented=None, aparaahna_as_second_half=False, prefer_eight_fold_day_division=False, set_pancha_paxi_activities=None, julian_handling=RulesCollection.JULIAN_TO_GREGORIAN):
+  def __init__(self, set_lagnas=None, no_fests=None, fest_repos=None, fest_ids_included_unimplemented=None, fest_ids_excluded_unimplemented=None, aparaahna_as_second_half=False, prefer_eight_fold_day_division=False, set_pancha_paxi_activities=None, julian_handling=RulesCollection.JULIAN_TO_GREGORIAN, computation_profile=None):
     """
     
     :param set_lagnas: 
@@ -62,6 +87,7 @@ class FestivalOptions(JsonObject):
     :param prefer_eight_fold_day_division: 
     :param set_pancha_paxi_activities: 
     :param julian_handling: 
+    :param computation_profile: A ComputationProfile. None means that spans of all anga types are computed (and other attributes are computed when first accessed). 
     """
     super().__init__()
     self.set_lagnas = set_lagnas
@@ -74,6 +100,7 @@ class FestivalOptions(JsonObject):
     self.fest_ids_included_unimplemented = fest_ids_included_unimplemented
     self.prefer_eight_fold_day_division = prefer_eight_fold_day_division
     self.julian_handling = julian_handling
+    self.computation_profile = computation_profile
 
   def get_repo_mds(self):
     return ["[%s](%s)" % (repo.name, repo.base_url) for repo in self.repos]
@@ -121,8 +148,36 @@ class ComputationSystem(JsonObject):
     self.graha_lopa_measures = GrahaLopaMeasures()
 
   def __repr__(self):
+    computation_profile = self.get_computation_profile()
+    if computation_profile is not None:
+      # Distinguishes (say) precomputed panchaanga files - which lack whatever the profile skips.
+      return "%s__%s__%s" % (self.lunar_month_assigner_type, self.ayanaamsha_id, computation_profile.name)
     return "%s__%s" % (self.lunar_month_assigner_type, self.ayanaamsha_id)
 
+  def get_computation_profile(self):
+    if self.festival_options is None:
+      return None
+    return self.festival_options.computation_profile
+
+  def get_day_anga_types(self):
+    """Anga types whose spans are to be computed for every day, as required by the computation profile and festival rules. 
+    
+    :return: A list of AngaType-s, ordered as in ComputationProfile.FULL.
+    """
+    profile = self.get_computation_profile()
+    if profile is None:
+      anga_type_ids = set(ComputationProfile.FULL.anga_type_ids)
+    else:
+      anga_type_ids = set(profile.anga_type_ids)
+      # Tithi at sunrise is needed for lunar months.
+      anga_type_ids.add(AngaType.TITHI.name)
+      if not self.festival_options.no_fests:
+        # Needed by the hardcoded festival appliers (tithi_festival, vaara etc.)
+        anga_type_ids.update([AngaType.TITHI.name, AngaType.NAKSHATRA.name])
+        rules_collection = RulesCollection.get_cached(repos_tuple=tuple(self.festival_options.repos), julian_handling=self.festival_options.julian_handling)
+        anga_type_ids.update(rules_collection.get_anga_type_ids())
+    return [AngaType.from_name(anga_type_id) for anga_type_id in ComputationProfile.FULL.anga_type_ids if anga_type_id in anga_type_ids]
+
   def to_md(self):
     system_copy = ComputationSystem(lunar_month_assigner_type=self.lunar_month_assigner_type, ayanaamsha_id=self.ayanaamsha_id, festival_options=None)
     return "#### Basic parameters\n```\n%s\n```\n\n%s" % (system_copy.to_string(format="toml"), self.festival_options.to_md())
@@ -150,6 +205,11 @@ def set_constants():
 
   ComputationSystem.DEFAULT = ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180
 
+  ComputationProfile.FESTIVALS_ONLY = ComputationProfile(name="FESTIVALS_ONLY", anga_type_ids=[])
+  # As in writer/table/day_details.py
+  ComputationProfile.DAY_SUMMARY = ComputationProfile(name="DAY_SUMMARY", anga_type_ids=[AngaType.TITHI.name, AngaType.NAKSHATRA.name])
+  ComputationProfile.FULL = ComputationProfile(name="FULL", anga_type_ids=[anga_type.name for anga_type in [AngaType.TITHI, AngaType.NAKSHATRA, AngaType.YOGA, AngaType.KARANA, AngaType.RASHI, AngaType.SIDEREAL_MONTH, AngaType.SOLAR_NAKSH]], fill_lazy_fields=True)
+
   festival_options = FestivalOptions()
   festival_options.repos = [r for r in festival_options.repos if r.name not in ["mahApuruSha/xatra-later", "mahApuruSha/sci-tech", "mahApuruSha/general-indic-non-tropical"]]
   ComputationSystem.TEST = ComputationSystem(lunar_month_assigner_type=LunarMonthAssigner.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA, ayanaamsha_id=Ayanamsha.CHITRA_AT_180, festival_options=festival_options)
@@ -3,6 +3,7 @@ import math
 import sys
 
 import methodtools
+import numpy
 import swisseph as swe
 from scipy.optimize import brentq
 
@@ -61,21 +62,73 @@ class Graha(JsonObject):
       body_id = 10
     return body_id
 
-  @methodtools.lru_cache(maxsize=10)
-  def get_longitude(self, jd, ayanaamsha_id=None):
+  def get_longitude(self, jd, ayanaamsha_id=None, use_chebyshev_ephemeris=None):
     """
     
     :param jd: 
     :param ayanaamsha_id: 
     Default value of ayanaamsha_id here is deliberately None.
+    :param use_chebyshev_ephemeris: Whether to evaluate the longitude from a fitted ChebyshevEphemeris (only for the sun and moon). None means ephemeris.USE_CHEBYSHEV_EPHEMERIS. 
     :return: 
     """
+    if use_chebyshev_ephemeris is None:
+      # Resolved here (rather than in the cached _get_longitude), so that cached values do not outlive a change of ephemeris.USE_CHEBYSHEV_EPHEMERIS.
+      from jyotisha.panchaanga.temporal import ephemeris
+      use_chebyshev_ephemeris = ephemeris.USE_CHEBYSHEV_EPHEMERIS
+    return self._get_longitude(jd=jd, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
+
+  @methodtools.lru_cache(maxsize=10)
+  def _get_longitude(self, jd, ayanaamsha_id, use_chebyshev_ephemeris):
     if ayanaamsha_id is not None:
       from jyotisha.panchaanga.temporal.zodiac import Ayanamsha
-      return (self.get_longitude(jd=jd) - Ayanamsha.singleton(ayanaamsha_id).get_offset(jd)) % 360
+      return (self._get_longitude(jd=jd, ayanaamsha_id=None, use_chebyshev_ephemeris=use_chebyshev_ephemeris) - Ayanamsha.singleton(ayanaamsha_id).get_offset(jd)) % 360
     else:
+      from jyotisha.panchaanga.temporal import ephemeris
+      if ephemeris.should_use(body_name=self.body_name, use_chebyshev_ephemeris=use_chebyshev_ephemeris):
+        return ephemeris.ChebyshevEphemeris.get_cached(self.body_name).get_longitude(jd=jd)
       return swe.calc_ut(jd, self._get_swisseph_id())[0][0]
 
+  def get_longitude_and_speed(self, jd, ayanaamsha_id=None, use_chebyshev_ephemeris=None):
+    """
+    
+    :param jd: 
+    :param ayanaamsha_id: The ayanaamsha offset only affects the longitude - its (tiny) rate of change is ignored in the speed.
+    :param use_chebyshev_ephemeris: As in get_longitude.
+    :return: A (longitude in degrees, speed in degrees per day) tuple.
+    """
+    from jyotisha.panchaanga.temporal import ephemeris
+    if ephemeris.should_use(body_name=self.body_name, use_chebyshev_ephemeris=use_chebyshev_ephemeris):
+      cheb_ephemeris = ephemeris.ChebyshevEphemeris.get_cached(self.body_name)
+      (longitude, speed) = (cheb_ephemeris.get_longitude(jd=jd), cheb_ephemeris.get_speed(jd=jd))
+    else:
+      result = swe.calc_ut(jd, self._get_swisseph_id(), swe.FLG_SPEED)[0]
+      (longitude, speed) = (result[0], result[3])
+    if ayanaamsha_id is not None:
+      from jyotisha.panchaanga.temporal.zodiac import Ayanamsha
+      longitude = (longitude - Ayanamsha.singleton(ayanaamsha_id).get_offset(jd)) % 360
+    return (longitude, speed)
+
+  def get_longitudes(self, jds, ayanaamsha_id=None, use_chebyshev_ephemeris=None):
+    """Batch version of get_longitude.
+    
+    :param jds: A numpy array (or sequence) of julian days. 
+    :param ayanaamsha_id: 
+    Default value of ayanaamsha_id here is deliberately None.
+    :param use_chebyshev_ephemeris: As in get_longitude.
+    :return: A numpy array of longitudes, of the same shape as jds.
+    """
+    jds = numpy.asarray(jds, dtype=float)
+    from jyotisha.panchaanga.temporal import ephemeris
+    if ephemeris.should_use(body_name=self.body_name, use_chebyshev_ephemeris=use_chebyshev_ephemeris):
+      longitudes = ephemeris.ChebyshevEphemeris.get_cached(self.body_name).get_longitudes(jds=jds)
+    else:
+      body_id = self._get_swisseph_id()
+      longitudes = numpy.fromiter((swe.calc_ut(jd, body_id)[0][0] for jd in jds.flat), dtype=float, count=jds.size).reshape(jds.shape)
+    if ayanaamsha_id is not None:
+      from jyotisha.panchaanga.temporal.zodiac import Ayanamsha
+      longitudes = (longitudes - Ayanamsha.singleton(ayanaamsha_id).get_offsets(jds)) % 360
+    return longitudes
+
   @methodtools.lru_cache(maxsize=10)
   def get_longitude_anga(self, jd):
     from jyotisha.panchaanga.temporal import Anga, AngaType
@@ -99,39 +152,33 @@ class Graha(JsonObject):
     MIN_JUMP = min(1, jd_end-jd_start)
     # TODO: Could be tweaked based on planet using a dict?
 
-    curr_L_bracket = jd_start
-    curr_R_bracket = jd_start + MIN_JUMP
-
-    while curr_R_bracket <= jd_end:
-      L_division = math.floor(self.get_longitude(curr_L_bracket,
-                                                     ayanaamsha_id=ayanaamsha_id) / arc_length) + 1
-      R_division = math.floor(self.get_longitude(curr_R_bracket,
-                                                     ayanaamsha_id=ayanaamsha_id) / arc_length) + 1
-
-      if L_division == R_division:
-        curr_R_bracket += MIN_JUMP
+    # Sample the whole grid in one go, and then refine only the brackets where the division changes.
+    num_jumps = math.floor((jd_end - jd_start) / MIN_JUMP) if MIN_JUMP > 0 else 0
+    grid_jds = jd_start + numpy.arange(num_jumps + 1) * MIN_JUMP
+    divisions = numpy.floor(self.get_longitudes(grid_jds, ayanaamsha_id=ayanaamsha_id) / arc_length).astype(int) + 1
+
+    for i in numpy.flatnonzero(divisions[1:] != divisions[:-1]):
+      (curr_L_bracket, curr_R_bracket) = (grid_jds[i], grid_jds[i + 1])
+      (L_division, R_division) = (int(divisions[i]), int(divisions[i + 1]))
+      # We have bracketed a transit!
+      if L_division < R_division:
+        target = R_division
       else:
-        # We have bracketed a transit!
-        if L_division < R_division:
-          target = R_division
-        else:
-          # retrograde transit
-          target = L_division
-        try:
-          def get_longitude_offset(jd):
-            return self.get_longitude(jd=jd, ayanaamsha_id=ayanaamsha_id) + (-target + 1) * arc_length
-
-          # noinspection PyTypeChecker
-          jd_transit = \
-            brentq(get_longitude_offset,
-                   curr_L_bracket, curr_R_bracket)
-          transits += [Transit(body=self.body_name, jd=jd_transit, anga_type=anga_type.name, value_1=L_division, value_2=R_division)]
-          curr_R_bracket += MIN_JUMP
-          curr_L_bracket = jd_transit + MIN_JUMP
-        except ValueError:
-          logging.error('Unable to compute transit of planet;\
-                                   possibly could not bracket correctly!\n')
-          return None
+        # retrograde transit
+        target = L_division
+      try:
+        def get_longitude_offset(jd):
+          return self.get_longitude(jd=jd, ayanaamsha_id=ayanaamsha_id) + (-target + 1) * arc_length
+
+        # noinspection PyTypeChecker
+        jd_transit = \
+          brentq(get_longitude_offset,
+                 curr_L_bracket, curr_R_bracket)
+        transits += [Transit(body=self.body_name, jd=jd_transit, anga_type=anga_type.name, value_1=L_division, value_2=R_division)]
+      except ValueError:
+        logging.error('Unable to compute transit of planet;\
+                                 possibly could not bracket correctly!\n')
+        return None
 
     if len(transits) == 0:
       from jyotisha.panchaanga.temporal.time import ist_timezone
@@ -144,6 +191,14 @@ def longitude_difference(jd, body1, body2):
   return body1.get_longitude_anga(jd=jd) - body2.get_longitude_anga(jd=jd)
 
 
+def longitude_differences(jds, body1, body2):
+  """Batch version of longitude_difference - returns a list of differences, one per jd."""
+  from jyotisha.panchaanga.temporal import Anga, AngaType
+  longitudes_1 = body1.get_longitudes(jds)
+  longitudes_2 = body2.get_longitudes(jds)
+  return [Anga(index=float(l1) + 1, anga_type_id=AngaType.DEGREE.name) - Anga(index=float(l2) + 1, anga_type_id=AngaType.DEGREE.name) for (l1, l2) in zip(longitudes_1, longitudes_2)]
+
+
 def get_star_longitude(star, jd):
   """ Calculate star longitude based on sefstars.txt.
   
@@ -157,5 +212,19 @@ def get_star_longitude(star, jd):
   (long, lat, _, _, _, _) = swe.fixstar_ut(star, jd)[0]
   return long
 
+
+def get_star_longitudes(star, jds):
+  """ Batch version of get_star_longitude - the ephemeris path is set only once.
+  
+  :param star: Example: Spica. 
+  :param jds: A numpy array (or sequence) of julian days.
+  :return: A numpy array of longitudes, of the same shape as jds.
+  """
+  from jyotisha.panchaanga.temporal import data
+  import os
+  swe.set_ephe_path(os.path.dirname(data.__file__))
+  jds = numpy.asarray(jds, dtype=float)
+  return numpy.fromiter((swe.fixstar_ut(star, jd)[0][0] for jd in jds.flat), dtype=float, count=jds.size).reshape(jds.shape)
+
 # Essential for depickling to work.
 common.update_json_class_index(sys.modules[__name__])
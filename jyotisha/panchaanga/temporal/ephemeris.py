@@ -0,0 +1,127 @@
+import logging
+import math
+
+import methodtools
+import numpy
+from numpy.polynomial import chebyshev
+
+from jyotisha.panchaanga.temporal.body import Graha
+
+# Opt-in switch for the Chebyshev backend. Graha.get_longitude and NakshatraDivision.get_anga_float consult this when they are not told explicitly which backend to use.
+USE_CHEBYSHEV_EPHEMERIS = False
+
+# The default allowed approximation error (as verified when fitting every segment).
+MAX_ERROR_ARCSEC = 0.01
+
+
+class ChebyshevEphemeris(object):
+  """Piecewise Chebyshev approximation of the (tropical) longitude of a graha.
+
+  - The time axis is divided into fixed segments (aligned to SEGMENT_EPOCH_JD) - a few days long for the Moon, longer for the Sun.
+  - Each segment is fitted on first use from swe.calc_ut values at Chebyshev nodes. The fit is then checked at points in between the nodes, and the degree is raised until the error is within max_error_arcsec.
+  - Longitudes and speeds are then evaluated from the polynomials alone.
+  """
+  SEGMENT_EPOCH_JD = 2451545.0
+  BODY_TO_SEGMENT_DAYS = {Graha.SUN: 16, Graha.MOON: 4}
+  BODY_TO_DEGREE = {Graha.SUN: 12, Graha.MOON: 13}
+  MAX_DEGREE = 32
+
+  def __init__(self, body_name, segment_days=None, degree=None, max_error_arcsec=MAX_ERROR_ARCSEC):
+    if body_name not in ChebyshevEphemeris.BODY_TO_SEGMENT_DAYS and (segment_days is None or degree is None):
+      raise ValueError("No default segmentation for " + body_name)
+    self.graha = Graha.singleton(body_name)
+    self.segment_days = segment_days if segment_days is not None else ChebyshevEphemeris.BODY_TO_SEGMENT_DAYS[body_name]
+    self.degree = degree if degree is not None else ChebyshevEphemeris.BODY_TO_DEGREE[body_name]
+    self.max_error_arcsec = max_error_arcsec
+    self.segment_index_to_coefficients = {}
+
+  @methodtools.lru_cache(maxsize=None)
+  @classmethod
+  def get_cached(cls, body_name):
+    return ChebyshevEphemeris(body_name=body_name)
+
+  def _get_segment_start(self, segment_index):
+    return ChebyshevEphemeris.SEGMENT_EPOCH_JD + segment_index * self.segment_days
+
+  def _get_segment_indices(self, jds):
+    return numpy.floor((jds - ChebyshevEphemeris.SEGMENT_EPOCH_JD) / self.segment_days).astype(int)
+
+  def _to_segment_x(self, jds, segment_index):
+    """Map jds within a segment to [-1, 1]."""
+    return 2 * (jds - self._get_segment_start(segment_index)) / self.segment_days - 1
+
+  def _get_swe_longitudes(self, jds):
+    return self.graha.get_longitudes(jds, use_chebyshev_ephemeris=False)
+
+  def _fit_segment(self, segment_index):
+    degree = self.degree
+    while True:
+      nodes = numpy.cos(numpy.pi * (numpy.arange(degree + 1) + 0.5) / (degree + 1))
+      jds = self._get_segment_start(segment_index) + (nodes + 1) * self.segment_days / 2
+      longitudes = numpy.unwrap(self._get_swe_longitudes(jds), period=360)
+      coefficients = chebyshev.chebfit(nodes, longitudes, degree)
+
+      # Check at points in between the nodes (and at the segment ends).
+      check_x = numpy.concatenate(([-1, 1], (nodes[1:] + nodes[:-1]) / 2))
+      check_jds = self._get_segment_start(segment_index) + (check_x + 1) * self.segment_days / 2
+      errors = (chebyshev.chebval(check_x, coefficients) - self._get_swe_longitudes(check_jds) + 180) % 360 - 180
+      max_error_arcsec = numpy.max(numpy.abs(errors)) * 3600
+      if max_error_arcsec <= self.max_error_arcsec:
+        return coefficients
+      if degree >= ChebyshevEphemeris.MAX_DEGREE:
+        raise ValueError("Could not fit %s within %f arcsec (got %f) for segment %d" % (self.graha.body_name, self.max_error_arcsec, max_error_arcsec, segment_index))
+      logging.debug("Raising degree for %s segment %d: error %f arcsec", self.graha.body_name, segment_index, max_error_arcsec)
+      degree += 4
+
+  def _get_coefficients(self, segment_index):
+    coefficients = self.segment_index_to_coefficients.get(segment_index, None)
+    if coefficients is None:
+      coefficients = self._fit_segment(segment_index=segment_index)
+      self.segment_index_to_coefficients[segment_index] = coefficients
+    return coefficients
+
+  def fit_period(self, jd_start, jd_end):
+    """Fit all segments covering [jd_start, jd_end] upfront."""
+    for segment_index in range(self._get_segment_indices(jd_start), self._get_segment_indices(jd_end) + 1):
+      self._get_coefficients(segment_index=segment_index)
+
+  def _evaluate(self, jds, derivative_order):
+    jds = numpy.asarray(jds, dtype=float)
+    flat_jds = jds.ravel()
+    segment_indices = self._get_segment_indices(flat_jds)
+    values = numpy.empty(flat_jds.shape)
+    for segment_index in numpy.unique(segment_indices):
+      mask = segment_indices == segment_index
+      coefficients = self._get_coefficients(segment_index=int(segment_index))
+      if derivative_order > 0:
+        # d/d(jd) = d/dx * 2 / segment_days
+        coefficients = chebyshev.chebder(coefficients, m=derivative_order, scl=2.0 / self.segment_days)
+      values[mask] = chebyshev.chebval(self._to_segment_x(flat_jds[mask], int(segment_index)), coefficients)
+    return values.reshape(jds.shape)
+
+  def get_longitudes(self, jds):
+    """Tropical longitudes (in degrees, in [0, 360)) for an array of julian days."""
+    return self._evaluate(jds=jds, derivative_order=0) % 360
+
+  def get_longitude(self, jd):
+    # Scalar path - avoids the array bookkeeping in _evaluate.
+    segment_index = math.floor((jd - ChebyshevEphemeris.SEGMENT_EPOCH_JD) / self.segment_days)
+    x = 2 * (jd - self._get_segment_start(segment_index)) / self.segment_days - 1
+    return float(chebyshev.chebval(x, self._get_coefficients(segment_index=segment_index))) % 360
+
+  def get_speeds(self, jds):
+    """Longitude speeds (in degrees per day) for an array of julian days."""
+    return self._evaluate(jds=jds, derivative_order=1)
+
+  def get_speed(self, jd):
+    return float(self.get_speeds(numpy.array([jd]))[0])
+
+
+def is_supported(body_name):
+  return body_name in ChebyshevEphemeris.BODY_TO_SEGMENT_DAYS
+
+
+def should_use(body_name, use_chebyshev_ephemeris=None):
+  if use_chebyshev_ephemeris is None:
+    use_chebyshev_ephemeris = USE_CHEBYSHEV_EPHEMERIS
+  return use_chebyshev_ephemeris and is_supported(body_name)
@@ -50,16 +50,16 @@ class RuleLookupAssigner(FestivalAssigner):
           self.panchaanga.add_festival(fest_id=festival_name, date=x + offset)
 
   def apply_festival_from_rules_repos(self):
+    # Anga types with no rules are not computed (depending on the computation profile) - see ComputationSystem.get_day_anga_types.
+    anga_types = [anga_type for anga_type in [AngaType.TITHI, AngaType.NAKSHATRA, AngaType.YOGA] if anga_type in self.computation_system.get_day_anga_types()]
     for index, dp in enumerate(self.daily_panchaangas):
       self.apply_month_day_events(day_panchaanga=dp, month_type=RulesRepo.SIDEREAL_SOLAR_MONTH_DIR)
       self.apply_month_day_events(day_panchaanga=dp, month_type=RulesRepo.TROPICAL_MONTH_DIR)
       self.apply_month_day_events(day_panchaanga=dp, month_type=RulesRepo.GREGORIAN_MONTH_DIR)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.SIDEREAL_SOLAR_MONTH_DIR, anga_type=AngaType.TITHI)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.SIDEREAL_SOLAR_MONTH_DIR, anga_type=AngaType.NAKSHATRA)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.SIDEREAL_SOLAR_MONTH_DIR, anga_type=AngaType.YOGA)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.LUNAR_MONTH_DIR, anga_type=AngaType.TITHI)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.LUNAR_MONTH_DIR, anga_type=AngaType.NAKSHATRA)
-      self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.LUNAR_MONTH_DIR, anga_type=AngaType.YOGA)
+      for anga_type in anga_types:
+        self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.SIDEREAL_SOLAR_MONTH_DIR, anga_type=anga_type)
+      for anga_type in anga_types:
+        self.apply_month_anga_events(day_panchaanga=dp, month_type=RulesRepo.LUNAR_MONTH_DIR, anga_type=anga_type)
 
   def apply_month_day_events(self, day_panchaanga, month_type):
     from jyotisha.panchaanga.temporal.festival import rules
@@ -133,7 +133,7 @@ class RuleLookupAssigner(FestivalAssigner):
     date = day_panchaanga.date
     month = day_panchaanga.get_date(month_type=month_type).month
     
-    panchaangas = [self.panchaanga.date_str_to_panchaanga.get((date-2).get_date_str(), None), self.panchaanga.date_str_to_panchaanga.get((date-1).get_date_str(), None), day_panchaanga]
+    panchaangas = [self.panchaanga.daily_panchaanga_for_date(date - 2), self.panchaanga.daily_panchaanga_for_date(date - 1), day_panchaanga]
     if panchaangas[1] is None:
       # We require atleast 1 day history.
       return
@@ -1,6 +1,8 @@
 import codecs
+import hashlib
 import logging
 import os
+import pickle
 import sys
 from pathlib import Path
 
@@ -11,7 +13,7 @@ from curation_utils import file_helper
 from sanskrit_data import collection_helper
 from timebudget import timebudget
 
-from jyotisha import custom_transliteration
+from jyotisha import custom_transliteration, util
 from jyotisha.panchaanga.temporal import names
 from sanskrit_data.schema import common
 from indic_transliteration import sanscript
@@ -316,21 +318,92 @@ class RulesRepo(common.JsonObject):
 
 
 class RulesCollection(common.JsonObject):
+  """Festival rules read from the toml files of some RulesRepo-s.
+  
+  Reading thousands of toml files takes several seconds. So the rules (along with the tree index) may also be pickled into a snapshot file in snapshot_dir - one per set of repos, julian_handling and source of this module (where the pickled classes are defined) - which is loaded instead on subsequent constructions. The snapshot is rebuilt when the manifest (paths, modification times and sizes) of the toml files changes.
+  """
   JULIAN_AS_GREGORIAN = "treated as Gregorian"
   JULIAN_TO_GREGORIAN = "converted to Gregorian"
+  DEFAULT_SNAPSHOT_DIR = os.path.expanduser("~/Documents/jyotisha/rules_snapshots")
+  # The snapshot_dir of collections made by get_cached. None means that snapshots are not used. Set (eg. to DEFAULT_SNAPSHOT_DIR) before first use - as long running or frequently started programs (the rest api, bots, generation scripts) do.
+  SNAPSHOT_DIR = None
 
+  def __init__(self, repos, julian_handling=JULIAN_TO_GREGORIAN, snapshot_dir=None):
+    """
 
-  def __init__(self, repos, julian_handling=JULIAN_TO_GREGORIAN):
+    :param snapshot_dir: Where rules snapshots are stored. None disables snapshots. 
+    """
     super().__init__()
     self.repos = repos
     self.name_to_rule = {}
     self.tree = None 
-    self.set_rule_dicts(julian_handling=julian_handling)
+    if snapshot_dir is None:
+      self.set_rule_dicts(julian_handling=julian_handling)
+      return
+    snapshot_path = self._get_snapshot_path(snapshot_dir=snapshot_dir, julian_handling=julian_handling)
+    manifest_digest = self.get_manifest_digest()
+    if not self._load_snapshot(snapshot_path=snapshot_path, manifest_digest=manifest_digest):
+      self.set_rule_dicts(julian_handling=julian_handling)
+      self._dump_snapshot(snapshot_path=snapshot_path, manifest_digest=manifest_digest)
 
   @methodtools.lru_cache()  # the order is important!
   @classmethod
   def get_cached(cls, repos_tuple, julian_handling=JULIAN_TO_GREGORIAN):
-    return RulesCollection(repos=repos_tuple, julian_handling=julian_handling)
+    return RulesCollection(repos=repos_tuple, julian_handling=julian_handling, snapshot_dir=RulesCollection.SNAPSHOT_DIR)
+
+  def _get_rule_dirs(self):
+    return [os.path.join(DATA_ROOT, repo.get_path()) for repo in self.repos]
+
+  def get_manifest_digest(self):
+    """A digest of the paths, modification times and sizes of the rule toml files - much cheaper to compute than reading them."""
+    digest = hashlib.sha1()
+    for dir_path in self._get_rule_dirs():
+      digest.update(("%s\n" % dir_path).encode("utf-8"))
+      for file_path in sorted(Path(dir_path).glob("**/*.toml")):
+        file_stat = file_path.stat()
+        digest.update(("%s\t%d\t%d\n" % (file_path, file_stat.st_mtime_ns, file_stat.st_size)).encode("utf-8"))
+    return digest.hexdigest()
+
+  def _get_snapshot_path(self, snapshot_dir, julian_handling):
+    # Snapshots pickled with other versions of the rule classes are thus never loaded.
+    with open(__file__, "rb") as fp:
+      source_digest = hashlib.sha1(fp.read()).hexdigest()
+    key = hashlib.sha1(repr(([(repo.name, dir_path) for (repo, dir_path) in zip(self.repos, self._get_rule_dirs())], julian_handling, source_digest)).encode("utf-8")).hexdigest()
+    return os.path.join(snapshot_dir, "rules__%s.pickle" % key)
+
+  def _load_snapshot(self, snapshot_path, manifest_digest):
+    """
+
+    :return: True if an up-to-date snapshot was loaded.
+    """
+    if not os.path.isfile(snapshot_path):
+      return False
+    try:
+      with open(snapshot_path, "rb") as fp:
+        snapshot = pickle.load(fp)
+    except Exception as e:
+      logging.warning("Ignoring unreadable rules snapshot %s: %s", snapshot_path, e)
+      return False
+    if snapshot.get("manifest_digest", None) != manifest_digest:
+      logging.info("Rules snapshot %s is stale.", snapshot_path)
+      return False
+    self.name_to_rule = snapshot["name_to_rule"]
+    self.tree = snapshot["tree"]
+    return True
+
+  def _dump_snapshot(self, snapshot_path, manifest_digest):
+    snapshot = {"manifest_digest": manifest_digest, "name_to_rule": self.name_to_rule, "tree": self.tree}
+    # Written to a temporary file and then moved, so that concurrent processes never read a partial snapshot.
+    temp_path = "%s.%d.tmp" % (snapshot_path, os.getpid())
+    try:
+      os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+      with open(temp_path, "wb") as fp:
+        util.pickle_dump(obj=snapshot, fp=fp)
+      os.replace(temp_path, snapshot_path)
+    except (EnvironmentError, pickle.PicklingError):
+      logging.warning("Not able to save %s.", snapshot_path)
+      if os.path.exists(temp_path):
+        os.remove(temp_path)
 
   def fix_content(self):
     for repo in self.repos:
@@ -376,6 +449,15 @@ class RulesCollection(common.JsonObject):
     from sanskrit_data import collection_helper
     self.tree = collection_helper.tree_maker(leaves=self.name_to_rule.values(), path_fn=lambda x: x.get_storage_file_name(base_dir="", undo_conversions=False).replace(".toml", ""))
 
+  @methodtools.lru_cache(maxsize=None)
+  def get_anga_type_ids(self):
+    """Anga types (as in AngaType.name) by which some rule in this collection is timed."""
+    anga_type_ids = set()
+    for rule in self.name_to_rule.values():
+      if rule.timing is not None and rule.timing.anga_type in [RulesRepo.TITHI_DIR, RulesRepo.NAKSHATRA_DIR, RulesRepo.YOGA_DIR]:
+        anga_type_ids.add(rule.timing.anga_type.upper())
+    return frozenset(anga_type_ids)
+
   def get_month_anga_fests(self, month_type, month, anga_type_id, anga):
     if int(month) != month:
       # Deal with adhika mAsas
@@ -1,5 +1,6 @@
 
 import sys
+from collections import namedtuple
 from math import floor
 from numbers import Number
 
@@ -106,37 +107,108 @@ class AngaSpan(Interval):
                              time.ist_timezone.julian_day_to_local_time_str(jd=self.jd_end))
 
 
-class FifteenFoldDivision(common.JsonObject):
+# A read-only (and cheap) stand-in for an AngaSpan - as in month-annotated tithi spans; see Panchaanga.get_interval_anga_spans.
+AngaSpanView = namedtuple("AngaSpanView", ["jd_start", "jd_end", "anga"])
+
+
+# Boundaries of a day, from which the kaalas of LazyDayDivision-s are computed. 
+DayBoundaries = namedtuple("DayBoundaries", ["jd_previous_sunset", "jd_sunrise", "jd_sunset", "jd_next_sunrise", "weekday"])
+
+
+class LazyDayDivision(common.JsonObject):
+  """A division of a day into named kaalas (intervals etc.), each computed only when first accessed - from DayBoundaries. Festival rules, for example, touch only a handful of kaalas.
+  
+  Computed kaalas are stored as attributes (of the same name) - so only those are serialized, unless fill_lazy_fields is called. Subclasses list their kaalas in KAALA_TO_COMPUTER, a dict from the attribute name to a function of DayBoundaries. 
+  """
+  KAALA_TO_COMPUTER = {}
+
+  def __init__(self, day_boundaries):
+    super(LazyDayDivision, self).__init__()
+    self.set_day_boundaries(day_boundaries=day_boundaries)
+
+  def set_day_boundaries(self, day_boundaries):
+    """Also used to enable lazy computation in deserialized objects (which have only the kaalas computed before serialization)."""
+    # Protected attributes are not serialized.
+    self._day_boundaries = day_boundaries
+    for value in self.__dict__.values():
+      if isinstance(value, LazyDayDivision):
+        value.set_day_boundaries(day_boundaries=day_boundaries)
+
+  def has_day_boundaries(self):
+    return self.__dict__.get("_day_boundaries", None) is not None
+
+  def __getattr__(self, name):
+    # Only called if name is not found in the usual places (eg. self.__dict__).
+    if name in self.KAALA_TO_COMPUTER and self.has_day_boundaries():
+      value = self.KAALA_TO_COMPUTER[name](self._day_boundaries)
+      if isinstance(value, Interval):
+        value.name = names.python_to_devanaagarii[name]
+      self.__dict__[name] = value
+      return value
+    return super(LazyDayDivision, self).__getattr__(name)
+
+  def fill_lazy_fields(self):
+    """Compute all kaalas (so that they get serialized)."""
+    for name in self.KAALA_TO_COMPUTER.keys():
+      value = getattr(self, name)
+      if isinstance(value, LazyDayDivision):
+        value.fill_lazy_fields()
+
+
+def _get_day_interval(part_index, num_parts):
+  return lambda b: get_interval(start_jd=b.jd_sunrise, end_jd=b.jd_sunset, part_index=part_index, num_parts=num_parts)
+
+
+def _get_night_interval(part_index, num_parts):
+  return lambda b: get_interval(start_jd=b.jd_sunset, end_jd=b.jd_next_sunrise, part_index=part_index, num_parts=num_parts)
+
+
+def _get_preceding_night_interval(part_index, num_parts):
+  return lambda b: get_interval(start_jd=b.jd_previous_sunset, end_jd=b.jd_sunrise, part_index=part_index, num_parts=num_parts)
+
+
+def _get_durmuhurta2(b):
+  DURMUHURTA2 = (None, 11, 21, None, 11, 8, 2)
+  if DURMUHURTA2[b.weekday] is None:
+    return None
+  elif DURMUHURTA2[b.weekday] > 15:
+    return get_interval(start_jd=b.jd_sunset, end_jd=b.jd_sunrise, part_index=DURMUHURTA2[b.weekday] - 15, num_parts=15)
+  else:
+    return get_interval(start_jd=b.jd_sunrise, end_jd=b.jd_sunset, part_index=DURMUHURTA2[b.weekday], num_parts=15)
+
+
+class FifteenFoldDivision(LazyDayDivision):
   """
   "दे॒वस्य॑ सवि॒तुᳶ प्रा॒तᳶ प्र॑स॒वᳶ प्रा॒णः" इत्यादेर् ब्राह्मणस्य भाष्ये सायणो विभागम् इमम् इच्छति।(See comments under TbSayanaMuhuurta.)
   
   """
-  def __init__(self, jd_previous_sunset, jd_sunrise, jd_sunset, jd_next_sunrise, weekday):
-    super(FifteenFoldDivision, self).__init__()
-    self.preceding_arunodaya = get_interval(start_jd=jd_previous_sunset, end_jd=jd_sunrise, part_index=[13, 14], num_parts=15)
+  DURMUHURTA1 = (13, 8, 3, 7, 5, 3, 1)
+
+  KAALA_TO_COMPUTER = {
+    "preceding_arunodaya": _get_preceding_night_interval(part_index=[13, 14], num_parts=15),
     # Technically, the following is preceding braahma
-    self.braahma = get_interval(start_jd=jd_previous_sunset, end_jd=jd_sunrise, part_index=13, num_parts=15)
-    self.praatah = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=5)
-    self.saangava = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=1, num_parts=5)
-    self.madhyaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=2, num_parts=5)
-    self.aparaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=3, num_parts=5)
-    self.saayaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=4, num_parts=5)
+    "braahma": _get_preceding_night_interval(part_index=13, num_parts=15),
+    "praatah": _get_day_interval(part_index=0, num_parts=5),
+    "saangava": _get_day_interval(part_index=1, num_parts=5),
+    "madhyaahna": _get_day_interval(part_index=2, num_parts=5),
+    "aparaahna": _get_day_interval(part_index=3, num_parts=5),
+    "saayaahna": _get_day_interval(part_index=4, num_parts=5),
 
-    self.praatas_sandhyaa = get_interval(start_jd=jd_previous_sunset, end_jd=jd_sunrise, part_index=14, num_parts=15) + get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=range(0,4), num_parts=15)
-    self.maadhyaahnika_sandhyaa = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=range(5,13), num_parts=15)
-    self.saayam_sandhyaa = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=14, num_parts=15) + get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=15)
+    "praatas_sandhyaa": lambda b: _get_preceding_night_interval(part_index=14, num_parts=15)(b) + _get_day_interval(part_index=range(0, 4), num_parts=15)(b),
+    "maadhyaahnika_sandhyaa": _get_day_interval(part_index=range(5, 13), num_parts=15),
+    "saayam_sandhyaa": lambda b: _get_day_interval(part_index=14, num_parts=15)(b) + _get_night_interval(part_index=0, num_parts=15)(b),
 
     # प्रदोषोस्तमयादूर्ध्वं घटिकाद्व्यमिष्यते॥
     # प्रदोषोस्तमयादूर्ध्वं घटिकात्रयमिष्यते॥
     # पुरुषार्थचिन्तामणौ अस्तमयादूर्ध्वं यामार्धकालः प्रदोषः इति सिद्धान्तितम्।
     # घटिकाद्व्यत्रयादिवचनानां यामार्धान्तर्गतप्रथमघटिकाद्वयादिप्राशस्त्यपरत्वं च प्रतिपादितम्॥
-    self.pradosha = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=8)
-    self.madhyaraatri = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=2, num_parts=5)
-    self.nishiitha = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=7, num_parts=15)
+    "pradosha": _get_night_interval(part_index=0, num_parts=8),
+    "madhyaraatri": _get_night_interval(part_index=2, num_parts=5),
+    "nishiitha": _get_night_interval(part_index=7, num_parts=15),
 
-    self.shraadhaarambha_mukhya = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=7, num_parts=15)
-    self.shraadhaarambha_gauna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=6, num_parts=15)
-    self.shraadha_kaala = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=range(7, 12), num_parts=15)
+    "shraadhaarambha_mukhya": _get_day_interval(part_index=7, num_parts=15),
+    "shraadhaarambha_gauna": _get_day_interval(part_index=6, num_parts=15),
+    "shraadha_kaala": _get_day_interval(part_index=range(7, 12), num_parts=15),
 
     # रौद्रश्चैत्रस्तथा मैत्रस्तथा सालकटः स्मृतः ।
     # सावित्रश्च जयन्तश्च गान्धर्वः कुतपस्तथा ।
@@ -149,21 +221,21 @@ class FifteenFoldDivision(common.JsonObject):
     # रोहिणस्तिलकश्चैव विभवो निर्ऋतिस्तथा । 
     # शंबरो विजयश्चैव भेदाः पञ्चदशः स्मृताः ॥ 
     # (इति पुराणे (जयसिंहकल्पद्रुमे))
-    self.raudra = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=15)
-    self.chaitra = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=1, num_parts=15)
-    self.maitra = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=2, num_parts=15)
-    self.saalakata = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=3, num_parts=15)
-    self.saavitra = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=4, num_parts=15)
-    self.jayanta = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=5, num_parts=15)
-    self.gaandharva = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=6, num_parts=15)
-    self.kutapa = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=7, num_parts=15)
-    self.rauhina = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=8, num_parts=15)
-    self.virinchi = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=9, num_parts=15)
-    self.vijaya = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=10, num_parts=15)
-    self.nairrita = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=11, num_parts=15)
-    self.mahendra = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=12, num_parts=15)
-    self.varuna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=13, num_parts=15)
-    self.bodha = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=14, num_parts=15)
+    "raudra": _get_day_interval(part_index=0, num_parts=15),
+    "chaitra": _get_day_interval(part_index=1, num_parts=15),
+    "maitra": _get_day_interval(part_index=2, num_parts=15),
+    "saalakata": _get_day_interval(part_index=3, num_parts=15),
+    "saavitra": _get_day_interval(part_index=4, num_parts=15),
+    "jayanta": _get_day_interval(part_index=5, num_parts=15),
+    "gaandharva": _get_day_interval(part_index=6, num_parts=15),
+    "kutapa": _get_day_interval(part_index=7, num_parts=15),
+    "rauhina": _get_day_interval(part_index=8, num_parts=15),
+    "virinchi": _get_day_interval(part_index=9, num_parts=15),
+    "vijaya": _get_day_interval(part_index=10, num_parts=15),
+    "nairrita": _get_day_interval(part_index=11, num_parts=15),
+    "mahendra": _get_day_interval(part_index=12, num_parts=15),
+    "varuna": _get_day_interval(part_index=13, num_parts=15),
+    "bodha": _get_day_interval(part_index=14, num_parts=15),
 
     # शंकरश्चाजपाच्चैव तथाऽहिर्बुध्न्यपूषकौ ।
     # आश्विनो याम्यवाह्नेयौ वैधात्रश्चान्द्र एव च ।
@@ -176,41 +248,32 @@ class FifteenFoldDivision(common.JsonObject):
     # आदितेयोऽथ जैवश्च वैष्णवः सौर एव च ।
     # ब्राह्मो नाभस्वतश्चैव मुहूर्ताः क्रमशो निशि ॥ 
     # (इति वीरमित्रोदय-आह्निकप्रकाशे)
-    self.shankara = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=15)
-    self.ajapaat = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=1, num_parts=15)
-    self.ahirbudhnya = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=2, num_parts=15)
-    self.puushaka = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=3, num_parts=15)
-    self.aashvina = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=4, num_parts=15)
-    self.yaamyava = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=5, num_parts=15)
-    self.aahneya = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=6, num_parts=15)
-    self.vaidhaatra = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=7, num_parts=15)
-    self.chaandra = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=8, num_parts=15)
-    self.aaditeya = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=9, num_parts=15)
-    self.jaiva = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=10, num_parts=15)
-    self.vaishnava = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=11, num_parts=15)
-    self.saura = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=12, num_parts=15)
-    self.succeeding_braahma = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=13, num_parts=15)
-    self.naabhasvata = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=14, num_parts=15)
-
-    DURMUHURTA1 = (13, 8, 3, 7, 5, 3, 1)
-    DURMUHURTA2 = (None, 11, 21, None, 11, 8, 2)
-    self.durmuhurta1 = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset,
-                             part_index=DURMUHURTA1[weekday], num_parts=15)
-    if DURMUHURTA2[weekday] is None:
-      self.durmuhurta2 = None
-    elif DURMUHURTA2[weekday] > 15:
-      self.durmuhurta2 = get_interval(start_jd=jd_sunset, end_jd=jd_sunrise, part_index=DURMUHURTA2[weekday] - 15, num_parts=15)
-    else:
-      self.durmuhurta2 = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=DURMUHURTA2[weekday], num_parts=15)
+    "shankara": _get_night_interval(part_index=0, num_parts=15),
+    "ajapaat": _get_night_interval(part_index=1, num_parts=15),
+    "ahirbudhnya": _get_night_interval(part_index=2, num_parts=15),
+    "puushaka": _get_night_interval(part_index=3, num_parts=15),
+    "aashvina": _get_night_interval(part_index=4, num_parts=15),
+    "yaamyava": _get_night_interval(part_index=5, num_parts=15),
+    "aahneya": _get_night_interval(part_index=6, num_parts=15),
+    "vaidhaatra": _get_night_interval(part_index=7, num_parts=15),
+    "chaandra": _get_night_interval(part_index=8, num_parts=15),
+    "aaditeya": _get_night_interval(part_index=9, num_parts=15),
+    "jaiva": _get_night_interval(part_index=10, num_parts=15),
+    "vaishnava": _get_night_interval(part_index=11, num_parts=15),
+    "saura": _get_night_interval(part_index=12, num_parts=15),
+    "succeeding_braahma": _get_night_interval(part_index=13, num_parts=15),
+    "naabhasvata": _get_night_interval(part_index=14, num_parts=15),
+
+    "durmuhurta1": lambda b: get_interval(start_jd=b.jd_sunrise, end_jd=b.jd_sunset, part_index=FifteenFoldDivision.DURMUHURTA1[b.weekday], num_parts=15),
+    "durmuhurta2": _get_durmuhurta2,
+    "tb_muhuurtas": lambda b: FifteenFoldDivision.get_tb_muhuurtas(jd_sunrise=b.jd_sunrise, jd_sunset=b.jd_sunset),
+  }
 
-    self.tb_muhuurtas = None
-    self.compute_tb_muhuurtas(jd_sunrise=jd_sunrise, jd_sunset=jd_sunset)
-
-    for attr_name, obj in self.__dict__.items():
-      if isinstance(obj, Interval):
-        obj.name = names.python_to_devanaagarii[attr_name]
+  def __init__(self, jd_previous_sunset, jd_sunrise, jd_sunset, jd_next_sunrise, weekday):
+    super(FifteenFoldDivision, self).__init__(day_boundaries=DayBoundaries(jd_previous_sunset=jd_previous_sunset, jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise, weekday=weekday))
 
-  def compute_tb_muhuurtas(self, jd_sunrise, jd_sunset):
+  @classmethod
+  def get_tb_muhuurtas(cls, jd_sunrise, jd_sunset):
     """ Computes muhuurta-s according to taittiriiya brAhmaNa.
     """
     tb_muhuurtas = []
@@ -220,70 +283,61 @@ class FifteenFoldDivision(common.JsonObject):
       tb_muhuurtas.append(TbSayanaMuhuurta(
         jd_start=jd_start, jd_end=jd_end,
         muhuurta_id=muhuurta_id))
-    self.tb_muhuurtas = tb_muhuurtas
+    return tb_muhuurtas
+
+  def compute_tb_muhuurtas(self, jd_sunrise, jd_sunset):
+    self.tb_muhuurtas = FifteenFoldDivision.get_tb_muhuurtas(jd_sunrise=jd_sunrise, jd_sunset=jd_sunset)
 
   def get_virile_intervals(self):
     return [x for x in self.tb_muhuurtas if not x.is_nirviirya]
 
 
-
-class EightFoldDivision(common.JsonObject):
+class EightFoldDivision(LazyDayDivision):
   """
   "दे॒वस्य॑ सवि॒तुᳶ प्रा॒तᳶ प्र॑स॒वᳶ प्रा॒णः" इत्यादेर् ब्राह्मणस्य भाष्ये प्रत्येकः कालो दिवसास्याष्टमो भागः कश्चनेति भट्टभास्करः। तन्मते सायाह्णो नाम प्रदोषः। अयम् मतो श्रुत्यनुगुणतरो विभाति।
   
   """
+  RAHUKALA_SLICES = [7, 1, 6, 4, 5, 3, 2]
+  # Every graha has an upagraha
+  # सूर्यः – कालः
+  # चन्द्रः – परिधिः/परिवेषः
+  # मङ्गलः – मृत्युः/धूमः
+  # बुधः – अर्धप्रहरः
+  # गुरुः – यमघण्टः
+  # शुक्रः – कोदण्डः
+  # शनैश्चरः – गुलिकः/कुलिकः/मान्दिः
+  # राहुः – पातः
+  # केतुः – उपकेतुः
+  #
+  # The day is divided into eight folds: first section is for the adhipati of the day, and so on.
+  # So, yamaghanta on Sunday is slice 4 (beginning from 0) - last fold is ignored.
+  # The night is also divided into eight folds: first section is for the fifth graha beginning 
+  # from the adhipati of the day - last fold is ignored. So, yamaghanta on Sunday is slice 0.
+  YAMAGHANTA_SLICES = [4, 3, 2, 1, 0, 6, 5]
+  YAMAGHANTA_SLICES_NIGHT = [0, 6, 5, 4, 3, 2, 1]
+  GULIKAKALA_SLICES = [6, 5, 4, 3, 2, 1, 0]
+  GULIKAKALA_SLICES_NIGHT = [2, 1, 0, 6, 5, 4, 3]
+
+  KAALA_TO_COMPUTER = {
+    "raahu": lambda b: _get_day_interval(part_index=EightFoldDivision.RAHUKALA_SLICES[b.weekday], num_parts=8)(b),
+    "yama": lambda b: _get_day_interval(part_index=EightFoldDivision.YAMAGHANTA_SLICES[b.weekday], num_parts=8)(b),
+    "gulika": lambda b: _get_day_interval(part_index=EightFoldDivision.GULIKAKALA_SLICES[b.weekday], num_parts=8)(b),
+    "raatri_gulika": lambda b: _get_night_interval(part_index=EightFoldDivision.GULIKAKALA_SLICES_NIGHT[b.weekday], num_parts=8)(b),
+    "raatri_yama": lambda b: _get_night_interval(part_index=EightFoldDivision.YAMAGHANTA_SLICES_NIGHT[b.weekday], num_parts=8)(b),
+    "raatri_yaama": lambda b: [_get_night_interval(part_index=i, num_parts=4)(b) for i in range(4)],
+    "ahar_yaama": lambda b: [_get_day_interval(part_index=i, num_parts=4)(b) for i in range(4)],
+    "shayana": _get_night_interval(part_index=3, num_parts=8),
+    "dinaanta": _get_night_interval(part_index=5, num_parts=8),
+
+    "praatah": _get_day_interval(part_index=0, num_parts=8),
+    "saangava": _get_day_interval(part_index=2, num_parts=8),
+    "madhyaahna": _get_day_interval(part_index=4, num_parts=8),
+    "aparaahna": _get_day_interval(part_index=6, num_parts=8),
+    "saayaahna": _get_night_interval(part_index=0, num_parts=8),
+  }
+
   def __init__(self, jd_sunrise, jd_sunset, jd_next_sunrise, weekday):
-    super(EightFoldDivision, self).__init__()
-    RAHUKALA_SLICES = [7, 1, 6, 4, 5, 3, 2]
-    # Every graha has an upagraha
-    # सूर्यः – कालः
-    # चन्द्रः – परिधिः/परिवेषः
-    # मङ्गलः – मृत्युः/धूमः
-    # बुधः – अर्धप्रहरः
-    # गुरुः – यमघण्टः
-    # शुक्रः – कोदण्डः
-    # शनैश्चरः – गुलिकः/कुलिकः/मान्दिः
-    # राहुः – पातः
-    # केतुः – उपकेतुः
-    #
-    # The day is divided into eight folds: first section is for the adhipati of the day, and so on.
-    # So, yamaghanta on Sunday is slice 4 (beginning from 0) - last fold is ignored.
-    # The night is also divided into eight folds: first section is for the fifth graha beginning 
-    # from the adhipati of the day - last fold is ignored. So, yamaghanta on Sunday is slice 0.
-    YAMAGHANTA_SLICES = [4, 3, 2, 1, 0, 6, 5]
-    YAMAGHANTA_SLICES_NIGHT = [0, 6, 5, 4, 3, 2, 1]
-    GULIKAKALA_SLICES = [6, 5, 4, 3, 2, 1, 0]
-    GULIKAKALA_SLICES_NIGHT = [2, 1, 0, 6, 5, 4, 3]
-    self.raahu = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset,
-                              part_index=RAHUKALA_SLICES[weekday], num_parts=8)
-    self.yama = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset,
-                             part_index=YAMAGHANTA_SLICES[weekday], num_parts=8)
-    self.gulika = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset,
-                               part_index=GULIKAKALA_SLICES[weekday], num_parts=8)
-    self.raatri_gulika = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise,
-                               part_index=GULIKAKALA_SLICES_NIGHT[weekday], num_parts=8)
-    self.raatri_yama = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise,
-                               part_index=YAMAGHANTA_SLICES_NIGHT[weekday], num_parts=8)
-    self.raatri_yaama = [get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=4),
-                         get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=1, num_parts=4),
-                         get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=2, num_parts=4),
-                         get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=3, num_parts=4)]
-    self.ahar_yaama = [get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=4),
-                       get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=1, num_parts=4),
-                       get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=2, num_parts=4),
-                       get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=3, num_parts=4)]
-    self.shayana = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=3, num_parts=8)
-    self.dinaanta = get_interval(jd_sunset, end_jd=jd_next_sunrise, part_index=5, num_parts=8)
-
-    self.praatah = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=8)
-    self.saangava = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=2, num_parts=8)
-    self.madhyaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=4, num_parts=8)
-    self.aparaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=6, num_parts=8)
-    self.saayaahna = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=8)
-
-    for attr_name, obj in self.__dict__.items():
-      if isinstance(obj, Interval):
-        obj.name = names.python_to_devanaagarii[attr_name]
+    super(EightFoldDivision, self).__init__(day_boundaries=DayBoundaries(jd_previous_sunset=None, jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise, weekday=weekday))
 
   def get_virile_intervals(self):
     return [self.praatah, self.saangava, self.madhyaahna, self.aparaahna, self.saayaahna]
@@ -292,27 +346,20 @@ class EightFoldDivision(common.JsonObject):
     return [self.raahu, self.yama, self.gulika]
 
 
-class DayLengthBasedPeriods(common.JsonObject):
+class DayLengthBasedPeriods(LazyDayDivision):
+  # Compute the various day_length_based_periods
+  # Sunrise/sunset and related stuff (like rahu, yama)
+  KAALA_TO_COMPUTER = {
+    "dinamaana": _get_day_interval(part_index=0, num_parts=1),
+    "puurvaahna": _get_day_interval(part_index=0, num_parts=2),
+    "aparaahna": _get_day_interval(part_index=1, num_parts=2),
+    "raatrimaana": _get_night_interval(part_index=0, num_parts=1),
+    "eight_fold_division": lambda b: EightFoldDivision(jd_sunrise=b.jd_sunrise, jd_sunset=b.jd_sunset, jd_next_sunrise=b.jd_next_sunrise, weekday=b.weekday),
+    "fifteen_fold_division": lambda b: FifteenFoldDivision(jd_previous_sunset=b.jd_previous_sunset, jd_sunrise=b.jd_sunrise, jd_sunset=b.jd_sunset, jd_next_sunrise=b.jd_next_sunrise, weekday=b.weekday),
+  }
+
   def __init__(self, jd_previous_sunset, jd_sunrise, jd_sunset, jd_next_sunrise, weekday):
-    # Compute the various day_length_based_periods
-    # Sunrise/sunset and related stuff (like rahu, yama)
-
-    super().__init__()
-
-    self.dinamaana = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=1)
-    self.puurvaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=0, num_parts=2)
-    self.aparaahna = get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, part_index=1, num_parts=2)
-    self.raatrimaana = get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, part_index=0, num_parts=1)
-    self.eight_fold_division = EightFoldDivision(jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise, weekday=weekday)
-    self.fifteen_fold_division = FifteenFoldDivision(jd_previous_sunset=jd_previous_sunset, jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise, weekday=weekday)
-
-    for attr_name, obj in self.__dict__.items():
-      if isinstance(obj, Interval):
-        if obj.name is not None:
-          name = obj.name
-        else:
-          name = attr_name
-        obj.name = names.python_to_devanaagarii[name]
+    super().__init__(day_boundaries=DayBoundaries(jd_previous_sunset=jd_previous_sunset, jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise, weekday=weekday))
 
 
 class TbSayanaMuhuurta(Interval):
@@ -0,0 +1,138 @@
+"""Julian day <-> (proleptic) Gregorian calendar conversions by plain arithmetic.
+
+Based on Meeus' Astronomical Algorithms (chapter 7), with the Gregorian correction applied throughout (ie. no switch to the Julian calendar before 1582 - matching astropy/ erfa). Valid for non-negative julian days (ie. from 4713 BCE onwards).
+
+Times are UTC, with days of 86400 seconds. Astropy (which stretches UTC days bearing a leap second to 86401 seconds) is used only for validation - see astropy_jd_to_gregorian and astropy_gregorian_to_jd.
+"""
+import datetime
+from math import floor
+
+import numpy
+
+NANOSECONDS_PER_DAY = 86400 * 10 ** 9
+MICROSECONDS_PER_DAY = 86400 * 10 ** 6
+
+# Julian day number of 0001-01-01 (proleptic Gregorian) is 1721426 - its datetime ordinal being 1.
+JDN_OF_ORDINAL_0 = 1721425
+
+
+def jdn_to_civil(jdn):
+  """Meeus' algorithm for the (proleptic Gregorian) civil date starting at noon of julian day number jdn. Works on ints as well as numpy int arrays."""
+  alpha = (jdn * 4 - 7468865) // 146097  # floor((Z - 1867216.25)/36524.25)
+  a = jdn + 1 + alpha - alpha // 4
+  b = a + 1524
+  c = (b * 100 - 12210) // 36525  # floor((B - 122.1)/365.25)
+  d = (c * 36525) // 100  # floor(365.25 C)
+  e = ((b - d) * 10000) // 306001  # floor((B - D)/30.6001)
+  day = b - d - (e * 306001) // 10000
+  month = e - 1 - 12 * (e // 14)
+  year = c - 4716 + (month <= 2)
+  return (year, month, day)
+
+
+def civil_to_jdn(year, month, day):
+  """Inverse of jdn_to_civil. Works on ints as well as numpy int arrays."""
+  january_or_february = month <= 2
+  year = year - january_or_february
+  month = month + 12 * january_or_february
+  a = year // 100
+  b = 2 - a + a // 4
+  return ((year + 4716) * 1461) // 4 + ((month + 1) * 306001) // 10000 + day + b - 1524
+
+
+def split_jd(jd, units_per_day=NANOSECONDS_PER_DAY):
+  """Split a julian day into the number of the (civil, midnight-to-midnight) day and the (rounded) number of units (nanoseconds by default) since its midnight."""
+  day_number = floor(jd + 0.5)
+  units = round((jd + 0.5 - day_number) * units_per_day)
+  if units >= units_per_day:
+    day_number += 1
+    units -= units_per_day
+  return (day_number, units)
+
+
+def split_jds(jds, units_per_day=NANOSECONDS_PER_DAY):
+  """Vectorized version of split_jd."""
+  jds = numpy.asarray(jds, dtype=float)
+  day_numbers = numpy.floor(jds + 0.5)
+  units = numpy.round((jds + 0.5 - day_numbers) * units_per_day).astype(numpy.int64)
+  return (day_numbers.astype(numpy.int64) + units // units_per_day, units % units_per_day)
+
+
+def jd_to_gregorian(jd):
+  """
+
+  :param jd: Julian day (UTC)
+  :return: (year, month, day, hour, minute, second) tuple, with second being a float rounded to the nanosecond.
+  """
+  (day_number, nanoseconds) = split_jd(jd)
+  (year, month, day) = jdn_to_civil(day_number)
+  (seconds, fraction_nanoseconds) = divmod(nanoseconds, 10 ** 9)
+  (minutes, second) = divmod(seconds, 60)
+  (hour, minute) = divmod(minutes, 60)
+  return (year, month, day, hour, minute, second + fraction_nanoseconds / 10 ** 9)
+
+
+def gregorian_to_jd(year, month, day, hour=0, minute=0, second=0):
+  return civil_to_jdn(year, month, day) - 0.5 + (hour * 3600 + minute * 60 + second) / 86400.0
+
+
+def jd_to_datetime(jd):
+  """Naive (UTC) datetime, rounded to the microsecond."""
+  (day_number, microseconds) = split_jd(jd, units_per_day=MICROSECONDS_PER_DAY)
+  return datetime.datetime.fromordinal(day_number - JDN_OF_ORDINAL_0) + datetime.timedelta(microseconds=microseconds)
+
+
+def datetime_to_jd(dt):
+  """
+
+  :param dt: A naive datetime is taken to be in UTC.
+  :return:
+  """
+  if dt.tzinfo is not None:
+    dt = dt.replace(tzinfo=None) - dt.utcoffset()
+  return gregorian_to_jd(year=dt.year, month=dt.month, day=dt.day, hour=dt.hour, minute=dt.minute, second=dt.second + dt.microsecond / 1e6)
+
+
+def jd_to_weekday(jd):
+  """Sunday is 0."""
+  return (floor(jd + 0.5) + 1) % 7
+
+
+def jds_to_gregorian(jds):
+  """Vectorized version of jd_to_gregorian.
+
+  :param jds: Array of julian days.
+  :return: (years, months, days, hours, minutes, seconds) tuple of arrays.
+  """
+  (day_numbers, nanoseconds) = split_jds(jds)
+  (years, months, days) = jdn_to_civil(day_numbers)
+  (seconds, fraction_nanoseconds) = numpy.divmod(nanoseconds, 10 ** 9)
+  (minutes, seconds) = numpy.divmod(seconds, 60)
+  (hours, minutes) = numpy.divmod(minutes, 60)
+  return (years, months, days, hours, minutes, seconds + fraction_nanoseconds / 10 ** 9)
+
+
+def gregorian_to_jds(years, months, days, hours=0, minutes=0, seconds=0):
+  """Vectorized version of gregorian_to_jd."""
+  jdns = civil_to_jdn(numpy.asarray(years, dtype=numpy.int64), numpy.asarray(months, dtype=numpy.int64), numpy.asarray(days, dtype=numpy.int64))
+  return jdns - 0.5 + (numpy.asarray(hours) * 3600 + numpy.asarray(minutes) * 60 + numpy.asarray(seconds)) / 86400.0
+
+
+def jds_to_weekdays(jds):
+  return (numpy.floor(numpy.asarray(jds, dtype=float) + 0.5).astype(numpy.int64) + 1) % 7
+
+
+def astropy_jd_to_gregorian(jd):
+  """Reference implementation of jd_to_gregorian, for validation."""
+  from astropy.time import Time
+  tm = Time(jd, format='jd')
+  tm.format = "ymdhms"
+  return (int(tm.value["year"]), int(tm.value["month"]), int(tm.value["day"]), int(tm.value["hour"]), int(tm.value["minute"]), tm.value["second"])
+
+
+def astropy_gregorian_to_jd(year, month, day, hour=0, minute=0, second=0):
+  """Reference implementation of gregorian_to_jd, for validation."""
+  from astropy.time import Time
+  tm = Time({"year": year, "month": month, "day": day, "hour": hour, "minute": minute, "second": second}, format='ymdhms')
+  tm.format = "jd"
+  return tm.value
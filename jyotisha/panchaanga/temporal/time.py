@@ -1,5 +1,5 @@
+import bisect
 import datetime
-import datetime as dt_module
 import logging
 import sys
 import traceback
@@ -7,9 +7,10 @@ from math import modf
 from numbers import Number
 
 import methodtools
+import numpy
 import pytz
-from astropy.time import Time
 
+from jyotisha.panchaanga.temporal import julian_day
 from jyotisha.util import zero_if_none
 from sanskrit_data.schema import common
 from sanskrit_data.schema.common import JsonObject
@@ -159,27 +160,39 @@ class Date(BasicDate):
   def to_datetime(self):
     return datetime.datetime(year=self.year, month=self.month, day=self.day, hour=zero_if_none(self.hour), minute=zero_if_none(self.minute), second=int(zero_if_none(self.second)), microsecond=self.get_microseconds())
 
+  def get_day_ordinal(self):
+    """(Proleptic Gregorian) julian day number of this date - consecutive dates have consecutive ordinals."""
+    return julian_day.civil_to_jdn(self.year, self.month, self.day)
+
+  def _get_microsecond_key(self):
+    """Microseconds since the start of day ordinal 0 - truncated to the microsecond like to_datetime(), so that comparisons agree with those of datetimes."""
+    return self.get_day_ordinal() * julian_day.MICROSECONDS_PER_DAY + ((zero_if_none(self.hour) * 60 + zero_if_none(self.minute)) * 60 + int(zero_if_none(self.second))) * 10 ** 6 + self.get_microseconds()
+
   def __sub__(self, other):
     if isinstance(other, Date):
-      dt_diff = self.to_datetime() - other.to_datetime()
-      return dt_diff.days + dt_diff.seconds / 3600.0 + dt_diff.microseconds / 60.0 / 1e6
+      # Same as with datetime subtraction below, but with integer arithmetic.
+      # dt_diff = self.to_datetime() - other.to_datetime()
+      # return dt_diff.days + dt_diff.seconds / 3600.0 + dt_diff.microseconds / 60.0 / 1e6
+      (days, microseconds) = divmod(self._get_microsecond_key() - other._get_microsecond_key(), julian_day.MICROSECONDS_PER_DAY)
+      (seconds, microseconds) = divmod(microseconds, 10 ** 6)
+      return days + seconds / 3600.0 + microseconds / 60.0 / 1e6
     elif isinstance(other, Number):
       return self.offset_date(days=-other)
 
   def __lt__(self, other):
-    return self.to_datetime() < other.to_datetime()
+    return self._get_microsecond_key() < other._get_microsecond_key()
 
   def __eq__(self, other):
-    return self.to_datetime() == other.to_datetime()
+    return self._get_microsecond_key() == other._get_microsecond_key()
 
   def __le__(self, other):
-    return self.__lt__(other) or self.__eq__(other)
+    return self._get_microsecond_key() <= other._get_microsecond_key()
 
   def __gt__(self, other):
-    return self.to_datetime() > other.to_datetime()
+    return self._get_microsecond_key() > other._get_microsecond_key()
 
   def __ge__(self, other):
-    return self.__gt__(other) or self.__eq__(other)
+    return self._get_microsecond_key() >= other._get_microsecond_key()
 
   def __add__(self, other):
     if isinstance(other, Number):
@@ -227,6 +240,11 @@ class Date(BasicDate):
     return Date(year=date_tuple[0], month=date_tuple[1], day=date_tuple[2])
 
   def offset_date(self, **kwargs):
+    if len(kwargs) == 1 and "days" in kwargs and kwargs["days"] == int(kwargs["days"]):
+      # Whole day offsets (the common case) - without constructing datetimes. Time fields are normalized as in the general case below.
+      (year, month, day) = julian_day.jdn_to_civil(self.get_day_ordinal() + int(kwargs["days"]))
+      second = int(zero_if_none(self.second)) + self.get_microseconds() / float(1e6)
+      return Date(year=year, month=month, day=day, hour=zero_if_none(self.hour) or None, minute=zero_if_none(self.minute) or None, second=second or None)
     dt = self.to_datetime()
     offset_dt = dt + datetime.timedelta(**kwargs)
     offset_date = Date.from_datetime(dt=offset_dt)
@@ -252,7 +270,8 @@ class Date(BasicDate):
     return [self.year, self.month, self.day, fractional_hour]
 
   def get_weekday(self):
-    return dt_module.date(year=self.year, month=self.month, day=self.day).isoweekday() % 7
+    # Sunday is 0.
+    return (self.get_day_ordinal() + 1) % 7
 
   def sanitize(self):
     (year, month, day, hour, minute, second) = (self.year, self.month, self.day, self.hour, self.minute, self.second)
@@ -281,7 +300,7 @@ class Date(BasicDate):
     return repr(self.to_datetime())
 
   def __hash__(self):
-    return hash(repr(self))
+    return hash(self._get_microsecond_key())
 
   def get_hour_str(self, format='hh:mm', rounding=False, reference_date=None):
     hour = self.get_fractional_hour()
@@ -292,27 +311,68 @@ class Date(BasicDate):
 
 
 def jd_to_utc_gregorian(jd):
-  tm = Time(jd, format='jd')
-  tm.format = "ymdhms"
-  return Date(year=int(tm.value["year"]), month=int(tm.value["month"]), day=int(tm.value["day"]),
-              hour=int(tm.value["hour"]), minute=int(tm.value["minute"]), second=tm.value["second"])
+  (year, month, day, hour, minute, second) = julian_day.jd_to_gregorian(jd)
+  return Date(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
 
 
 def utc_gregorian_to_jd(date):
   if date.hour is None:
     date.set_time_to_day_start()
-  tm = Time(
-    {"year": date.year, "month": date.month, "day": date.day, "hour": zero_if_none(date.hour), "minute": zero_if_none(date.minute), "second": zero_if_none(date.second)},
-    format='ymdhms')
-  tm.format = "jd"
-  return tm.value
+  return julian_day.gregorian_to_jd(year=date.year, month=date.month, day=date.day, hour=zero_if_none(date.hour), minute=zero_if_none(date.minute), second=zero_if_none(date.second))
 
 
 def get_weekday(jd):
-  tm = Time(jd, format='jd')
-  tm.format = "datetime"
   # Sunday should be 0.
-  return tm.value.isocalendar()[2] % 7
+  return julian_day.jd_to_weekday(jd)
+
+
+def _datetime_to_microsecond_key(dt):
+  """Microseconds since the start of julian day number 0 (ie. -4713-11-24 00:00 proleptic Gregorian)."""
+  return (dt.toordinal() + julian_day.JDN_OF_ORDINAL_0) * julian_day.MICROSECONDS_PER_DAY + ((dt.hour * 60 + dt.minute) * 60 + dt.second) * 10 ** 6 + dt.microsecond
+
+
+class UtcOffsetTable(object):
+  """Sorted table of UTC offset transitions of a timezone, read off the tz database (as packaged by pytz).
+  
+  Transition times are kept as integer microsecond keys (see _datetime_to_microsecond_key) - so that lookups (by bisection) exactly match pytz's fromutc (which bisects over microsecond-resolution datetimes).
+  """
+
+  def __init__(self, timezone_id):
+    self.timezone_id = timezone_id
+    tz = pytz.timezone(timezone_id)
+    utc_transition_times = getattr(tz, "_utc_transition_times", None)
+    if utc_transition_times is None:
+      # Fixed offset timezones (pytz.StaticTzInfo or UTC).
+      self.transition_keys = [_datetime_to_microsecond_key(datetime.datetime.min)]
+      self.tzinfos = [tz]
+      offsets = [tz.utcoffset(None)]
+    else:
+      self.transition_keys = [_datetime_to_microsecond_key(transition_time) for transition_time in utc_transition_times]
+      self.tzinfos = [tz._tzinfos[transition_info] for transition_info in tz._transition_info]
+      offsets = [transition_info[0] for transition_info in tz._transition_info]
+    self.offsets_microseconds = [(offset.days * 86400 + offset.seconds) * 10 ** 6 + offset.microseconds for offset in offsets]
+    self.transition_keys_array = numpy.array(self.transition_keys, dtype=numpy.int64)
+    self.offsets_microseconds_array = numpy.array(self.offsets_microseconds, dtype=numpy.int64)
+
+  @methodtools.lru_cache(maxsize=None)
+  @classmethod
+  def get_cached(cls, timezone_id):
+    return UtcOffsetTable(timezone_id=timezone_id)
+
+  def get_index(self, utc_key):
+    return max(0, bisect.bisect_right(self.transition_keys, utc_key) - 1)
+
+  def get_indices(self, utc_keys):
+    return numpy.maximum(0, numpy.searchsorted(self.transition_keys_array, utc_keys, side="right") - 1)
+
+
+def _local_microsecond_key_to_date(local_key):
+  (day_number, microseconds) = divmod(local_key, julian_day.MICROSECONDS_PER_DAY)
+  (year, month, day) = julian_day.jdn_to_civil(day_number)
+  (seconds, microsecond) = divmod(microseconds, 10 ** 6)
+  (minutes, second) = divmod(seconds, 60)
+  (hour, minute) = divmod(minutes, 60)
+  return Date(year, month, day, hour, minute, second + microsecond / 1000000.0)
 
 
 class Timezone:
@@ -324,44 +384,58 @@ class Timezone:
   def get_cached(cls, timezone_id):
     return Timezone(timezone_id=timezone_id)
 
+  def _get_utc_key_and_offset_index(self, jd):
+    (day_number, microseconds) = julian_day.split_jd(jd, units_per_day=julian_day.MICROSECONDS_PER_DAY)
+    utc_key = day_number * julian_day.MICROSECONDS_PER_DAY + microseconds
+    offset_table = UtcOffsetTable.get_cached(timezone_id=self.timezone_id)
+    return (utc_key, offset_table, offset_table.get_index(utc_key=utc_key))
+
   def get_timezone_offset_hours_from_jd(self, jd: float):
     """Get timezone offset in hours east of UTC (negative west of UTC)
 
     Timezone offset is dependent both on place and time (yes- time, not just date) - due to Daylight savings time.
     compute offset from UTC in hours
     """
-    local_datetime = self.julian_day_to_local_datetime(jd=jd)
-    return (datetime.datetime.utcoffset(local_datetime).days * 86400 +
-            datetime.datetime.utcoffset(local_datetime).seconds) / 3600.0
+    (_, offset_table, index) = self._get_utc_key_and_offset_index(jd=jd)
+    return offset_table.offsets_microseconds[index] / 1e6 / 3600.0
 
   def julian_day_to_local_time(self, julian_day: float, round_seconds: bool = False) -> Date:
-    local_datetime = self.julian_day_to_local_datetime(jd=julian_day)
-    local_time = Date(
-    local_datetime.year, local_datetime.month, local_datetime.day, local_datetime.hour, local_datetime.minute,
-    local_datetime.second + local_datetime.microsecond / 1000000.0)
+    (utc_key, offset_table, index) = self._get_utc_key_and_offset_index(jd=julian_day)
+    local_time = _local_microsecond_key_to_date(local_key=utc_key + offset_table.offsets_microseconds[index])
     if round_seconds:
       (y, m, dt, hours, minutes, seconds) = local_time.as_tuple()
       local_time = Date(y, m, dt, hours, minutes, int(round(seconds)))
     return local_time
 
+  def julian_days_to_local_times(self, jds, round_seconds: bool = False):
+    """Batch version of julian_day_to_local_time.
+    
+    :param jds: Array of julian days.
+    :return: A list of Date objects. 
+    """
+    (day_numbers, microseconds) = julian_day.split_jds(jds, units_per_day=julian_day.MICROSECONDS_PER_DAY)
+    utc_keys = day_numbers * julian_day.MICROSECONDS_PER_DAY + microseconds
+    offset_table = UtcOffsetTable.get_cached(timezone_id=self.timezone_id)
+    local_keys = utc_keys + offset_table.offsets_microseconds_array[offset_table.get_indices(utc_keys=utc_keys)]
+    local_times = [_local_microsecond_key_to_date(local_key=int(local_key)) for local_key in local_keys]
+    if round_seconds:
+      local_times = [Date(y, m, dt, hours, minutes, int(round(seconds))) for (y, m, dt, hours, minutes, seconds) in [local_time.as_tuple() for local_time in local_times]]
+    return local_times
+
   def julian_day_to_local_datetime(self, jd):
-    tm = Time(jd, format='jd')
-    tm.format = "datetime"
-    return pytz.timezone(self.timezone_id).fromutc(tm.value)
+    (utc_key, offset_table, index) = self._get_utc_key_and_offset_index(jd=jd)
+    (day_number, microseconds) = divmod(utc_key + offset_table.offsets_microseconds[index], julian_day.MICROSECONDS_PER_DAY)
+    local_datetime = datetime.datetime.fromordinal(day_number - julian_day.JDN_OF_ORDINAL_0) + datetime.timedelta(microseconds=microseconds)
+    return local_datetime.replace(tzinfo=offset_table.tzinfos[index])
 
   def local_time_to_julian_day(self, date):
     microseconds, _ = modf(zero_if_none(date.second) * 1000000)
     local_datetime = pytz.timezone(self.timezone_id).localize(
       datetime.datetime(date.year, date.month, date.day, zero_if_none(date.hour), zero_if_none(date.minute), int(zero_if_none(date.second)), int(microseconds)))
-    tm = Time(local_datetime, format="datetime")
-    tm.format = "jd"
-    return tm.value
+    return julian_day.datetime_to_jd(local_datetime)
 
   def julian_day_to_local_time_str(self, jd):
-    tm = Time(jd, format='jd')
-    tm.format = "datetime"
-    local_datetime = pytz.timezone(self.timezone_id).fromutc(tm.value)
-    return str(local_datetime)
+    return str(self.julian_day_to_local_datetime(jd=jd))
 
   def current_time_as_int(self):
     local_datetime = datetime.datetime.now(tz=pytz.timezone(self.timezone_id))    
@@ -1,4 +1,6 @@
+import bisect
 import logging
+import os
 import sys
 from math import floor
 from numbers import Number
@@ -24,13 +26,104 @@ logging.basicConfig(
 )
 
 
+def _interpolate_cubic(grid, indices, t):
+  """4 point Lagrange interpolation between grid[indices] and grid[indices + 1], at fraction t. Works for scalars as well as numpy arrays."""
+  return (-t * (t - 1) * (t - 2) / 6 * grid[indices - 1] + (t + 1) * (t - 1) * (t - 2) / 2 * grid[indices] - (t + 1) * t * (t - 2) / 2 * grid[indices + 1] + (t + 1) * t * (t - 1) / 6 * grid[indices + 2])
+
+
+class AyanaamshaOffsetTable(object):
+  """Precomputed ayanaamsha offsets on a daily grid, interpolated in between.
+  
+  - Grids cover a block of BLOCK_DAYS days each (counted from J2000), and are computed only when some jd within the block is first asked for. 
+  - Grids are kept in memory. They are persisted (as .npy files) only if a cache_dir is given - see CACHE_DIR.
+  - Cubic (4 point Lagrange) interpolation is used. For the chitrA offset, the dominant short-period term is the ~0.2 arcsec 13.66 day nutation term, which bounds the interpolation error to ~1e-4 arcsec (see MAX_ERROR_ARCSEC).
+  """
+  GRID_STEP_DAYS = 1.0
+  BLOCK_DAYS = 366
+  EPOCH_JD = 2451545.0
+  # Grid points on either side of the block, needed for interpolation near its ends.
+  PADDING = 2
+  MAX_ERROR_ARCSEC = 0.001
+  # The cache_dir of tables made by get_cached. None means that grids are not persisted. Set (eg. to os.path.expanduser("~/Documents/jyotisha/ayanaamsha_tables")) before first use, to have grids reused across processes.
+  CACHE_DIR = None
+
+  def __init__(self, ayanaamsha_id, cache_dir=None):
+    """
+
+    :param cache_dir: Directory where grids are persisted. None means that they are not. 
+    """
+    self.ayanaamsha_id = ayanaamsha_id
+    self.cache_dir = cache_dir
+    self.block_to_grid = {}
+
+  @methodtools.lru_cache(maxsize=None)
+  @classmethod
+  def get_cached(cls, ayanaamsha_id):
+    return AyanaamshaOffsetTable(ayanaamsha_id=ayanaamsha_id, cache_dir=AyanaamshaOffsetTable.CACHE_DIR)
+
+  def _get_block_start_jd(self, block):
+    return AyanaamshaOffsetTable.EPOCH_JD + block * AyanaamshaOffsetTable.BLOCK_DAYS
+
+  def _get_grid_jds(self, block):
+    num_points = int(AyanaamshaOffsetTable.BLOCK_DAYS / AyanaamshaOffsetTable.GRID_STEP_DAYS) + 2 * AyanaamshaOffsetTable.PADDING + 1
+    return self._get_block_start_jd(block) + (numpy.arange(num_points) - AyanaamshaOffsetTable.PADDING) * AyanaamshaOffsetTable.GRID_STEP_DAYS
+
+  def _get_cache_path(self, block):
+    return os.path.join(self.cache_dir, "%s__%d__%d__%g.npy" % (self.ayanaamsha_id, AyanaamshaOffsetTable.BLOCK_DAYS, block, AyanaamshaOffsetTable.GRID_STEP_DAYS))
+
+  def _get_grid(self, block):
+    grid = self.block_to_grid.get(block, None)
+    if grid is not None:
+      return grid
+    grid_jds = self._get_grid_jds(block=block)
+    if self.cache_dir is not None:
+      cache_path = self._get_cache_path(block=block)
+      if os.path.isfile(cache_path):
+        grid = numpy.load(cache_path)
+        if grid.shape != grid_jds.shape:
+          logging.warning("Ignoring malformed ayanaamsha table %s", cache_path)
+          grid = None
+    if grid is None:
+      grid = Ayanamsha.singleton(self.ayanaamsha_id).get_exact_offsets(jds=grid_jds)
+      if self.cache_dir is not None:
+        try:
+          os.makedirs(self.cache_dir, exist_ok=True)
+          numpy.save(cache_path, grid)
+        except EnvironmentError:
+          logging.warning("Not able to save %s.", cache_path)
+    self.block_to_grid[block] = grid
+    return grid
+
+  def get_offsets(self, jds):
+    jds = numpy.asarray(jds, dtype=float)
+    flat_jds = jds.ravel()
+    blocks = numpy.floor((flat_jds - AyanaamshaOffsetTable.EPOCH_JD) / AyanaamshaOffsetTable.BLOCK_DAYS).astype(int)
+    offsets = numpy.empty(flat_jds.shape)
+    for block in numpy.unique(blocks):
+      mask = blocks == block
+      grid = self._get_grid(block=int(block))
+      positions = (flat_jds[mask] - self._get_block_start_jd(int(block))) / AyanaamshaOffsetTable.GRID_STEP_DAYS + AyanaamshaOffsetTable.PADDING
+      indices = numpy.floor(positions).astype(int)
+      t = positions - indices
+      offsets[mask] = _interpolate_cubic(grid=grid, indices=indices, t=t)
+    return offsets.reshape(jds.shape)
+
+  def get_offset(self, jd):
+    block = floor((jd - AyanaamshaOffsetTable.EPOCH_JD) / AyanaamshaOffsetTable.BLOCK_DAYS)
+    grid = self._get_grid(block=block)
+    position = (jd - self._get_block_start_jd(block)) / AyanaamshaOffsetTable.GRID_STEP_DAYS + AyanaamshaOffsetTable.PADDING
+    index = floor(position)
+    t = position - index
+    return float(_interpolate_cubic(grid=grid, indices=index, t=t))
+
+
 class Ayanamsha(common.JsonObject):
   """
   
   rAShTriya panchAnga nakshatra ayanAmsha vs chitra at 180 :
   - Shaves off 3 seconds from typical panchaanga computation compared to precise chitrA tracking.
   - rAShTriya panchAnga nakshatra ayanAmsha tracks chitra fairly well. Still, it results in ~5 minutes differences in nakshatra spans.
-  - chitrA does not move a lot in typical year, and it is mostly wasteful to compute its position fresh for every instant.
+  - chitrA does not move a lot in typical year, and it is mostly wasteful to compute its position fresh for every instant. Hence chitrA offsets are read off an AyanaamshaOffsetTable.
   """
   VERNAL_EQUINOX_AT_0 = "VERNAL_EQUINOX_AT_0"
   CHITRA_AT_180 = "CHITRA_AT_180"
@@ -50,9 +143,7 @@ class Ayanamsha(common.JsonObject):
     if self.ayanaamsha_id == Ayanamsha.VERNAL_EQUINOX_AT_0:
       return 0
     elif self.ayanaamsha_id == Ayanamsha.CHITRA_AT_180:
-      # TODO: The below fails due to https://github.com/astrorigin/pyswisseph/issues/35
-      from jyotisha.panchaanga.temporal import body
-      return body.get_star_longitude(star="Spica", jd=jd) - 180
+      return AyanaamshaOffsetTable.get_cached(ayanaamsha_id=self.ayanaamsha_id).get_offset(jd=jd)
     elif self.ayanaamsha_id == Ayanamsha.ASHVINI_STARTING_0:
       return 0
     elif self.ayanaamsha_id == Ayanamsha.RASHTRIYA_PANCHANGA_NAKSHATRA_TRACKING:
@@ -60,6 +151,27 @@ class Ayanamsha(common.JsonObject):
       return swe.get_ayanamsa_ut(jd)
     raise Exception("Bad ayanamsha_id")
 
+  def get_offsets(self, jds):
+    """Batch version of get_offset - returns a numpy array of offsets, of the same shape as jds."""
+    jds = numpy.asarray(jds, dtype=float)
+    if self.ayanaamsha_id in (Ayanamsha.VERNAL_EQUINOX_AT_0, Ayanamsha.ASHVINI_STARTING_0):
+      return numpy.zeros(jds.shape)
+    elif self.ayanaamsha_id == Ayanamsha.CHITRA_AT_180:
+      return AyanaamshaOffsetTable.get_cached(ayanaamsha_id=self.ayanaamsha_id).get_offsets(jds=jds)
+    elif self.ayanaamsha_id == Ayanamsha.RASHTRIYA_PANCHANGA_NAKSHATRA_TRACKING:
+      swe.set_sid_mode(swe.SIDM_LAHIRI)
+      return numpy.fromiter((swe.get_ayanamsa_ut(jd) for jd in jds.flat), dtype=float, count=jds.size).reshape(jds.shape)
+    raise Exception("Bad ayanamsha_id")
+
+  def get_exact_offsets(self, jds):
+    """Like get_offsets, but without any table lookup - each offset is computed afresh."""
+    if self.ayanaamsha_id == Ayanamsha.CHITRA_AT_180:
+      # TODO: The below fails due to https://github.com/astrorigin/pyswisseph/issues/35
+      from jyotisha.panchaanga.temporal import body
+      return body.get_star_longitudes(star="Spica", jds=jds) - 180
+    else:
+      return self.get_offsets(jds=jds)
+
 
 class NakshatraDivision(common.JsonObject):
   """Nakshatra division at a certain time, according to a certain ayanaamsha."""
@@ -108,12 +220,13 @@ class NakshatraDivision(common.JsonObject):
   def longitude_to_fractional_division(self, longitude, anga_type):
     return (longitude % 360) / anga_type.arc_length
 
-  def get_anga_float(self, anga_type):
+  def get_anga_float(self, anga_type, use_chebyshev_ephemeris=None):
     """Returns the anga/ temporal property. Computed based on lunar and solar longitudes, division of a circle into a certain number of degrees (arc_len).
 
       Args:
         :param anga_type: One of the pre-defined tuple-valued constants in the panchaanga
         class, such as TITHI, nakshatra, YOGA, KARANA or SIDEREAL_MONTH
+        :param use_chebyshev_ephemeris: Whether to use the fitted ChebyshevEphemeris for solar and lunar longitudes. None means ephemeris.USE_CHEBYSHEV_EPHEMERIS.
 
       Returns:
         float anga
@@ -131,16 +244,51 @@ class NakshatraDivision(common.JsonObject):
 
     #  Get the lunar longitude, starting at the ayanaamsha point in the ecliptic.
     if w_moon != 0:
-      lmoon = Graha.singleton(Graha.MOON).get_longitude(self.jd, ayanaamsha_id=ayanaamsha_id)
+      lmoon = Graha.singleton(Graha.MOON).get_longitude(self.jd, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
       lcalc += w_moon * lmoon
 
     #  Get the solar longitude, starting at the ayanaamsha point in the ecliptic.
     if w_sun != 0:
-      lsun = Graha.singleton(Graha.SUN).get_longitude(self.jd, ayanaamsha_id=ayanaamsha_id)
+      lsun = Graha.singleton(Graha.SUN).get_longitude(self.jd, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
       lcalc += w_sun * lsun
 
     return self.longitude_to_fractional_division(longitude=lcalc, anga_type=anga_type)
 
+  def get_anga_float_and_speed(self, anga_type, use_chebyshev_ephemeris=None):
+    """Like get_anga_float, but also returns the rate of change of the anga float (in angas per day).
+    
+    :return: (anga_float, anga_speed) tuple
+    """
+    if anga_type == AngaType.TITHI:
+      # For efficiency - avoid lookups.
+      ayanaamsha_id = Ayanamsha.VERNAL_EQUINOX_AT_0
+    else:
+      ayanaamsha_id = self.ayanaamsha_id
+
+    lcalc = 0
+    speed = 0
+    for (weight, graha_id) in [(anga_type.weight_moon, Graha.MOON), (anga_type.weight_sun, Graha.SUN)]:
+      if weight != 0:
+        (longitude, longitude_speed) = Graha.singleton(graha_id).get_longitude_and_speed(self.jd, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
+        lcalc += weight * longitude
+        speed += weight * longitude_speed
+    return (self.longitude_to_fractional_division(longitude=lcalc, anga_type=anga_type), speed / anga_type.arc_length)
+
+  @classmethod
+  def get_anga_floats(cls, jds, anga_type, ayanaamsha_id, use_chebyshev_ephemeris=None):
+    """Batch version of get_anga_float - returns a numpy array of anga floats, one per jd in jds."""
+    if anga_type == AngaType.TITHI:
+      # For efficiency - avoid lookups.
+      ayanaamsha_id = Ayanamsha.VERNAL_EQUINOX_AT_0
+
+    jds = numpy.asarray(jds, dtype=float)
+    lcalc = numpy.zeros(jds.shape)
+    if anga_type.weight_moon != 0:
+      lcalc += anga_type.weight_moon * Graha.singleton(Graha.MOON).get_longitudes(jds, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
+    if anga_type.weight_sun != 0:
+      lcalc += anga_type.weight_sun * Graha.singleton(Graha.SUN).get_longitudes(jds, ayanaamsha_id=ayanaamsha_id, use_chebyshev_ephemeris=use_chebyshev_ephemeris)
+    return (lcalc % 360) / anga_type.arc_length
+
   def get_anga(self, anga_type):
     """Returns the anga prevailing at a particular time. Computed based on lunar and solar longitudes, division of a circle into a certain number of degrees (arc_len).
 
@@ -216,15 +364,31 @@ def ecliptic_to_equatorial(longitude, latitude):
 
 
 class AngaSpanFinder(JsonObject):
-  def __init__(self, ayanaamsha_id, anga_type):
+  """Finds spans (start and end times) of angas.
+  
+  Anga boundaries can be located with one of two solvers:
+  - BRACKETING: step forward in half-anga increments till the target anga is bracketed, and then use brentq.
+  - NEWTON: start from a mean-motion prediction of the boundary, and use Newton iterations with the longitude speeds from the ephemeris. Converges in 2-4 evaluations typically. Falls back to BRACKETING if it does not converge.
+  """
+  BRACKETING = "BRACKETING"
+  NEWTON = "NEWTON"
+  # The solver to be used by finders whose solver is None.
+  DEFAULT_SOLVER = BRACKETING
+  MAX_NEWTON_ITERATIONS = 10
+  # Grid points (at half-anga steps) sampled per batch call by the BRACKETING solver - ie. 4 anga spans.
+  GRID_CHUNK_STEPS = 8
+
+  def __init__(self, ayanaamsha_id, anga_type, solver=None, time_tolerance_days=1e-7):
     super(AngaSpanFinder, self).__init__()
     self.ayanaamsha_id = ayanaamsha_id
     self.anga_type = anga_type
+    self.solver = solver
+    self.time_tolerance_days = time_tolerance_days
 
   @methodtools.lru_cache(maxsize=None)
   @classmethod
-  def get_cached(cls, ayanaamsha_id, anga_type):
-    return AngaSpanFinder(ayanaamsha_id=ayanaamsha_id, anga_type=anga_type)
+  def get_cached(cls, ayanaamsha_id, anga_type, solver=None):
+    return AngaSpanFinder(ayanaamsha_id=ayanaamsha_id, anga_type=anga_type, solver=solver)
 
   def _get_anga(self, jd):
     return NakshatraDivision(jd, ayanaamsha_id=self.ayanaamsha_id).get_anga( anga_type=self.anga_type)
@@ -244,25 +408,62 @@ class AngaSpanFinder(JsonObject):
     except ValueError:
       return None
 
+  def _get_angas(self, jds):
+    """Batch version of _get_anga."""
+    anga_floats = NakshatraDivision.get_anga_floats(jds=jds, anga_type=self.anga_type, ayanaamsha_id=self.ayanaamsha_id)
+    return [Anga.get_cached(index=int(1 + floor(anga_float)), anga_type_id=self.anga_type.name) for anga_float in anga_floats]
+
+  def _find_anga_start_newton(self, jd1, jd2, target_anga):
+    """
+    
+    :return: (converged, jd_start) tuple. jd_start is None if the target anga does not start within [jd1, jd2]. 
+    """
+    num_angas = self.anga_type.num_angas
+    target_boundary = target_anga.index - 1
+    anga_float = NakshatraDivision(jd1, ayanaamsha_id=self.ayanaamsha_id).get_anga_float(anga_type=self.anga_type)
+    # Mean-motion prediction of the next time the target boundary is crossed.
+    jd = jd1 + ((target_boundary - anga_float) % num_angas) * self.anga_type.mean_period_days / num_angas
+    for _ in range(AngaSpanFinder.MAX_NEWTON_ITERATIONS):
+      (anga_float, anga_speed) = NakshatraDivision(jd, ayanaamsha_id=self.ayanaamsha_id).get_anga_float_and_speed(anga_type=self.anga_type)
+      if anga_speed <= 0:
+        return (False, None)
+      # Signed distance (in angas) from the target boundary, in [-num_angas/2, num_angas/2).
+      offset = (anga_float - target_boundary + num_angas / 2) % num_angas - num_angas / 2
+      step = offset / anga_speed
+      jd = jd - step
+      if abs(step) < self.time_tolerance_days:
+        if jd < jd1:
+          # Should not happen since the prediction looks forward from jd1. Let the bracketing solver handle it. 
+          return (False, None)
+        return (True, jd if jd <= jd2 else None)
+    return (False, None)
+
   def find_anga_start_between(self, jd1, jd2, target_anga):
     jd_start = None
+    if jd1 > jd2:
+      return jd_start
+    if default_if_none(self.solver, AngaSpanFinder.DEFAULT_SOLVER) == AngaSpanFinder.NEWTON:
+      (converged, jd_start) = self._find_anga_start_newton(jd1=jd1, jd2=jd2, target_anga=target_anga)
+      if converged:
+        return jd_start
+      logging.debug("Newton iterations failed for %s between %f and %f. Falling back to bracketing.", str(target_anga), jd1, jd2)
     num_angas = self.anga_type.num_angas
     min_step = 0.5 * self.anga_type.mean_period_days/num_angas  # Min Step for moving - half an anga span.
+    # The stepping grid (ending at jd2) is sampled in batch calls of GRID_CHUNK_STEPS steps each - so as not to compute angas far beyond the target.
+    num_steps = int(numpy.ceil((jd2 - jd1) / min_step))
     jd_bracket_L = jd1
-    jd_now = jd1
-    while jd_now <= jd2 and jd_start is None:
-      anga_now = self._get_anga(jd=jd_now)
-
-      if anga_now < target_anga:
-        # So, jd_now will be lower than jd_start
-        jd_bracket_L = jd_now
-      if anga_now == target_anga:
-        # In this branch, anga_now will have overshot the jd_start of the required interval.
-        jd_start = self._interpolate_for_start(jd1=jd_bracket_L, jd2=jd_now, target_anga=target_anga)
-      if jd_now == jd2:
-        # Prevent infinite loop
-        break
-      jd_now = min(jd_now + min_step, jd2)
+    for chunk_start in range(0, num_steps + 1, AngaSpanFinder.GRID_CHUNK_STEPS):
+      step_indices = numpy.arange(chunk_start, min(chunk_start + AngaSpanFinder.GRID_CHUNK_STEPS, num_steps + 1))
+      grid_jds = numpy.minimum(jd1 + step_indices * min_step, jd2)
+      for jd_now, anga_now in zip(grid_jds, self._get_angas(jds=grid_jds)):
+        if anga_now < target_anga:
+          # So, jd_now will be lower than jd_start
+          jd_bracket_L = jd_now
+        if anga_now == target_anga:
+          # In this branch, anga_now will have overshot the jd_start of the required interval.
+          jd_start = self._interpolate_for_start(jd1=jd_bracket_L, jd2=jd_now, target_anga=target_anga)
+        if jd_start is not None:
+          return jd_start
     return jd_start
 
   @timebudget
@@ -332,6 +533,105 @@ class AngaSpanFinder(JsonObject):
     return spans
 
 
+
+class AngaTimeline(object):
+  """Anga boundaries over a whole period (say, that of a Panchaanga), computed in one continuous sweep per anga type.
+  
+  For each anga type, we store a sorted list of boundary jds and a list of angas: angas[0] is the anga at jd_start, and angas[i + 1] starts at boundary_jds[i]. Spans within any sub-interval (eg. sunrise to next sunrise) are then obtained by bisection, rather than by solving for boundaries afresh.
+  
+  Anga types measured along the same curve share a solver where possible: only the finest division is solved for, and coarser divisions which nest within it are derived by decimation. For example, tithi (30 divisions of the Moon-Sun elongation) boundaries are every other karana (60 divisions) boundary, and every fourth tithi-pada (120 divisions) boundary. Divisions which do not nest (eg. rashi and nakshatra) are solved separately.
+  """
+
+  def __init__(self, jd_start, jd_end, ayanaamsha_id, anga_types):
+    self.jd_start = jd_start
+    self.jd_end = jd_end
+    self.ayanaamsha_id = ayanaamsha_id
+    self.anga_type_to_boundaries = {}
+    # Finest first, so that coarser types can be derived from finer ones.
+    for anga_type in sorted(anga_types, key=lambda anga_type: anga_type.num_angas, reverse=True):
+      if anga_type in self.anga_type_to_boundaries:
+        continue
+      finer_anga_type = self._get_finer_anga_type(anga_type=anga_type)
+      if finer_anga_type is not None:
+        self.anga_type_to_boundaries[anga_type] = self._decimate(finer_anga_type=finer_anga_type, anga_type=anga_type)
+      else:
+        self.anga_type_to_boundaries[anga_type] = self._sweep(anga_type=anga_type)
+
+  def _get_finer_anga_type(self, anga_type):
+    """Returns an already computed anga type, whose divisions of the same curve nest within those of anga_type. 
+    
+    All types share self.ayanaamsha_id (except tithi, where the ayanaamsha cancels out) - so equal weights imply the same curve. 
+    """
+    for finer_anga_type in self.anga_type_to_boundaries.keys():
+      if (finer_anga_type.weight_moon, finer_anga_type.weight_sun) == (anga_type.weight_moon, anga_type.weight_sun) and finer_anga_type.num_angas % anga_type.num_angas == 0:
+        return finer_anga_type
+    return None
+
+  def _decimate(self, finer_anga_type, anga_type):
+    (finer_boundary_jds, finer_angas) = self.anga_type_to_boundaries[finer_anga_type]
+    ratio = finer_anga_type.num_angas // anga_type.num_angas
+
+    def to_coarser_anga(finer_anga):
+      return Anga.get_cached(index=(finer_anga.index - 1) // ratio + 1, anga_type_id=anga_type.name)
+
+    boundary_jds = []
+    angas = [to_coarser_anga(finer_angas[0])]
+    for (jd_boundary, finer_anga) in zip(finer_boundary_jds, finer_angas[1:]):
+      if (finer_anga.index - 1) % ratio == 0:
+        boundary_jds.append(jd_boundary)
+        angas.append(to_coarser_anga(finer_anga))
+    return (boundary_jds, angas)
+
+  def _get_span_finder(self, anga_type):
+    if anga_type == AngaType.TITHI:
+      # Tithi is independent of ayanAmsha - ASHVINI_STARTING_0 is the cheapest.
+      return AngaSpanFinder.get_cached(ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0, anga_type=anga_type)
+    return AngaSpanFinder.get_cached(ayanaamsha_id=self.ayanaamsha_id, anga_type=anga_type)
+
+  def _sweep(self, anga_type):
+    span_finder = self._get_span_finder(anga_type=anga_type)
+    # Individual angas can be somewhat longer than the mean - so we seek the next boundary within two mean anga durations.
+    window = 2 * anga_type.mean_period_days / anga_type.num_angas
+    boundary_jds = []
+    angas = [span_finder._get_anga(jd=self.jd_start)]
+    jd = self.jd_start
+    while jd < self.jd_end:
+      jd_window_end = min(jd + window, self.jd_end)
+      jd_boundary = span_finder.find_anga_start_between(jd1=jd, jd2=jd_window_end, target_anga=angas[-1] + 1)
+      if jd_boundary is None:
+        jd = jd_window_end
+      else:
+        boundary_jds.append(jd_boundary)
+        angas.append(angas[-1] + 1)
+        jd = jd_boundary
+    return (boundary_jds, angas)
+
+  def covers(self, jd1, jd2, anga_types=()):
+    return self.jd_start <= jd1 and jd2 <= self.jd_end and all(anga_type in self.anga_type_to_boundaries for anga_type in anga_types)
+
+  def get_all_angas_in_period(self, anga_type, jd1, jd2):
+    """Same output as AngaSpanFinder.get_all_angas_in_period - the first span has no start and the last span has no end.
+    
+    :param anga_type: 
+    :param jd1: Should be within the timeline period.
+    :param jd2: Should be within the timeline period.
+    :return: A list of AngaSpan objects.
+    """
+    if not self.covers(jd1=jd1, jd2=jd2, anga_types=[anga_type]):
+      raise ValueError("%s timeline for (%f, %f) does not cover (%f, %f)" % (anga_type.name, self.jd_start, self.jd_end, jd1, jd2))
+    (boundary_jds, angas) = self.anga_type_to_boundaries[anga_type]
+    start_index = bisect.bisect_right(boundary_jds, jd1)
+    end_index = bisect.bisect_right(boundary_jds, jd2)
+    spans = []
+    jd_start = None
+    for index in range(start_index, end_index):
+      spans.append(AngaSpan(jd_start=jd_start, jd_end=boundary_jds[index], anga=angas[index]))
+      jd_start = boundary_jds[index]
+    spans.append(AngaSpan(jd_start=jd_start, jd_end=None, anga=angas[end_index]))
+    return spans
+
+
+
 # Essential for depickling to work.
 common.update_json_class_index(sys.modules[__name__])
 
@@ -176,6 +176,15 @@ class Tithi(Anga):
   def from_anga(cls, anga, month):
     return Tithi(index=anga.index, month=month)
 
+  @methodtools.lru_cache()
+  @classmethod
+  def get_cached(cls, index, month_index, month_anga_type_id):
+    """A shared Tithi object - not to be modified. 
+    
+    The month is identified by its index and anga type id (rather than by an Anga object), since these are cheaper to hash. 
+    """
+    return Tithi(index=index, month=Anga.get_cached(index=month_index, anga_type_id=month_anga_type_id))
+
   def __repr__(self):
     return "%s: %02d:%02d" % (self.anga_type_id, self.month.index, self.index)
 
@@ -57,10 +57,15 @@ def dump_detailed(year, city, year_type, computation_system=ComputationSystem.MU
   dump_ics_md_pair(panchaanga=panchaanga, period_str="%s/%04d" % (year_type, year))
 
 
-def dump_summary(year, city, script=sanscript.DEVANAGARI, computation_system=ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180, allow_precomputed=False):
+def dump_summary(year, city, script=sanscript.DEVANAGARI, computation_system=ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180, allow_precomputed=False, panchaanga=None):
+  """
+
+  :param panchaanga: The panchaanga for the year, if already computed (as by dump_summaries).
+  """
   year_type = era.ERA_GREGORIAN
   logging.info("Generating summary panchaanga for %s year %d (%s), with computation system %s ", city.name, year, year_type, str(computation_system))
-  panchaanga = annual.get_panchaanga_for_year(city=city, year=year, computation_system=computation_system, year_type=year_type, allow_precomputed=allow_precomputed)
+  if panchaanga is None:
+    panchaanga = annual.get_panchaanga_for_year(city=city, year=year, computation_system=computation_system, year_type=year_type, allow_precomputed=allow_precomputed)
   year_table = to_table_dict(panchaanga=panchaanga )
   out_path = get_canonical_path(city=panchaanga.city.name, computation_system_str=str(panchaanga.computation_system), year=year, year_type=year_type)
   os.makedirs(os.path.dirname(out_path), exist_ok=True)
@@ -77,6 +82,13 @@ def dump_summary(year, city, script=sanscript.DEVANAGARI, computation_system=Com
   md_file.dump_to_file(metadata={"title": "%d Summary" % (year)}, content=md, dry_run=False)
 
 
+def dump_summaries(start_year, end_year, city, script=sanscript.DEVANAGARI, computation_system=ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180):
+  """dump_summary for consecutive years (both inclusive) - with days computed as one continuous series (see annual.MultiYearPanchaanga)."""
+  multi_year_panchaanga = annual.MultiYearPanchaanga(city=city, start_year=start_year, end_year=end_year, computation_system=computation_system)
+  for panchaanga in multi_year_panchaanga.get_civil_year_panchaangas():
+    dump_summary(year=panchaanga.year, city=city, script=script, computation_system=computation_system, panchaanga=panchaanga)
+
+
 def get_canonical_path(city, computation_system_str, year, year_type=era.ERA_GREGORIAN, output_dir=output_dir):
   if isinstance(year, str):
     year = int(year)
@@ -1,7 +1,7 @@
 import argparse
 
 from jyotisha.panchaanga import spatio_temporal, temporal
-from jyotisha.panchaanga.temporal import era
+from jyotisha.panchaanga.temporal import era, RulesCollection
 from jyotisha.panchaanga.writer import generation_project
 
 
@@ -12,6 +12,7 @@ parser = argparse.ArgumentParser(description='panchAnga generator.')
 parser.add_argument('--year', type=int, default=today.year, nargs='?')
 args = parser.parse_args()
 year = args.year
+RulesCollection.SNAPSHOT_DIR = RulesCollection.DEFAULT_SNAPSHOT_DIR
 # year = 2017
 
 # bengaLUru
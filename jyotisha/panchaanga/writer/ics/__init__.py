@@ -39,10 +39,8 @@ def compute_calendar(panchaanga, languages=None, scripts=None, set_sequence=True
 
   set_calendar_metadata(ics_calendar, panchaanga=panchaanga, set_sequence=set_sequence)
 
-  daily_panchaangas = panchaanga.daily_panchaangas_sorted()
-  for day_index, daily_panchaanga in enumerate(daily_panchaangas):
-    if daily_panchaanga.date < panchaanga.start_date or daily_panchaanga.date > panchaanga.end_date:
-      continue
+  day_array = panchaanga.get_day_array()
+  for day_index in range(day_array.core_start_index, day_array.core_end_index):
     if not festivals_only:
       event = get_day_summary_event(d=day_index, panchaanga=panchaanga, script=scripts[0])
       ics_calendar.add_component(event)
@@ -27,10 +27,9 @@ def writeDailyICS(panchaanga, script=sanscript.DEVANAGARI):
   alarm.add('action', 'DISPLAY')
   alarm.add('trigger', timedelta(hours=-4))  # default alarm, with a 4 hour reminder
 
-  daily_panchaangas = panchaanga.daily_panchaangas_sorted()
-  for d, daily_panchaanga in enumerate(daily_panchaangas):
-    if daily_panchaanga.date < panchaanga.start_date or daily_panchaanga.date > panchaanga.end_date:
-      continue
+  day_array = panchaanga.get_day_array()
+  for d in range(day_array.core_start_index, day_array.core_end_index):
+    daily_panchaanga = day_array[d]
 
     if daily_panchaanga.solar_sidereal_date_sunset.month == 1:
       # Flip the year name for the remaining days
@@ -47,7 +46,7 @@ def writeDailyICS(panchaanga, script=sanscript.DEVANAGARI):
 
 
 def get_day_summary_event(d, panchaanga, script):
-  daily_panchaanga = panchaanga.daily_panchaangas_sorted()[d]
+  daily_panchaanga = panchaanga.get_day_array()[d]
   event = Event()
   (title, details) = day_summary(d=d, panchaanga=panchaanga, script=script, subsection_md="##")
   event.add('summary', title)
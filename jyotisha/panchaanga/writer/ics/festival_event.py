@@ -112,7 +112,7 @@ def set_interval(daily_panchaanga, festival_instance):
 
 
 def add_festival_events(day_index, ics_calendar, panchaanga, languages, scripts):
-  daily_panchaanga = panchaanga.daily_panchaangas_sorted()[day_index]
+  daily_panchaanga = panchaanga.get_day_array()[day_index]
   for festival_instance_in in sorted(daily_panchaanga.festival_id_to_instance.values()):
     festival_instance = deepcopy(festival_instance_in)
     fest_id = festival_instance.name
@@ -16,10 +16,9 @@ def make_md(panchaanga, scripts=None, languages=None):
   print(computation_params,
         file=output_stream)
 
-  daily_panchaangas = panchaanga.daily_panchaangas_sorted()
-  for day_index, daily_panchaanga in enumerate(daily_panchaangas):
-    if daily_panchaanga.date < panchaanga.start_date or daily_panchaanga.date > panchaanga.end_date:
-      continue
+  day_array = panchaanga.get_day_array()
+  for day_index in range(day_array.core_start_index, day_array.core_end_index):
+    daily_panchaanga = day_array[day_index]
 
     if daily_panchaanga.date == panchaanga.start_date or daily_panchaanga.date.day == 1:
       print("## %04d-%02d" % (daily_panchaanga.date.year, daily_panchaanga.date.month), file=output_stream)
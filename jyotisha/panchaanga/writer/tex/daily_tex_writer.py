@@ -60,14 +60,13 @@ def emit(panchaanga, time_format="hh:mm", languages=None, scripts=None, output_s
 
   set_top_content(output_stream, panchaanga, samvatsara_names, scripts, year)
 
-  daily_panchaangas = panchaanga.daily_panchaangas_sorted()
-  for d, daily_panchaanga in enumerate(daily_panchaangas):
+  day_array = panchaanga.get_day_array()
+  for d in range(day_array.core_start_index, day_array.core_end_index):
+    daily_panchaanga = day_array[d]
     if d == 0:
       previous_day_panchaanga = None
     else:
-      previous_day_panchaanga = daily_panchaangas[d - 1]
-    if daily_panchaanga.date < panchaanga.start_date or daily_panchaanga.date > panchaanga.end_date:
-      continue
+      previous_day_panchaanga = day_array[d - 1]
     [y, m, dt] = [daily_panchaanga.date.year, daily_panchaanga.date.month, daily_panchaanga.date.day]
 
     # checking @ 6am local - can we do any better?
@@ -102,11 +101,11 @@ def emit(panchaanga, time_format="hh:mm", languages=None, scripts=None, output_s
     if daily_panchaanga.solar_sidereal_date_sunset.month_transition is None:
       month_end_str = ''
     else:
-      _m = daily_panchaangas[d - 1].solar_sidereal_date_sunset.month
-      if daily_panchaanga.solar_sidereal_date_sunset.month_transition >= daily_panchaangas[d + 1].jd_sunrise:
+      _m = day_array[d - 1].solar_sidereal_date_sunset.month
+      if daily_panchaanga.solar_sidereal_date_sunset.month_transition >= day_array[d + 1].jd_sunrise:
         month_end_str = '\\mbox{%s{\\tiny\\RIGHTarrow}{%s}}' % (
           names.NAMES['RASHI_NAMES']['sa'][scripts[0]][_m], time.Hour(
-            24 * (daily_panchaanga.solar_sidereal_date_sunset.month_transition - daily_panchaangas[d + 1].julian_day_start)).to_string(format=time_format))
+            24 * (daily_panchaanga.solar_sidereal_date_sunset.month_transition - day_array[d + 1].julian_day_start)).to_string(format=time_format))
       else:
         month_end_str = '\\mbox{%s{\\tiny\\RIGHTarrow}{%s}}' % (
           names.NAMES['RASHI_NAMES']['sa'][scripts[0]][_m], time.Hour(
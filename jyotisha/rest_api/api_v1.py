@@ -42,7 +42,7 @@ class DailyCalendarHandler(Resource):
     args = self.get_parser.parse_args()
     city = City("", latitude, longitude, args['timezone'])
     panchaanga = annual.get_panchaanga_for_civil_year(city=city, year=int(year))
-
+    panchaanga.fill_lazy_fields()
     return panchaanga.to_json_map()
 
 
@@ -64,6 +64,7 @@ class KaalaHandler(Resource):
     args = self.get_parser.parse_args()
     city = City("", latitude, longitude, args['timezone'])
     panchaanga = daily.DailyPanchaanga(city=city, date=Date(year=int(year), month=int(month), day=int(day)))
+    panchaanga.day_length_based_periods.fill_lazy_fields()
     return panchaanga.day_length_based_periods.to_json_map()
 
 
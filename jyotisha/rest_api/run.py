@@ -6,6 +6,7 @@ import logging
 import os.path
 import sys
 
+from jyotisha.panchaanga.temporal import RulesCollection
 from jyotisha.rest_api import api_v1
 from jyotisha.rest_api.flask_helper import app
 
@@ -26,6 +27,8 @@ with open(CONFIG_PATH) as config_file:
 
 
 def setup_app():
+  # Workers (re)start often - festival rules are loaded from snapshots, rather than parsed afresh.
+  RulesCollection.SNAPSHOT_DIR = RulesCollection.DEFAULT_SNAPSHOT_DIR
   app.register_blueprint(api_v1.api_blueprint)
 
 
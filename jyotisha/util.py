@@ -1,5 +1,43 @@
+import io
+import pickle
+
+from sanskrit_data.schema import common
+
+
 def zero_if_none(x):
   return default_if_none(x=x, default=0)
 
 def default_if_none(x, default):
   return default if x is None else x
+
+
+def _make_json_object(cls, state):
+  obj = cls.__new__(cls)
+  obj.__dict__.update(state)
+  return obj
+
+
+class JsonObjectPickler(pickle.Pickler):
+  """A pickler for objects containing JsonObjects - which do not survive plain pickling (their __getattr__ defaults to None, which breaks the __setstate__ lookup on loading). They are pickled as their class and __dict__ instead.
+  
+  Unlike going through to_json_map and make_from_dict, this is fast - no jsonpickle decoding. The result is loaded with plain pickle.load (or pickle_loads).
+  """
+
+  def reducer_override(self, obj):
+    if isinstance(obj, common.JsonObject):
+      return (_make_json_object, (obj.__class__, obj.__dict__))
+    return NotImplemented
+
+
+def pickle_dump(obj, fp):
+  JsonObjectPickler(fp, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+
+
+def pickle_dumps(obj):
+  buffer = io.BytesIO()
+  pickle_dump(obj=obj, fp=buffer)
+  return buffer.getvalue()
+
+
+def pickle_loads(data):
+  return pickle.loads(data)
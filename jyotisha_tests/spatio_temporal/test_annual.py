@@ -2,11 +2,14 @@ import copy
 import logging
 import os
 
+import pytest
 from timebudget import timebudget
 
-from jyotisha.panchaanga.spatio_temporal import City, annual, periodical
-from jyotisha.panchaanga.temporal import ComputationSystem
+from jyotisha.panchaanga.spatio_temporal import City, annual, periodical, daily
+from jyotisha.panchaanga.temporal import ComputationSystem, ComputationProfile, AngaType
+from jyotisha.panchaanga.temporal.body import Graha
 from jyotisha.panchaanga.temporal.time import Date
+from jyotisha.panchaanga.temporal.zodiac.angas import Tithi
 from jyotisha_tests.spatio_temporal import chennai
 from sanskrit_data import testing
 
@@ -33,6 +36,7 @@ def panchaanga_json_comparer(city, year, computation_system=ComputationSystem.TE
   expected_content_path = os.path.join(TEST_DATA_PATH, '%s-%d.json' % (city.name, year))
   panchaanga = annual.get_panchaanga_for_civil_year(city=city, year=year, computation_system=computation_system,
                                                     allow_precomputed=False)
+  panchaanga.fill_lazy_fields()
   timebudget.report(reset=True)
   testing.json_compare(actual_object=panchaanga, expected_content_path=expected_content_path)
 
@@ -59,6 +63,143 @@ def test_panchaanga_orinda_19(caplog):
   panchaanga_json_comparer(city=city, year=2019)
 
 
+def test_festivals_only_profile():
+  computation_system = copy.deepcopy(ComputationSystem.TEST)
+  computation_system.festival_options.computation_profile = ComputationProfile.FESTIVALS_ONLY
+  panchaanga = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 2, 28), computation_system=computation_system)
+  assert panchaanga.daily_panchaanga_for_date(Date(2019, 2, 1)).sunrise_day_angas.karanas_with_ends is None
+  panchaanga_full = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 2, 28), computation_system=ComputationSystem.TEST)
+  assert panchaanga.festival_id_to_days == panchaanga_full.festival_id_to_days
+
+
+def no_fest_chennai_panchaanga(year=None, start_date=None, end_date=None, computation_system=ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180):
+  """A panchaanga without festivals - for the civil year, or (if year is None) from start_date to end_date."""
+  computation_system = copy.deepcopy(computation_system)
+  computation_system.festival_options.repos = []
+  computation_system.festival_options.no_fests = True
+  if year is not None:
+    city = City('Chennai', "13:05:24", "80:16:12", "Asia/Calcutta")
+    return annual.get_panchaanga_for_civil_year(city=city, year=year,
+                                                allow_precomputed=False, computation_system=computation_system)
+  return periodical.Panchaanga(city=chennai, start_date=start_date, end_date=end_date, computation_system=computation_system)
+
+
+def test_parallel_compute_angas():
+  panchaanga = no_fest_chennai_panchaanga(start_date=Date(2019, 1, 1), end_date=Date(2019, 2, 28), computation_system=ComputationSystem.TEST)
+  computation_system = panchaanga.computation_system
+  panchaanga_parallel = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 2, 28), computation_system=computation_system)
+  panchaanga_parallel.compute_angas(compute_lagnas=computation_system.festival_options.set_lagnas, num_processes=3)
+  assert sorted(panchaanga_parallel.date_str_to_panchaanga.keys()) == sorted(panchaanga.date_str_to_panchaanga.keys())
+  for (date_str, daily_panchaanga) in panchaanga.date_str_to_panchaanga.items():
+    daily_panchaanga_parallel = panchaanga_parallel.date_str_to_panchaanga[date_str]
+    assert daily_panchaanga_parallel.matches_recurrence_fields(daily_panchaanga), date_str
+    # Including seam days, which may be recomputed while stitching chunks.
+    for anga_type in computation_system.get_day_anga_types():
+      assert daily_panchaanga_parallel.sunrise_day_angas.get_angas_with_ends(anga_type=anga_type) == daily_panchaanga.sunrise_day_angas.get_angas_with_ends(anga_type=anga_type), (date_str, anga_type.name)
+    assert daily_panchaanga_parallel.city is panchaanga.city
+  testing.collection_helper.assert_approx_equals(x=panchaanga_parallel.daily_panchaanga_for_date(Date(2019, 2, 1)), y=panchaanga.daily_panchaanga_for_date(Date(2019, 2, 1)), floating_point_precision=4)
+
+
+def test_extend_and_prepend():
+  panchaanga_full = periodical.Panchaanga(city=chennai, start_date=Date(2018, 12, 1), end_date=Date(2019, 4, 30), computation_system=ComputationSystem.TEST)
+  panchaanga = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 2, 28), computation_system=ComputationSystem.TEST)
+  panchaanga.extend(end_date=Date(2019, 4, 30))
+  panchaanga.prepend(start_date=Date(2018, 12, 1))
+  assert (panchaanga.start_date, panchaanga.end_date, panchaanga.duration) == (panchaanga_full.start_date, panchaanga_full.end_date, panchaanga_full.duration)
+  assert [dp.date for dp in panchaanga.daily_panchaangas_sorted()] == [dp.date for dp in panchaanga_full.daily_panchaangas_sorted()]
+  for daily_panchaanga_full in panchaanga_full.daily_panchaangas_sorted():
+    daily_panchaanga = panchaanga.daily_panchaanga_for_date(daily_panchaanga_full.date)
+    assert daily_panchaanga.matches_recurrence_fields(daily_panchaanga_full), daily_panchaanga.date
+    assert sorted(daily_panchaanga.festival_id_to_instance.keys()) == sorted(daily_panchaanga_full.festival_id_to_instance.keys()), daily_panchaanga.date
+  assert panchaanga.festival_id_to_days == panchaanga_full.festival_id_to_days
+
+
+def test_multi_year_panchaanga():
+  from jyotisha_tests.spatio_temporal import get_panchaanga_from_previous_test
+  multi_year_panchaanga = annual.MultiYearPanchaanga(city=chennai, start_year=2018, end_year=2019, computation_system=ComputationSystem.TEST)
+  for panchaanga in multi_year_panchaanga.get_civil_year_panchaangas():
+    expected_panchaanga = get_panchaanga_from_previous_test(city_name="Chennai", year=panchaanga.year)
+    for expected_daily_panchaanga in expected_panchaanga.daily_panchaangas_sorted(skip_padding_days=True):
+      daily_panchaanga = panchaanga.daily_panchaanga_for_date(expected_daily_panchaanga.date)
+      # Stored data are rounded to 4 decimal places.
+      assert daily_panchaanga.matches_recurrence_fields(expected_daily_panchaanga, jd_tolerance=1e-4), daily_panchaanga.date
+      assert sorted(daily_panchaanga.festival_id_to_instance.keys()) == sorted(expected_daily_panchaanga.festival_id_to_instance.keys()), daily_panchaanga.date
+
+
+def test_from_daily_panchaangas():
+  panchaanga = no_fest_chennai_panchaanga(start_date=Date(2019, 1, 1), end_date=Date(2019, 1, 31), computation_system=ComputationSystem.TEST)
+  computation_system = panchaanga.computation_system
+  daily_panchaangas = panchaanga.daily_panchaangas_sorted()
+  sub_panchaanga = periodical.Panchaanga.from_daily_panchaangas(city=chennai, start_date=Date(2019, 1, 11), end_date=Date(2019, 1, 20), daily_panchaangas=daily_panchaangas, computation_system=computation_system)
+  assert sub_panchaanga.daily_panchaanga_for_date(Date(2019, 1, 11)) is panchaanga.daily_panchaanga_for_date(Date(2019, 1, 11))
+  # Days not covering the paddings
+  with pytest.raises(ValueError):
+    periodical.Panchaanga.from_daily_panchaangas(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 1, 10), daily_panchaangas=daily_panchaangas[1:], computation_system=computation_system)
+  with pytest.raises(ValueError):
+    periodical.Panchaanga.from_daily_panchaangas(city=chennai, start_date=Date(2019, 1, 11), end_date=Date(2019, 2, 10), daily_panchaangas=daily_panchaangas, computation_system=computation_system)
+
+
+def test_stream_daily_panchaangas():
+  panchaanga = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 3, 31), computation_system=ComputationSystem.TEST)
+  expected_daily_panchaangas = panchaanga.daily_panchaangas_sorted(skip_padding_days=True)
+
+  city = City.get_city_from_db("Chennai")
+
+  # Within a single chunk, festivals are as in a Panchaanga spanning the whole period.
+  daily_panchaangas = list(periodical.stream_daily_panchaangas(city=city, start_date=Date(2019, 1, 1), end_date=Date(2019, 3, 31), computation_system=ComputationSystem.TEST))
+  assert [dp.date for dp in daily_panchaangas] == [dp.date for dp in expected_daily_panchaangas]
+  for (daily_panchaanga, expected_daily_panchaanga) in zip(daily_panchaangas, expected_daily_panchaangas):
+    assert daily_panchaanga.festival_id_to_instance.keys() == expected_daily_panchaanga.festival_id_to_instance.keys(), daily_panchaanga.date
+
+  chunk_days = 31
+  daily_panchaangas = list(periodical.stream_daily_panchaangas(city=city, start_date=Date(2019, 1, 1), end_date=Date(2019, 3, 31), computation_system=ComputationSystem.TEST, chunk_days=chunk_days))
+  assert [dp.date for dp in daily_panchaangas] == [dp.date for dp in expected_daily_panchaangas]
+  for (offset, (daily_panchaanga, expected_daily_panchaanga)) in enumerate(zip(daily_panchaangas, expected_daily_panchaangas)):
+    assert daily_panchaanga.matches_recurrence_fields(expected_daily_panchaanga), daily_panchaanga.date
+    assert daily_panchaanga.sunrise_day_angas.tithis_with_ends == expected_daily_panchaanga.sunrise_day_angas.tithis_with_ends
+    # Festivals near chunk seams may depend on days beyond the chunk paddings.
+    distance_from_seam = min(offset % chunk_days, chunk_days - 1 - offset % chunk_days)
+    if distance_from_seam >= periodical.Panchaanga.EVENT_POSTERIOR_PADDING_DAYS:
+      assert daily_panchaanga.festival_id_to_instance.keys() == expected_daily_panchaanga.festival_id_to_instance.keys(), daily_panchaanga.date
+  # Events cached on the city are trimmed as the stream moves on.
+  assert city.get_rise_set_series(jd_start=panchaanga.jd_end - 5, jd_end=panchaanga.jd_end, body=Graha.SUN) is not None
+  assert city._body_to_rise_set_series[Graha.SUN].jd_start > panchaanga.jd_start
+
+
+def test_day_array():
+  panchaanga = no_fest_chennai_panchaanga(start_date=Date(2019, 1, 1), end_date=Date(2019, 1, 31), computation_system=ComputationSystem.TEST)
+  computation_system = panchaanga.computation_system
+  day_array = panchaanga.get_day_array()
+  assert (day_array.core_start_index, day_array.core_end_index) == (panchaanga.duration_prior_padding, panchaanga.duration_prior_padding + panchaanga.duration)
+  assert day_array[day_array.get_offset(Date(2019, 1, 15))].date == Date(2019, 1, 15)
+  assert panchaanga.daily_panchaanga_for_date(Date(2020, 1, 15)) is None
+  core_days = panchaanga.daily_panchaangas_sorted(skip_padding_days=True)
+  assert (core_days[0].date, core_days[-1].date) == (panchaanga.start_date, panchaanga.end_date)
+
+  # Order does not depend on that of date_str_to_panchaanga (as in deserialized objects).
+  panchaanga.date_str_to_panchaanga = dict(reversed(list(panchaanga.date_str_to_panchaanga.items())))
+  dates = [dp.date for dp in panchaanga.daily_panchaangas_sorted()]
+  assert dates == sorted(dates) and len(dates) == len(panchaanga.date_str_to_panchaanga)
+
+  # Replacing a day
+  replacement = daily.DailyPanchaanga(city=chennai, date=Date(2019, 1, 15), computation_system=computation_system)
+  panchaanga.set_daily_panchaanga(daily_panchaanga=replacement)
+  assert panchaanga.daily_panchaanga_for_date(Date(2019, 1, 15)) is replacement
+  assert panchaanga.get_day_array()[day_array.get_offset(Date(2019, 1, 15))] is replacement
+
+
+def test_interval_anga_spans():
+  panchaanga = no_fest_chennai_panchaanga(start_date=Date(2019, 1, 1), end_date=Date(2019, 1, 31), computation_system=ComputationSystem.TEST)
+  date = Date(2019, 1, 10)
+  (day_spans, _) = panchaanga.daily_panchaanga_for_date(date).get_interval_anga_spans(interval_id="full_day", anga_type=AngaType.TITHI)
+  tithi_spans = panchaanga.get_interval_anga_spans(date=date, interval_id="full_day", anga_type=AngaType.TITHI)
+  assert [(span.jd_start, span.jd_end, span.anga.index) for span in tithi_spans] == [(span.jd_start, span.jd_end, span.anga.index) for span in day_spans]
+  assert all(isinstance(span.anga, Tithi) and span.anga.month is not None for span in tithi_spans)
+  # The day's own spans are left as they were, and repeated calls return the same (shared) spans.
+  assert not any(isinstance(span.anga, Tithi) for span in day_spans)
+  assert panchaanga.get_interval_anga_spans(date=date, interval_id="full_day", anga_type=AngaType.TITHI) is tithi_spans
+
+
 def test_adhika_maasa_computations_2009():
   panchaanga = no_fest_chennai_panchaanga(year=2009)
   expected_lunar_months_2009 = [7] + [8] * 29 + [9] * 30 + [10] * 15
@@ -66,15 +207,6 @@ def test_adhika_maasa_computations_2009():
                                                                              panchaanga.duration_prior_padding + 290:panchaanga.duration_prior_padding + 365]]
 
 
-def no_fest_chennai_panchaanga(year):
-  city = City('Chennai', "13:05:24", "80:16:12", "Asia/Calcutta")
-  computation_system = copy.deepcopy(ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180)
-  computation_system.festival_options.repos = []
-  panchaanga = annual.get_panchaanga_for_civil_year(city=city, year=year,
-                                                         allow_precomputed=False, computation_system=computation_system)
-  return panchaanga
-
-
 def test_adhika_maasa_computations_2010():
   panchaanga = no_fest_chennai_panchaanga(year=2010)
   expected_lunar_months_2010 = [10] * 15 + [11] * 30 + [12] * 29 + [1] * 30 + [1.5] * 30 + [2] * 29 + [3]
@@ -1,4 +1,5 @@
 from jyotisha.panchaanga.spatio_temporal import City
+from jyotisha.panchaanga.temporal.body import Graha
 import numpy
 
 
@@ -6,3 +7,43 @@ def test_moonrise_time():
   city = City.get_city_from_db(name="Bangalore")
   from jyotisha.panchaanga.temporal.body import Graha
   numpy.testing.assert_approx_equal(city.get_rising_time(julian_day_start=2459107.33, body=Graha.MOON), 2459107.4297038973)
+
+
+def test_get_rise_set_series():
+  city = City('Chennai', '13:05:24', '80:16:12', 'Asia/Calcutta')
+  uncached_city = City('Chennai', '13:05:24', '80:16:12', 'Asia/Calcutta')
+  jd_start = 2458484.5
+  (sunrise_jds, sunset_jds) = city.get_rise_set_series(jd_start=jd_start, jd_end=jd_start + 30, body=Graha.SUN)
+  (moonrise_jds, _) = city.get_rise_set_series(jd_start=jd_start, jd_end=jd_start + 30, body=Graha.MOON)
+  assert len(sunrise_jds) == 30 and len(sunset_jds) == 30
+  # The Moon skips a rising every month or so.
+  assert len(moonrise_jds) == 29
+  numpy.testing.assert_allclose(sunrise_jds[3], uncached_city.get_rising_time(julian_day_start=jd_start + 3, body=Graha.SUN), atol=1e-6, rtol=0)
+  numpy.testing.assert_allclose(moonrise_jds[3], uncached_city.get_rising_time(julian_day_start=moonrise_jds[2] + 0.1, body=Graha.MOON), atol=1e-6, rtol=0)
+  # Cached lookups
+  assert city.get_rising_time(julian_day_start=jd_start + 3, body=Graha.SUN) == sunrise_jds[3]
+  assert len(city.get_sunsets_in_period(jd_start=jd_start + 0.5, jd_end=jd_start + 10.5)) == 10
+  # Extending the cached range
+  (sunrise_jds_extended, _) = city.get_rise_set_series(jd_start=jd_start - 5, jd_end=jd_start + 30, body=Graha.SUN)
+  assert len(sunrise_jds_extended) == 35
+  numpy.testing.assert_array_equal(sunrise_jds_extended[5:], sunrise_jds)
+  # A far off range replaces the cached series, rather than filling in the gap.
+  (far_sunrise_jds, _) = city.get_rise_set_series(jd_start=jd_start - 50 * 365, jd_end=jd_start - 50 * 365 + 30, body=Graha.SUN)
+  assert len(far_sunrise_jds) == 30
+  assert len(city._get_cached_rise_set_series(body=Graha.SUN).rise_jds) == 30
+
+
+def test_get_lagna_series():
+  city = City('Chennai', '13:05:24', '80:16:12', 'Asia/Calcutta')
+  jd_start = 2458484.5
+  lagna_series = city.get_lagna_series(jd_start=jd_start, jd_end=jd_start + 10)
+  # 12 lagnas per sidereal day
+  assert len(lagna_series.end_jds) in (120, 121)
+  assert numpy.all(numpy.diff(lagna_series.end_jds) > 0)
+  numpy.testing.assert_array_equal(numpy.diff(lagna_series.lagnas) % 12, 1)
+  for (lagna, end_jd) in zip(lagna_series.lagnas, lagna_series.end_jds):
+    numpy.testing.assert_allclose(city.get_lagna_float(end_jd, offset=-lagna), 0, atol=1e-7)
+  # Extending the cached range
+  extended_series = city.get_lagna_series(jd_start=jd_start - 1, jd_end=jd_start + 10)
+  assert len(extended_series.end_jds) - len(lagna_series.end_jds) in (12, 13)
+  numpy.testing.assert_array_equal(extended_series.end_jds[-len(lagna_series.end_jds):], lagna_series.end_jds)
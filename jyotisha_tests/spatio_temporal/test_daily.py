@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 
@@ -6,11 +7,12 @@ from indic_transliteration import sanscript
 
 from jyotisha.panchaanga.spatio_temporal import City
 from jyotisha.panchaanga.spatio_temporal import daily
-from jyotisha.panchaanga.temporal import time
+from jyotisha.panchaanga.temporal import time, ComputationSystem, ComputationProfile
 from jyotisha.panchaanga.temporal.festival.rules import RulesRepo
 from jyotisha.panchaanga.temporal.interval import Interval
 from jyotisha.panchaanga.temporal.time import Date
 from jyotisha.panchaanga.temporal.zodiac import AngaType
+from jyotisha.util import default_if_none
 from timebudget import timebudget
 
 from sanskrit_data import testing
@@ -28,6 +30,7 @@ TEST_DATA_PATH = os.path.join(os.path.dirname(__file__), 'data')
 def panchaanga_json_comparer(city, date):
   expected_content_path=os.path.join(TEST_DATA_PATH, '%s-%s.json' % (city.name, date.get_date_str()))
   panchaanga = daily.DailyPanchaanga(city=city, date=date)
+  panchaanga.fill_lazy_fields()
   timebudget.report(reset=True)
   testing.json_compare(actual_object=panchaanga, expected_content_path=expected_content_path)
   return panchaanga
@@ -71,6 +74,73 @@ def test_solar_day():
   assert panchaanga.solar_sidereal_date_sunset.month == 9
 
 
+def test_sankraanti_index():
+  from jyotisha.panchaanga.temporal.body import Graha
+  from jyotisha.panchaanga.temporal.zodiac import Ayanamsha
+  sankraanti_index = daily.SankraantiIndex(latitude=chennai.latitude, longitude=chennai.longitude, ayanaamsha_id=Ayanamsha.CHITRA_AT_180)
+  # Include a jump far away from the indexed period.
+  for jd_start in [2458480.0, 2458510.3, 2458545.7, 2437100.0]:
+    jd_sunset = chennai.get_setting_time(julian_day_start=jd_start, body=Graha.SUN)
+    (_, day, month_start_jd, month_end_jd) = sankraanti_index.get_date(jd_sunset=jd_sunset)
+    assert month_start_jd <= jd_sunset < month_end_jd
+    assert day == len(chennai.get_sunsets_in_period(jd_start=month_start_jd, jd_end=jd_sunset + 1/48.0))
+
+
+def test_lazy_fields():
+  panchaanga = daily.DailyPanchaanga(city=chennai, date=Date(2019, 3, 12))
+  assert "jd_moonrise" not in panchaanga.to_json_map()
+  assert "mauDhyas" not in panchaanga.to_json_map()
+  jd_moonrise = panchaanga.jd_moonrise
+  assert panchaanga.jd_sunrise < jd_moonrise < panchaanga.jd_sunrise + 1.1
+  assert len(panchaanga.amauDhyas) + len(default_if_none(panchaanga.mauDhyas, {})) == 5
+  # Both are recorded as computed - even if one is None - so that they are not recomputed on each access.
+  assert "mauDhyas" in panchaanga.__dict__ and "amauDhyas" in panchaanga.__dict__
+  json_map = panchaanga.to_json_map()
+  assert "jd_moonrise" in json_map and "jd_moonset" not in json_map and "amauDhyas" in json_map
+  panchaanga_copy = daily.DailyPanchaanga.make_from_dict(json_map)
+  assert panchaanga_copy.jd_moonrise == jd_moonrise
+  assert panchaanga_copy.amauDhyas == panchaanga.amauDhyas
+
+
+def test_lazy_day_length_based_periods():
+  panchaanga = daily.DailyPanchaanga(city=chennai, date=Date(2019, 3, 12))
+  periods_map = panchaanga.day_length_based_periods.to_json_map()
+  assert "fifteen_fold_division" not in periods_map and "dinamaana" not in periods_map
+  pradosha = panchaanga.get_interval(interval_id="pradosha")
+  assert pradosha.jd_start == panchaanga.jd_sunset
+  assert pradosha.name == "प्रदोषः"
+  assert panchaanga.get_interval(interval_id="pradosha") is pradosha
+  fifteen_fold_map = panchaanga.day_length_based_periods.to_json_map()["fifteen_fold_division"]
+  assert "pradosha" in fifteen_fold_map and "braahma" not in fifteen_fold_map
+
+  panchaanga_copy = daily.DailyPanchaanga.make_from_dict(panchaanga.to_json_map())
+  assert panchaanga_copy.get_interval(interval_id="pradosha").jd_end == pradosha.jd_end
+  # Computed afresh in the deserialized copy
+  assert panchaanga_copy.day_length_based_periods.fifteen_fold_division.braahma.jd_end == panchaanga.day_length_based_periods.fifteen_fold_division.braahma.jd_end
+  assert panchaanga_copy.get_interval(interval_id="raahu").jd_start == panchaanga.get_interval(interval_id="raahu").jd_start
+
+  panchaanga.fill_lazy_fields()
+  periods_map = panchaanga.day_length_based_periods.to_json_map()
+  assert "dinamaana" in periods_map and "raahu" in periods_map["eight_fold_division"] and len(periods_map["fifteen_fold_division"]["tb_muhuurtas"]) == 15
+
+
+def test_computation_profile():
+  computation_system = copy.deepcopy(ComputationSystem.DEFAULT)
+  computation_system.festival_options.computation_profile = ComputationProfile.DAY_SUMMARY
+  computation_system.festival_options.no_fests = True
+  assert computation_system.get_day_anga_types() == [AngaType.TITHI, AngaType.NAKSHATRA]
+  panchaanga = daily.DailyPanchaanga(city=chennai, date=Date(2019, 3, 12), computation_system=computation_system)
+  assert panchaanga.sunrise_day_angas.nakshatra_at_sunrise is not None
+  assert panchaanga.sunrise_day_angas.karanas_with_ends is None
+  assert panchaanga.sunrise_day_angas.solar_nakshatras_with_ends is None
+  assert "jd_moonrise" not in panchaanga.to_json_map()
+
+  computation_system.festival_options.computation_profile = ComputationProfile.FULL
+  panchaanga = daily.DailyPanchaanga(city=chennai, date=Date(2019, 3, 12), computation_system=computation_system)
+  assert panchaanga.sunrise_day_angas.solar_nakshatras_with_ends is not None
+  assert "jd_moonrise" in panchaanga.to_json_map()
+
+
 def test_sunrise_mtv():
   city = City.get_city_from_db('Cupertino') 
   panchaanga = daily.DailyPanchaanga(city=city, date=Date(year=2018, month=11, day=11))
@@ -113,6 +183,22 @@ def test_get_anga_data_1981_12_23():
   angas = [s.anga.index for s in panchaanga.sunrise_day_angas.get_anga_spans_in_interval(interval=Interval(jd_start=panchaanga.jd_sunrise, jd_end=panchaanga.jd_next_sunrise), anga_type=AngaType.NAKSHATRA)]
   assert angas == [16, 17]
 
+  nakshatra_spans = panchaanga.sunrise_day_angas.nakshatras_with_ends
+  assert panchaanga.sunrise_day_angas.anga_at(jd=panchaanga.jd_sunrise, anga_type=AngaType.NAKSHATRA).index == 16
+  assert panchaanga.sunrise_day_angas.anga_at(jd=nakshatra_spans[0].jd_end + 0.001, anga_type=AngaType.NAKSHATRA).index == 17
+  assert panchaanga.sunrise_day_angas.find_anga_span(nakshatra_spans[1].anga) is nakshatra_spans[1]
+
+
+def test_anga_span_index():
+  from jyotisha.panchaanga.temporal.interval import AngaSpan
+  from jyotisha.panchaanga.temporal.zodiac.angas import Anga
+  spans = [AngaSpan(jd_start=None, jd_end=10.2, anga=Anga(index=30, anga_type_id=AngaType.TITHI.name)), AngaSpan(jd_start=10.2, jd_end=11.1, anga=Anga(index=1, anga_type_id=AngaType.TITHI.name)), AngaSpan(jd_start=11.1, jd_end=None, anga=Anga(index=2, anga_type_id=AngaType.TITHI.name))]
+  span_index = daily.AngaSpanIndex(spans=spans)
+  assert span_index.find_span(anga_index=1) is spans[1]
+  assert span_index.find_span(anga_index=3) is None
+  assert span_index.get_span_at(jd=10.5) is spans[1]
+  assert span_index.get_spans_in_interval(jd_start=10.5, jd_end=12) == spans[1:]
+
 
 def test_get_pancha_paxi_activities():
   city = City.get_city_from_db('Chennai')
@@ -122,6 +208,31 @@ def test_get_pancha_paxi_activities():
   assert paxi_activities.cock[0].name == 1
   assert paxi_activities.cock[23].name == 4
 
+
+def test_paxi_activities_from_activities_table():
+  from jyotisha.panchaanga.temporal import interval
+  (jd_sunrise, jd_sunset, jd_next_sunrise) = (2459581.53, 2459582.0, 2459582.53)
+  activities_table = {bird: [(i // (7 + j)) % 5 + 1 for i in range(240)] for (j, bird) in enumerate(daily.PaxiActivities.BIRDS)}
+  paxi_activities = daily.PaxiActivities.from_activities_table(activities_table=activities_table, jd_sunrise=jd_sunrise, jd_sunset=jd_sunset, jd_next_sunrise=jd_next_sunrise)
+  for bird in daily.PaxiActivities.BIRDS:
+    # Adjacent parts with the same activity, merged.
+    expected = []
+    for i in range(240):
+      if i < 120:
+        part = interval.get_interval(start_jd=jd_sunrise, end_jd=jd_sunset, num_parts=120, part_index=i, name=activities_table[bird][i])
+      else:
+        part = interval.get_interval(start_jd=jd_sunset, end_jd=jd_next_sunrise, num_parts=120, part_index=i - 120, name=activities_table[bird][i])
+      if len(expected) > 0 and expected[-1][0] == part.name:
+        expected[-1][2] = part.jd_end
+      else:
+        expected.append([part.name, part.jd_start, part.jd_end])
+    actual = [[x.name, x.jd_start, x.jd_end] for x in paxi_activities.get_activity_intervals(bird=bird)]
+    assert [x[0] for x in actual] == [x[0] for x in expected]
+    numpy.testing.assert_allclose([x[1:] for x in actual], [x[1:] for x in expected], rtol=0, atol=1e-9)
+  assert paxi_activities.get_activity_at(bird="cock", jd=jd_sunrise) == 1
+  assert paxi_activities.get_activity_at(bird="cock", jd=jd_next_sunrise + 0.1) is None
+  assert paxi_activities.cock[1].name == 2
+
 def test_get_lagna_data():
   city = City.get_city_from_db('Chennai') 
   from jyotisha.panchaanga.temporal import zodiac
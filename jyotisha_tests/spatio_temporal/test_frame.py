@@ -0,0 +1,35 @@
+import copy
+import pickle
+
+from jyotisha.panchaanga.spatio_temporal import periodical
+from jyotisha.panchaanga.temporal import ComputationSystem
+from jyotisha.panchaanga.temporal.time import Date
+from jyotisha.panchaanga.temporal.zodiac.angas import AngaType
+from jyotisha_tests.spatio_temporal import chennai
+
+
+def test_panchaanga_frame():
+  computation_system = copy.deepcopy(ComputationSystem.MULTI_NEW_MOON_SIDEREAL_MONTH_ADHIKA__CHITRA_180)
+  computation_system.festival_options.repos = []
+  panchaanga = periodical.Panchaanga(city=chennai, start_date=Date(2019, 1, 1), end_date=Date(2019, 1, 31), computation_system=computation_system)
+  panchaanga.add_festival(fest_id="test-festival", date=Date(2019, 1, 15))
+  frame = panchaanga.to_frame(skip_padding_days=True)
+  assert len(frame) == 31
+  assert frame[0].date == Date(2019, 1, 1) and frame[-1].date == Date(2019, 1, 31)
+  for day_view in frame:
+    daily_panchaanga = panchaanga.daily_panchaanga_for_date(day_view.date)
+    assert day_view.jd_sunrise == daily_panchaanga.jd_sunrise
+    assert day_view.jd_next_sunrise == daily_panchaanga.jd_next_sunrise
+    assert day_view.solar_sidereal_date_sunset == daily_panchaanga.solar_sidereal_date_sunset
+    assert day_view.lunar_month_sunrise == daily_panchaanga.lunar_month_sunrise
+    assert day_view.get_anga_spans(anga_type=AngaType.TITHI) == daily_panchaanga.sunrise_day_angas.tithis_with_ends
+    assert day_view.get_anga_at_sunrise(anga_type=AngaType.NAKSHATRA) == daily_panchaanga.sunrise_day_angas.nakshatra_at_sunrise
+    assert day_view.festival_ids == sorted(daily_panchaanga.festival_id_to_instance.keys())
+  assert frame.day_view_for_date(Date(2019, 1, 15)).festival_ids == ["test-festival"]
+  assert frame.day_view_for_date(Date(2019, 3, 15)) is None
+  # Not computed
+  assert frame[3].jd_moonrise is None
+
+  frame_copy = pickle.loads(pickle.dumps(frame))
+  assert frame_copy[5].get_anga_spans(anga_type=AngaType.YOGA) == frame[5].get_anga_spans(anga_type=AngaType.YOGA)
+  assert len(pickle.dumps(frame)) * 5 < sum(len(panchaanga.daily_panchaanga_for_date(day_view.date).to_string()) for day_view in frame)
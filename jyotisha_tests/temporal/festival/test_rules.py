@@ -1,3 +1,5 @@
+import os
+import shutil
 from pprint import pprint
 
 from sanskrit_data import collection_helper
@@ -14,3 +16,35 @@ def test_rules_dicts():
 def test_get_url():
   rule_set = rules.RulesCollection.get_cached(repos_tuple=rules.rule_repos)
   assert rule_set.tree[rules.RulesRepo.GREGORIAN_MONTH_DIR][rules.RulesRepo.DAY_DIR]["02"]["09"]["proklas-janma"][collection_helper.LEAVES_KEY][0].get_url() == "https://github.com/jyotisham/adyatithi/blob/master/mahApuruSha/general-indic-tropical/julian/day/02/08/proklas-janma.toml"
+
+
+def test_rules_snapshot(tmp_path, monkeypatch):
+  repo_path = str(tmp_path.joinpath("test_repo"))
+  shutil.copytree(os.path.join(os.path.dirname(__file__), 'data/test_repo'), repo_path)
+  snapshot_dir = str(tmp_path.joinpath("snapshots"))
+  repos = (rules.RulesRepo(name="test_repo", path=repo_path),)
+  # Snapshots are opt-in.
+  assert rules.RulesCollection.SNAPSHOT_DIR is None
+  rule_set = rules.RulesCollection(repos=repos, julian_handling=None, snapshot_dir=snapshot_dir)
+  assert len(os.listdir(snapshot_dir)) == 1
+
+  # Loaded from the snapshot - without reading the toml files.
+  with monkeypatch.context() as patch:
+    patch.setattr(rules, "get_festival_rules_map", None)
+    reloaded_rule_set = rules.RulesCollection(repos=repos, julian_handling=None, snapshot_dir=snapshot_dir)
+  assert reloaded_rule_set.name_to_rule.keys() == rule_set.name_to_rule.keys()
+  for (rule_id, rule) in rule_set.name_to_rule.items():
+    assert reloaded_rule_set.name_to_rule[rule_id].to_json_map() == rule.to_json_map()
+  assert reloaded_rule_set.tree.keys() == rule_set.tree.keys()
+
+  # Snapshots are not shared across versions of the rules module source.
+  with monkeypatch.context() as patch:
+    patch.setattr(rules, "__file__", rule_set.name_to_rule["taittirIya-utsargaH_paurNamAsyAm"].path_actual)
+    rules.RulesCollection(repos=repos, julian_handling=None, snapshot_dir=snapshot_dir)
+  assert len(os.listdir(snapshot_dir)) == 2
+
+  # A changed toml tree makes the snapshot stale.
+  os.remove(rule_set.name_to_rule["throchi-durge_goraxa-sainika-nighAtaH"].path_actual)
+  updated_rule_set = rules.RulesCollection(repos=repos, julian_handling=None, snapshot_dir=snapshot_dir)
+  assert "throchi-durge_goraxa-sainika-nighAtaH" not in updated_rule_set.name_to_rule
+  assert "taittirIya-utsargaH_paurNamAsyAm" in updated_rule_set.name_to_rule
@@ -14,6 +14,14 @@ logging.basicConfig(
 def test_graha_get_longitude():
   numpy.testing.assert_approx_equal(Graha.singleton(Graha.SUN).get_longitude(jd=2458434.083333251), 229.12286985575702)
 
+def test_graha_get_longitudes():
+  jds = numpy.array([2458434.083333251, 2458435.083333251, 2458436.5])
+  from jyotisha.panchaanga.temporal.zodiac import Ayanamsha
+  for ayanaamsha_id in [None, Ayanamsha.CHITRA_AT_180]:
+    longitudes = Graha.singleton(Graha.MOON).get_longitudes(jds=jds, ayanaamsha_id=ayanaamsha_id)
+    numpy.testing.assert_array_almost_equal(longitudes, [Graha.singleton(Graha.MOON).get_longitude(jd=jd, ayanaamsha_id=ayanaamsha_id) for jd in jds])
+
+
 def test_longitude_difference():
   numpy.testing.assert_approx_equal(body.longitude_difference(jd=2458484.545, body1=Graha.singleton(Graha.SUN), body2=Graha.singleton(Graha.MARS)), -79.66, significant=2)
   numpy.testing.assert_approx_equal(body.longitude_difference(jd=2458485.5453, body1=Graha.singleton(Graha.SUN), body2=Graha.singleton(Graha.MARS)), -79.31, significant=2)
@@ -0,0 +1,32 @@
+import numpy
+
+from jyotisha.panchaanga.temporal import ephemeris
+from jyotisha.panchaanga.temporal.body import Graha
+
+
+def test_chebyshev_longitudes():
+  jds = numpy.linspace(2458434.083333251, 2458434.083333251 + 40, 200)
+  for body_name in [Graha.SUN, Graha.MOON]:
+    cheb_ephemeris = ephemeris.ChebyshevEphemeris.get_cached(body_name)
+    expected = Graha.singleton(body_name).get_longitudes(jds, use_chebyshev_ephemeris=False)
+    errors = (cheb_ephemeris.get_longitudes(jds) - expected + 180) % 360 - 180
+    assert numpy.max(numpy.abs(errors)) * 3600 < ephemeris.MAX_ERROR_ARCSEC
+    numpy.testing.assert_approx_equal(cheb_ephemeris.get_longitude(jds[7]), expected[7])
+
+
+def test_chebyshev_speed():
+  import swisseph as swe
+  jd = 2458434.083333251
+  numpy.testing.assert_approx_equal(ephemeris.ChebyshevEphemeris.get_cached(Graha.MOON).get_speed(jd), swe.calc_ut(jd, swe.MOON, swe.FLG_SPEED)[0][3], significant=4)
+
+
+def test_get_longitude_follows_global_switch():
+  jd = 2458434.083333251
+  moon = Graha.singleton(Graha.MOON)
+  use_chebyshev_ephemeris = ephemeris.USE_CHEBYSHEV_EPHEMERIS
+  try:
+    for value in [True, False, True]:
+      ephemeris.USE_CHEBYSHEV_EPHEMERIS = value
+      assert moon.get_longitude(jd=jd) == moon.get_longitude(jd=jd, use_chebyshev_ephemeris=value)
+  finally:
+    ephemeris.USE_CHEBYSHEV_EPHEMERIS = use_chebyshev_ephemeris
@@ -0,0 +1,41 @@
+import numpy
+
+from jyotisha.panchaanga.temporal import julian_day
+
+
+# Avoids days with leap seconds, which astropy stretches to 86401 seconds.
+TEST_JDS = [2458434.083333251, 2451544.5, 2299160.4999999, 2299160.5, 1721425.5, 1000000.25, 2816787.123456]
+
+
+def test_jd_to_gregorian():
+  assert julian_day.jd_to_gregorian(2451545.0) == (2000, 1, 1, 12, 0, 0)
+  # Proleptic Gregorian - no switch to the Julian calendar.
+  assert julian_day.jd_to_gregorian(2299159.5)[:3] == (1582, 10, 14)
+  for jd in TEST_JDS:
+    expected = julian_day.astropy_jd_to_gregorian(jd)
+    actual = julian_day.jd_to_gregorian(jd)
+    assert actual[:5] == expected[:5]
+    numpy.testing.assert_allclose(actual[5], expected[5], atol=1e-6)
+
+
+def test_gregorian_to_jd():
+  for jd in TEST_JDS:
+    date_tuple = julian_day.jd_to_gregorian(jd)
+    numpy.testing.assert_allclose(julian_day.gregorian_to_jd(*date_tuple), julian_day.astropy_gregorian_to_jd(*date_tuple), atol=1e-9, rtol=0)
+    numpy.testing.assert_allclose(julian_day.gregorian_to_jd(*date_tuple), jd, atol=1e-9, rtol=0)
+
+
+def test_vectorized():
+  date_arrays = julian_day.jds_to_gregorian(TEST_JDS)
+  for (index, jd) in enumerate(TEST_JDS):
+    assert tuple(int(x[index]) for x in date_arrays[:5]) == julian_day.jd_to_gregorian(jd)[:5]
+  numpy.testing.assert_allclose(julian_day.gregorian_to_jds(*date_arrays), TEST_JDS, atol=1e-9, rtol=0)
+  assert list(julian_day.jds_to_weekdays(TEST_JDS)) == [julian_day.jd_to_weekday(jd) for jd in TEST_JDS]
+
+
+def test_jd_to_datetime():
+  # 2018-11-11 was a sunday
+  assert julian_day.jd_to_weekday(2458434.083333251) == 0
+  dt = julian_day.jd_to_datetime(2458434.083333251)
+  assert (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond) == (2018, 11, 11, 13, 59, 59, 992892)
+  numpy.testing.assert_allclose(julian_day.datetime_to_jd(dt), 2458434.083333251, atol=1e-9, rtol=0)
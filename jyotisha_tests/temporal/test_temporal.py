@@ -47,3 +47,26 @@ def test_get_timezone_offset_hours_from_jd():
 def test_get_weekday():
   # 2018, 11, 11 was sunday
   assert time.get_weekday(2458434.083333251) == 0
+
+
+def test_julian_days_to_local_times():
+  tz = Timezone("America/Los_Angeles")
+  # Straddles the DST transition at 2018-11-04 09:00 UTC.
+  jds = [2458418.319444, 2458426.8333333335, 2458426.875, 2458427.5, 2458434.083333251]
+  local_times = tz.julian_days_to_local_times(jds)
+  assert [local_time.as_tuple() for local_time in local_times] == [tz.julian_day_to_local_time(jd).as_tuple() for jd in jds]
+  assert local_times[1].as_tuple()[:5] == (2018, 11, 4, 1, 0)
+  assert local_times[2].as_tuple()[:5] == (2018, 11, 4, 1, 0)
+  assert tz.julian_day_to_local_time_str(2458426.875) == "2018-11-04 01:00:00-08:00"
+
+
+def test_date_ordinal_arithmetic():
+  date = Date(2019, 2, 28, 10, 0, 30.5)
+  assert (date + 1).as_tuple() == (2019, 3, 1, 10, None, 30.5)
+  assert (date - 59).as_tuple() == (2018, 12, 31, 10, None, 30.5)
+  assert Date(2020, 3, 1).get_day_ordinal() - Date(2020, 2, 28).get_day_ordinal() == 2
+  assert Date(2020, 3, 1) - Date(2020, 2, 28) == 2
+  assert Date(2018, 11, 11).get_weekday() == 0
+  assert Date(2018, 11, 11) == Date(2018, 11, 11, 0, 0, 0)
+  assert hash(Date(2018, 11, 11)) == hash(Date(2018, 11, 11, 0, 0, 0))
+  assert Date(2018, 11, 11, 23, 59, 59.5) < Date(2018, 11, 12)
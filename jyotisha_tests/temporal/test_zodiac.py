@@ -1,7 +1,7 @@
 import numpy
 from jyotisha.panchaanga.temporal import zodiac, time
 from jyotisha.panchaanga.temporal.time import Date
-from jyotisha.panchaanga.temporal.zodiac import NakshatraDivision, Ayanamsha, AngaSpanFinder
+from jyotisha.panchaanga.temporal.zodiac import NakshatraDivision, Ayanamsha, AngaSpanFinder, AngaTimeline
 from jyotisha.panchaanga.temporal.zodiac.angas import AngaType
 
 
@@ -10,6 +10,21 @@ def test_get_ayanaamsha():
   numpy.testing.assert_approx_equal(ayanaamsha.get_offset(2458434.083333251), 24.094859396693067)
 
 
+def test_ayanaamsha_offset_table(tmp_path):
+  table = zodiac.AyanaamshaOffsetTable(ayanaamsha_id=zodiac.Ayanamsha.CHITRA_AT_180, cache_dir=str(tmp_path))
+  jds = numpy.array([2458434.083333251, 2458434.5, 2415020.2, 2488069.9])
+  exact_offsets = zodiac.Ayanamsha.singleton(zodiac.Ayanamsha.CHITRA_AT_180).get_exact_offsets(jds=jds)
+  assert numpy.max(numpy.abs(table.get_offsets(jds) - exact_offsets)) * 3600 < zodiac.AyanaamshaOffsetTable.MAX_ERROR_ARCSEC
+  numpy.testing.assert_approx_equal(table.get_offset(jds[0]), exact_offsets[0])
+  # Only the blocks asked for are computed.
+  assert len(table.block_to_grid) == 3
+  # The grids should now be read back from the cache directory.
+  reloaded_table = zodiac.AyanaamshaOffsetTable(ayanaamsha_id=zodiac.Ayanamsha.CHITRA_AT_180, cache_dir=str(tmp_path))
+  numpy.testing.assert_array_equal(reloaded_table.get_offsets(jds), table.get_offsets(jds))
+  # Without a cache_dir, nothing is persisted.
+  assert zodiac.AyanaamshaOffsetTable.get_cached(ayanaamsha_id=zodiac.Ayanamsha.CHITRA_AT_180).cache_dir is None
+
+
 def disabled_test_swe_ayanaamsha_api():
   import swisseph as swe
   swe.set_sid_mode(swe.SIDM_LAHIRI)
@@ -68,6 +83,30 @@ def test_get_anga_span_tithi():
   numpy.testing.assert_array_almost_equal(span_finder.find(jd1=2444959.54042, jd2=2444963.54076, target_anga_id=27).to_tuple(), (2444960.4924699212, 2444961.599213224))
 
 
+def test_get_anga_span_newton():
+  for anga_type in [AngaType.TITHI, AngaType.NAKSHATRA, AngaType.YOGA, AngaType.SIDEREAL_MONTH]:
+    bracketing_finder = AngaSpanFinder(anga_type=anga_type, ayanaamsha_id=Ayanamsha.CHITRA_AT_180, solver=AngaSpanFinder.BRACKETING)
+    newton_finder = AngaSpanFinder(anga_type=anga_type, ayanaamsha_id=Ayanamsha.CHITRA_AT_180, solver=AngaSpanFinder.NEWTON)
+    jd1 = 2458102.5
+    jd2 = jd1 + anga_type.mean_period_days
+    for target_anga_id in range(1, anga_type.num_angas + 1):
+      expected = bracketing_finder.find(jd1=jd1, jd2=jd2, target_anga_id=target_anga_id).to_tuple()
+      numpy.testing.assert_array_almost_equal(numpy.array(newton_finder.find(jd1=jd1, jd2=jd2, target_anga_id=target_anga_id).to_tuple(), dtype=float), numpy.array(expected, dtype=float), decimal=6)
+
+
+def test_anga_timeline():
+  # Tithi and karana boundaries are derived from tithi-pada boundaries here.
+  anga_types = [AngaType.TITHI, AngaType.TITHI_PADA, AngaType.NAKSHATRA, AngaType.KARANA, AngaType.SIDEREAL_MONTH]
+  timeline = AngaTimeline(jd_start=2458100.0, jd_end=2458140.0, ayanaamsha_id=Ayanamsha.CHITRA_AT_180, anga_types=anga_types)
+  for anga_type in anga_types:
+    span_finder = AngaSpanFinder.get_cached(anga_type=anga_type, ayanaamsha_id=Ayanamsha.CHITRA_AT_180)
+    for jd1 in [2458102.73, 2458120.2, 2458138.9]:
+      expected_spans = span_finder.get_all_angas_in_period(jd1=jd1, jd2=jd1 + 1)
+      spans = timeline.get_all_angas_in_period(anga_type=anga_type, jd1=jd1, jd2=jd1 + 1)
+      assert [span.anga for span in spans] == [span.anga for span in expected_spans]
+      numpy.testing.assert_array_almost_equal(numpy.array([span.to_tuple() for span in spans], dtype=float), numpy.array([span.to_tuple() for span in expected_spans], dtype=float), decimal=6)
+
+
 def test_get_tithis_in_period():
   span_finder = AngaSpanFinder.get_cached(anga_type=AngaType.TITHI, ayanaamsha_id=Ayanamsha.ASHVINI_STARTING_0)
   spans = span_finder.get_spans_in_period(jd_start=time.ist_timezone.local_time_to_julian_day(Date(year=2020, month=1, day=1)), jd_end=time.ist_timezone.local_time_to_julian_day(Date(year=2020, month=6, day=30)), target_anga_id=30)